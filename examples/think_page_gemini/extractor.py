@@ -1,11 +1,24 @@
 # src/extractor.py
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 接続プールを再利用するためのモジュール共通セッション（HTTP keep-alive）
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0 (compatible; site2/1.0)"})
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
 
 
 def extract_main_block(url: str) -> str:
     try:
-        resp = requests.get(url, timeout=10)
+        resp = _SESSION.get(url, timeout=10)
         resp.raise_for_status()
         soup = BeautifulSoup(resp.text, "html.parser")
         return soup.prettify()
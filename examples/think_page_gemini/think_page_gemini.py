@@ -1,11 +1,56 @@
 import argparse
 import json
 import os
+import re
 from dotenv import load_dotenv
 from extractor import extract_main_block
 from think_page import preprocess_html  # 再利用
 import google.generativeai as genai
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_JSON_PATH_RE = re.compile(r'\{"path":\s*"([^"]+)"[^}]*\}')
+_EXPLANATION_RE = re.compile(r'"explanation":\s*"([^"]+)"')
+
+# ストリーミング途中のテキストから、閉じ引用符まで届いた文字列値のみを取り出す
+_STREAMED_PATH_RE = re.compile(r'"path"\s*:\s*("(?:[^"\\]|\\.)*")')
+_STREAMED_EXPLANATION_RE = re.compile(r'"explanation"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+
+def _dumps(obj) -> str:
+    """JSONを整形して文字列に変換（orjsonがあれば使用する）"""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def _loads(data: str | bytes):
+    """JSONを読み込む（orjsonがあれば使用する）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def extract_streamed_fields(text: str, explain: bool) -> dict | None:
+    """ストリーミング途中のレスポンスから必要なフィールドが揃っていれば取り出す"""
+    path_match = _STREAMED_PATH_RE.search(text)
+    if not path_match:
+        return None
+    result = {"path": _loads(path_match.group(1))}
+
+    if explain:
+        exp_match = _STREAMED_EXPLANATION_RE.search(text)
+        if not exp_match:
+            return None
+        result["explanation"] = _loads(exp_match.group(1))
+
+    return result
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -61,8 +106,18 @@ HTML:
 
     genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
     model = genai.GenerativeModel("models/gemini-2.5-flash")
-    response = model.generate_content(prompt)
-    text = response.text.strip()
+
+    # ストリーミングで受信し、必要なフィールドが揃った時点で打ち切る
+    text = ""
+    for chunk in model.generate_content(prompt, stream=True):
+        text += chunk.text
+        streamed = extract_streamed_fields(text, args.explain)
+        if streamed:
+            print(_dumps(streamed))
+            return
+
+    # 揃わなかった場合は全文を受信した上で従来の方法で解析する
+    text = text.strip()
 
     if text.startswith("```json"):
         text = text[7:]
@@ -71,27 +126,19 @@ HTML:
     text = text.strip()
 
     try:
-        result = json.loads(text)
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        result = _loads(text)
+        print(_dumps(result))
     except json.JSONDecodeError:
-        import re
-
-        json_match = re.search(r'\{"path":\s*"([^"]+)"[^}]*\}', text)
+        json_match = _JSON_PATH_RE.search(text)
         if json_match:
             extracted = {"path": json_match.group(1)}
             if args.explain and "explanation" in text:
-                exp_match = re.search(r'"explanation":\s*"([^"]+)"', text)
+                exp_match = _EXPLANATION_RE.search(text)
                 if exp_match:
                     extracted["explanation"] = exp_match.group(1)
-            print(json.dumps(extracted, ensure_ascii=False, indent=2))
+            print(_dumps(extracted))
         else:
-            print(
-                json.dumps(
-                    {"error": "Failed to parse response", "raw_output": text},
-                    ensure_ascii=False,
-                    indent=2,
-                )
-            )
+            print(_dumps({"error": "Failed to parse response", "raw_output": text}))
 
 
 if __name__ == "__main__":
@@ -4,19 +4,13 @@ import subprocess
 from pathlib import Path
 from urllib.parse import urlparse
 
+from site2.core.utils.url_utils import url_to_slug
+
 # from loguru import logger
 
 CACHE_ROOT = Path(".cache")
 
 
-def slugify(url: str) -> str:
-    parsed = urlparse(url)
-    slug = f"{parsed.netloc}{parsed.path}".strip("/")
-    for ch in "/:?&=#%":
-        slug = slug.replace(ch, "_")
-    return slug or "root"
-
-
 def run_wget(url: str, slug: str, depth: int) -> bool:
     target = CACHE_ROOT / slug
     parsed = urlparse(url)
@@ -43,7 +37,7 @@ def run_wget(url: str, slug: str, depth: int) -> bool:
 
 def main() -> None:
     url = "https://pytest-bdd.readthedocs.io/en/stable/"
-    slug = slugify(url)
+    slug = url_to_slug(url)
 
     CACHE_ROOT.mkdir(parents=True, exist_ok=True)
 
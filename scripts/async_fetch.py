@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""aiohttpを使用した並行Webサイト取得スクリプト
+
+wgetのサブプロセスの代わりに、1つのセッションでTCP/TLS接続を再利用しながら
+複数ページを並行して取得する。
+"""
+
+import asyncio
+import os
+import random
+from pathlib import Path
+from urllib.parse import quote, urldefrag, urljoin, urlparse
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+# 同時接続数の上限
+MAX_CONNECTIONS = 64
+MAX_CONNECTIONS_PER_HOST = 8
+
+# 同時リクエスト数（サーバーへの負荷軽減）
+MAX_CONCURRENT_REQUESTS = 8
+
+# リトライ設定（429/5xxのときに指数バックオフ）
+MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 1.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# リクエスト間のランダムな待機時間（秒）
+DELAY_RANGE = (0.1, 0.5)
+
+REQUEST_TIMEOUT_SECONDS = 30
+
+
+def _local_path(out_dir: Path, url: str, is_html: bool) -> Path:
+    """URLからwgetと同じレイアウトの保存先パスを作成"""
+    parsed = urlparse(url)
+    path = parsed.path or "/"
+    if path.endswith("/"):
+        path += "index.html"
+    # クエリ違いのページが上書きされないよう、wgetと同様にファイル名に含める
+    if parsed.query:
+        path += "?" + parsed.query.replace("/", "%2F")
+    local_path = out_dir / parsed.netloc / path.lstrip("/")
+
+    # wgetの --adjust-extension 相当
+    if is_html and local_path.suffix.lower() not in (".html", ".htm"):
+        local_path = local_path.with_name(local_path.name + ".html")
+    return local_path
+
+
+def _extract_links(html: str, base_url: str) -> tuple[list[str], list[str]]:
+    """HTMLからページリンクとページ必須リソース（CSS・画像・JS）を抽出"""
+    soup = BeautifulSoup(html, "html.parser")
+
+    pages = [urljoin(base_url, a["href"]) for a in soup.find_all("a", href=True)]
+
+    requisites = [
+        urljoin(base_url, link["href"])
+        for link in soup.find_all("link", href=True)
+        if "stylesheet" in (link.get("rel") or [])
+    ]
+    requisites.extend(
+        urljoin(base_url, tag["src"])
+        for tag in soup.find_all(["img", "script"], src=True)
+    )
+
+    return (
+        [urldefrag(url).url for url in pages],
+        [urldefrag(url).url for url in requisites],
+    )
+
+
+def _convert_links(html_pages: dict[Path, str], saved: dict[str, Path]) -> None:
+    """
+    保存したHTML内のリンクをローカルファイルへの相対パスに書き換える
+
+    wgetの --convert-links 相当。取得済みのURLはローカルファイルへの相対パスに、
+    取得していないURLは絶対URLに書き換える。
+
+    Args:
+        html_pages: 保存したHTMLファイルのパスと、その取得元（リダイレクト後）のURL
+        saved: 取得したURLと保存先パスの対応
+    """
+    for local_path, page_url in html_pages.items():
+        soup = BeautifulSoup(
+            local_path.read_bytes().decode("utf-8", errors="replace"), "html.parser"
+        )
+        for tag in soup.find_all(["a", "link", "img", "script"]):
+            attr = "src" if tag.name in ("img", "script") else "href"
+            value = tag.get(attr)
+            if not value or value.startswith(("#", "mailto:", "javascript:")):
+                continue
+
+            target, fragment = urldefrag(urljoin(page_url, value))
+            if target in saved:
+                converted = os.path.relpath(saved[target], local_path.parent)
+                # ファイル名に含まれる「?」がクエリとして解釈されないようにエスケープする
+                converted = quote(Path(converted).as_posix())
+            else:
+                converted = target
+            tag[attr] = f"{converted}#{fragment}" if fragment else converted
+
+        local_path.write_text(str(soup), encoding="utf-8")
+
+
+async def _fetch(
+    session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url: str
+) -> tuple[bytes, str, str] | None:
+    """
+    1つのURLを取得（429/5xxと通信エラーは指数バックオフでリトライ）
+
+    Returns:
+        tuple[bytes, str, str] | None: 本文、Content-Type、リダイレクト後の最終URL
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        status = None
+        async with semaphore:
+            await asyncio.sleep(random.uniform(*DELAY_RANGE))
+            try:
+                async with session.get(url) as response:
+                    status = response.status
+                    if status < 400:
+                        return (
+                            await response.read(),
+                            response.content_type,
+                            urldefrag(str(response.url)).url,
+                        )
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+
+        # 404などリトライしても結果が変わらないエラーはここで諦める
+        if status is not None and status not in RETRY_STATUSES:
+            return None
+        if attempt < MAX_RETRIES:
+            await asyncio.sleep(BACKOFF_BASE_SECONDS * 2**attempt)
+
+    return None
+
+
+async def fetch_site(url: str, out_dir: Path, max_depth: int) -> int:
+    """
+    Webサイトを幅優先で並行取得してout_dirに保存する
+
+    wgetの -r -l <max_depth> -np -D <domain> --page-requisites 相当の範囲を取得し、
+    取得後に --convert-links 相当のリンク書き換えを行う。
+
+    Args:
+        url: 起点となるURL
+        out_dir: 保存先ディレクトリ
+        max_depth: リンクを辿る深さ
+
+    Returns:
+        int: 保存したファイル数
+    """
+    root = urlparse(url)
+    # -np 相当: 起点のディレクトリより上には辿らない
+    root_prefix = (
+        root.path if root.path.endswith("/") else root.path.rsplit("/", 1)[0] + "/"
+    )
+
+    def in_scope(candidate: str) -> bool:
+        parsed = urlparse(candidate)
+        return (
+            parsed.scheme in ("http", "https")
+            and parsed.netloc == root.netloc
+            and parsed.path.startswith(root_prefix)
+        )
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONNECTIONS, limit_per_host=MAX_CONNECTIONS_PER_HOST
+    )
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
+
+    seen = {urldefrag(url).url}
+    frontier = [urldefrag(url).url]
+    # 取得したURL（リダイレクト前後の両方）と保存先パスの対応
+    saved: dict[str, Path] = {}
+    # 保存したHTMLファイルと、リンク解決の基準になる最終URLの対応
+    html_pages: dict[Path, str] = {}
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+
+        async def save(target: str, follow_links: bool) -> tuple[list[str], list[str]]:
+            fetched = await _fetch(session, semaphore, target)
+            if fetched is None:
+                return [], []
+
+            body, content_type, final_url = fetched
+            # 別のURLからのリダイレクトで取得済みのページは保存し直さない
+            if final_url in saved:
+                saved[target] = saved[final_url]
+                return [], []
+            seen.add(final_url)
+
+            is_html = content_type == "text/html"
+            # 相対リンクはリダイレクト後のURLを基準に解決されるため、保存先も最終URLから作る
+            local_path = _local_path(out_dir, final_url, is_html)
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            local_path.write_bytes(body)
+            saved[target] = saved[final_url] = local_path
+            if is_html:
+                html_pages[local_path] = final_url
+
+            if not (is_html and follow_links):
+                return [], []
+            return _extract_links(body.decode("utf-8", errors="replace"), final_url)
+
+        for depth in range(max_depth + 1):
+            if not frontier:
+                break
+
+            results = await asyncio.gather(*(save(target, True) for target in frontier))
+
+            next_frontier = []
+            requisites = []
+            for pages, page_requisites in results:
+                for requisite in page_requisites:
+                    if requisite not in seen:
+                        seen.add(requisite)
+                        requisites.append(requisite)
+                if depth < max_depth:
+                    for page in pages:
+                        if page not in seen and in_scope(page):
+                            seen.add(page)
+                            next_frontier.append(page)
+
+            # ページ必須リソースは深さに関係なく取得し、リンクは辿らない
+            await asyncio.gather(
+                *(
+                    save(requisite, False)
+                    for requisite in requisites
+                    if urlparse(requisite).netloc == root.netloc
+                )
+            )
+
+            frontier = next_frontier
+
+    _convert_links(html_pages, saved)
+    return len(set(saved.values()))
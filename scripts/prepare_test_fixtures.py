@@ -1,16 +1,26 @@
 #!/usr/bin/env python3
 """テスト用のWebサイトデータを準備するスクリプト"""
 
+import asyncio
 import json
-import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
-from urllib.parse import urlparse
+
+from async_fetch import fetch_site
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 FIXTURE_DIR = PROJECT_ROOT / "tests" / "fixtures" / "websites"
 
+# ダウンロード設定
+DOWNLOAD_DEPTH = 2
+DOWNLOAD_TIMEOUT_SECONDS = 60
+
 # ダウンロード対象のURL一覧
 DOWNLOAD_URLS = {
     "pytest-bdd-docs": "https://pytest-bdd.readthedocs.io/en/stable/",
@@ -18,13 +28,20 @@ DOWNLOAD_URLS = {
 }
 
 
-def slugify(url: str) -> str:
-    """URLをファイル名に適したスラッグに変換"""
-    parsed = urlparse(url)
-    slug = f"{parsed.netloc}{parsed.path}".strip("/")
-    for ch in "/:?&=#%":
-        slug = slug.replace(ch, "_")
-    return slug or "root"
+def _dumps(obj) -> str:
+    """JSONを整形して文字列に変換（orjsonがあれば使用する）"""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def _loads(data: str | bytes):
+    """JSONを読み込む（orjsonがあれば使用する）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def download_docs(site_name: str, url: str) -> bool:
@@ -38,35 +55,16 @@ def download_docs(site_name: str, url: str) -> bool:
 
     print(f"📥 Downloading {site_name} documentation...")
 
-    parsed = urlparse(url)
-    domain = parsed.netloc
-
-    # wgetコマンドを実行
-    cmd = [
-        "wget",
-        "-r",
-        "-l",
-        "2",
-        "-np",
-        "-k",
-        "-E",
-        "-H",
-        f"-D{domain}",
-        "--convert-links",
-        "--adjust-extension",
-        "--page-requisites",
-        "--no-parent",
-        "--wait=0.5",
-        "--random-wait",
-        "-P",
-        str(dir_name),
-        url,
-    ]
-
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-
-        # wgetは404エラーなどがあっても部分的に成功することがある
+        # aiohttpで並行ダウンロード（接続を再利用する）
+        asyncio.run(
+            asyncio.wait_for(
+                fetch_site(url, dir_name, max_depth=DOWNLOAD_DEPTH),
+                timeout=DOWNLOAD_TIMEOUT_SECONDS,
+            )
+        )
+
+        # 404エラーなどがあっても部分的に成功することがある
         # ディレクトリが作成され、何らかのファイルがダウンロードされていれば成功とみなす
         if dir_name.exists() and any(dir_name.rglob("*.html")):
             print(f"✅ {site_name} docs downloaded successfully")
@@ -78,15 +76,16 @@ def download_docs(site_name: str, url: str) -> bool:
                 "description": f"{site_name} documentation for testing",
             }
 
-            with open(dir_name / "metadata.json", "w") as f:
-                json.dump(metadata, f, indent=2)
+            (dir_name / "metadata.json").write_text(
+                _dumps(metadata) + "\n", encoding="utf-8"
+            )
 
             return True
         else:
-            print(f"❌ Failed to download {site_name}: {result.stderr}")
+            print(f"❌ Failed to download {site_name}: no HTML files fetched")
             return False
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         print(f"❌ Download timeout for {site_name}")
         return False
     except Exception as e:
@@ -226,8 +225,7 @@ def show_fixtures():
 
             if metadata_file.exists():
                 try:
-                    with open(metadata_file) as f:
-                        metadata = json.load(f)
+                    metadata = _loads(metadata_file.read_bytes())
                     url = metadata.get("url", "unknown")
                     downloaded_at = metadata.get("downloaded_at", "unknown")
                     print(f"   📄 {dir_name} ({url}) - {downloaded_at}")
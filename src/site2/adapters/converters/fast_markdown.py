@@ -0,0 +1,312 @@
+"""
+デフォルト設定専用の軽量Markdownレンダラー
+
+見出し・段落・リスト・強調・リンクなどで構成される一般的なドキュメントを、
+Markdownifyの汎用的な要素ディスパッチ（要素ごとのオプション参照や親要素の探索）を
+経由せずにMarkdownへ変換する。出力はDEFAULT_MARKDOWNIFY_CONFIGを指定した
+Markdownifyと同一になるようにしている。
+
+対応していない要素（テーブル、コードブロック、画像など）や、Markdownifyの
+バージョンによって出力が異なる内容（バッククォートを含むインラインコード）が
+含まれる場合はNoneを返すため、呼び出し側でMarkdownifyにフォールバックする。
+"""
+
+import re
+from typing import Callable, Dict, Optional
+
+from bs4 import Comment, Doctype, NavigableString, Tag
+
+# Markdownifyと同じ空白・改行の正規化パターン
+_WHITESPACE_RE = re.compile(r"[\t ]+")
+_ALL_WHITESPACE_RE = re.compile(r"[\t \r\n]+")
+_NEWLINE_WHITESPACE_RE = re.compile(r"[\t \r\n]*[\r\n][\t \r\n]*")
+_LINE_WITH_CONTENT_RE = re.compile(r"^(.*)", flags=re.MULTILINE)
+_EXTRACT_NEWLINES_RE = re.compile(r"^(\n*)((?:.*[^\n])?)(\n*)$", flags=re.DOTALL)
+
+# 内側の空白を除去するブロック要素
+_REMOVE_WHITESPACE_INSIDE = frozenset(
+    {
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "p",
+        "blockquote",
+        "article",
+        "div",
+        "section",
+        "ol",
+        "ul",
+        "li",
+        "dl",
+        "dt",
+        "dd",
+        "table",
+        "thead",
+        "tbody",
+        "tfoot",
+        "tr",
+        "td",
+        "th",
+    }
+)
+_REMOVE_WHITESPACE_OUTSIDE = _REMOVE_WHITESPACE_INSIDE | {"pre"}
+
+# 変換せずに子要素のテキストのみを出力する要素
+_PASSTHROUGH_TAGS = frozenset({"main", "article", "section", "body", "span"})
+
+_HEADING_LEVELS = {f"h{level}": level for level in range(1, 7)}
+
+
+class _Unsupported(Exception):
+    """軽量レンダラーで変換できない要素が含まれている"""
+
+
+class _Context:
+    """子要素に伝播する親要素の情報"""
+
+    __slots__ = ("inline", "noformat", "in_li")
+
+    def __init__(
+        self, inline: bool = False, noformat: bool = False, in_li: bool = False
+    ):
+        self.inline = inline
+        self.noformat = noformat
+        self.in_li = in_li
+
+
+def render(element: Tag) -> Optional[str]:
+    """
+    要素をMarkdownに変換
+
+    Args:
+        element: 変換する要素
+
+    Returns:
+        Optional[str]: Markdown文字列（対応していない要素を含む場合はNone）
+    """
+    if element.find_parent("pre") is not None:
+        return None
+
+    try:
+        return _process_tag(element, _Context())
+    except _Unsupported:
+        return None
+
+
+def _remove_inside(el) -> bool:
+    return el is not None and el.name in _REMOVE_WHITESPACE_INSIDE
+
+
+def _remove_outside(el) -> bool:
+    return el is not None and el.name in _REMOVE_WHITESPACE_OUTSIDE
+
+
+def _is_block_content(el) -> bool:
+    if isinstance(el, Tag):
+        return True
+    if isinstance(el, (Comment, Doctype)):
+        return False
+    if isinstance(el, NavigableString):
+        return el.strip() != ""
+    return False
+
+
+def _can_ignore(el, remove_inside: bool) -> bool:
+    if isinstance(el, Tag):
+        return False
+    if isinstance(el, (Comment, Doctype)):
+        return True
+    if str(el).strip() != "":
+        return False
+    if remove_inside and (not el.previous_sibling or not el.next_sibling):
+        return True
+    return _remove_outside(el.previous_sibling) or _remove_outside(el.next_sibling)
+
+
+def _process_tag(node: Tag, context: _Context) -> str:
+    name = node.name
+    if name in _HANDLERS:
+        handler = _HANDLERS[name]
+    elif name in _PASSTHROUGH_TAGS:
+        handler = None
+    else:
+        raise _Unsupported(name)
+
+    remove_inside = name in _REMOVE_WHITESPACE_INSIDE
+    child_context = _Context(
+        inline=context.inline or name in _HEADING_LEVELS,
+        noformat=context.noformat or name == "code",
+        in_li=context.in_li or name == "li",
+    )
+
+    # 子要素を変換し、境界の改行を最大2つにまとめる
+    parts = [""]
+    for child in node.children:
+        if _can_ignore(child, remove_inside):
+            continue
+        if isinstance(child, Tag):
+            text = _process_tag(child, child_context)
+        else:
+            text = _process_text(child, child_context)
+        if not text:
+            continue
+
+        leading_nl, content, trailing_nl = _EXTRACT_NEWLINES_RE.match(text).groups()
+        if parts[-1] and leading_nl:
+            prev_trailing_nl = parts.pop()
+            leading_nl = "\n" * min(2, max(len(prev_trailing_nl), len(leading_nl)))
+        parts.extend((leading_nl, content, trailing_nl))
+
+    text = "".join(parts)
+    if handler is None:
+        return text
+    return handler(node, text, context)
+
+
+def _process_text(el: NavigableString, context: _Context) -> str:
+    text = str(el)
+    text = _NEWLINE_WHITESPACE_RE.sub("\n", text)
+    text = _WHITESPACE_RE.sub(" ", text)
+
+    if not context.noformat and text:
+        text = text.replace("*", r"\*").replace("_", r"\_")
+
+    if _remove_outside(el.previous_sibling) or (
+        _remove_inside(el.parent) and not el.previous_sibling
+    ):
+        text = text.lstrip(" \t\r\n")
+    if _remove_outside(el.next_sibling) or (
+        _remove_inside(el.parent) and not el.next_sibling
+    ):
+        text = text.rstrip()
+
+    return text
+
+
+def _chomp(text: str):
+    prefix = " " if text and text[0] == " " else ""
+    suffix = " " if text and text[-1] == " " else ""
+    return prefix, suffix, text.strip()
+
+
+def _inline(mark: str) -> Callable[[Tag, str, _Context], str]:
+    def convert(el: Tag, text: str, context: _Context) -> str:
+        if context.noformat:
+            return text
+        prefix, suffix, text = _chomp(text)
+        if not text:
+            return ""
+        return f"{prefix}{mark}{text}{mark}{suffix}"
+
+    return convert
+
+
+def _convert_heading(el: Tag, text: str, context: _Context) -> str:
+    if context.inline:
+        return text
+    text = _ALL_WHITESPACE_RE.sub(" ", text.strip())
+    return f"\n\n{'#' * _HEADING_LEVELS[el.name]} {text}\n\n"
+
+
+def _convert_p(el: Tag, text: str, context: _Context) -> str:
+    if context.inline:
+        return " " + text.strip(" \t\r\n") + " "
+    text = text.strip(" \t\r\n")
+    return f"\n\n{text}\n\n" if text else ""
+
+
+def _convert_div(el: Tag, text: str, context: _Context) -> str:
+    if context.inline:
+        return " " + text.strip() + " "
+    text = text.strip()
+    return f"\n\n{text}\n\n" if text else ""
+
+
+def _convert_a(el: Tag, text: str, context: _Context) -> str:
+    if context.noformat:
+        return text
+    prefix, suffix, text = _chomp(text)
+    if not text:
+        return ""
+    href = el.get("href")
+    # default_titleが有効なため、titleがなければhrefをtitleとして使用する
+    title = el.get("title") or href
+    title_part = ' "%s"' % title.replace('"', r"\"") if title else ""
+    return f"{prefix}[{text}]({href}{title_part}){suffix}" if href else text
+
+
+def _convert_code(el: Tag, text: str, context: _Context) -> str:
+    if context.noformat:
+        return text
+    prefix, suffix, text = _chomp(text)
+    if not text:
+        return ""
+    # バッククォートの扱い（区切りを広げるか）はMarkdownifyのバージョンで異なる
+    if "`" in text:
+        raise _Unsupported("code")
+    return f"{prefix}`{text}`{suffix}"
+
+
+def _convert_list(el: Tag, text: str, context: _Context) -> str:
+    if context.in_li:
+        return "\n" + text.rstrip()
+
+    next_sibling = el.next_sibling
+    while next_sibling is not None and not _is_block_content(next_sibling):
+        next_sibling = next_sibling.next_sibling
+    before_paragraph = next_sibling is not None and next_sibling.name not in (
+        "ul",
+        "ol",
+    )
+    return "\n\n" + text + ("\n" if before_paragraph else "")
+
+
+def _convert_li(el: Tag, text: str, context: _Context) -> str:
+    text = text.strip()
+    if not text:
+        return "\n"
+
+    parent = el.parent
+    if parent is not None and parent.name == "ol":
+        start = parent.get("start")
+        start = int(start) if start and str(start).isnumeric() else 1
+        bullet = f"{start + len(el.find_previous_siblings('li'))}. "
+    else:
+        bullet = "- "
+
+    indent = " " * len(bullet)
+    text = _LINE_WITH_CONTENT_RE.sub(
+        lambda match: indent + match.group(1) if match.group(1) else "", text
+    )
+    return f"{bullet}{text[len(bullet) :]}\n"
+
+
+def _convert_br(el: Tag, text: str, context: _Context) -> str:
+    if context.inline:
+        return text + " " if text else " "
+    return "  \n" + text
+
+
+def _convert_hr(el: Tag, text: str, context: _Context) -> str:
+    return "\n\n---\n\n"
+
+
+_HANDLERS: Dict[str, Callable[[Tag, str, _Context], str]] = {
+    **{name: _convert_heading for name in _HEADING_LEVELS},
+    "p": _convert_p,
+    "div": _convert_div,
+    "a": _convert_a,
+    "strong": _inline("**"),
+    "b": _inline("**"),
+    "em": _inline("*"),
+    "i": _inline("*"),
+    "code": _convert_code,
+    "ul": _convert_list,
+    "ol": _convert_list,
+    "li": _convert_li,
+    "br": _convert_br,
+    "hr": _convert_hr,
+}
@@ -0,0 +1,187 @@
+"""
+コンバーター共通のBeautifulSoup生成処理
+"""
+
+import html
+import re
+from functools import lru_cache
+from typing import Optional, Union
+
+import chardet
+import soupsieve
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer, Tag
+
+from ..parsers.encoding_sniffer import sniff_encoding
+
+# SoupStrainerに変換できる単純なセレクタ（tag, #id, .class, tag#id, tag.class）
+_SIMPLE_SELECTOR_RE = re.compile(
+    r"^(?P<tag>[a-zA-Z][\w-]*)?(?:#(?P<id>[\w-]+)|\.(?P<class>[\w-]+))?$"
+)
+
+# 変換前に除去する不要なタグ
+UNWANTED_TAGS = frozenset(
+    {"script", "style", "nav", "header", "footer", "aside", "meta", "link"}
+)
+
+# <title>を探す範囲（先頭8KB）
+_TITLE_SCAN_LIMIT = 8192
+_TITLE_RE = re.compile(
+    r"<title(?:\s[^>]*)?>(.*?)</title\s*>", re.IGNORECASE | re.DOTALL
+)
+
+# 判定できなかった場合に順に試すエンコーディング
+_FALLBACK_ENCODINGS = ("cp932", "shift_jis", "euc-jp", "iso-8859-1")
+
+
+def detect_encoding(raw: bytes) -> Optional[str]:
+    """
+    HTMLのバイト列をデコードできるエンコーディングを判定
+
+    BOM・UTF-8・エンコーディング宣言はパーサーと共通のsniff_encodingで判定し、
+    判定できない場合はchardetの推定結果、日本語のエンコーディングなどを順に試します。
+
+    Args:
+        raw: HTMLのバイト列
+
+    Returns:
+        Optional[str]: エンコーディング名（どのエンコーディングでもデコードできない場合はNone）
+    """
+    sniffed = sniff_encoding(raw)
+    if sniffed:
+        return sniffed
+
+    detected = chardet.detect(raw).get("encoding")
+    if detected and _can_decode(raw, detected):
+        return detected
+
+    for encoding in _FALLBACK_ENCODINGS:
+        if _can_decode(raw, encoding):
+            return encoding
+    return None
+
+
+def _can_decode(raw: bytes, encoding: str) -> bool:
+    try:
+        raw.decode(encoding)
+    except (UnicodeError, LookupError):
+        return False
+    return True
+
+
+def extract_title(markup: Union[str, bytes]) -> Optional[str]:
+    """
+    HTMLの先頭部分から<title>の内容を正規表現で抽出
+
+    パースせずに取得できるため、<title>が先頭付近にある一般的なHTMLでは
+    パース結果からの検索を省略できます。
+
+    Args:
+        markup: HTML文字列またはUTF-8のバイト列
+
+    Returns:
+        Optional[str]: タイトル（先頭部分に空でない<title>がない場合はNone）
+    """
+    head = markup[:_TITLE_SCAN_LIMIT]
+    if isinstance(head, bytes):
+        head = head.decode("utf-8", errors="ignore")
+
+    match = _TITLE_RE.search(head)
+    if not match or not match.group(1):
+        return None
+    return html.unescape(match.group(1)).strip()
+
+
+def create_soup(
+    markup: Union[str, bytes],
+    parse_only: Optional[SoupStrainer] = None,
+    from_encoding: Optional[str] = None,
+) -> BeautifulSoup:
+    """
+    lxmlパーサーでBeautifulSoupオブジェクトを作成
+
+    lxmlがインストールされていない場合はhtml.parserにフォールバックします。
+
+    Args:
+        markup: HTML文字列またはバイト列
+        parse_only: パース対象を絞り込むSoupStrainer
+        from_encoding: バイト列のエンコーディング
+
+    Returns:
+        BeautifulSoup: パース結果
+    """
+    try:
+        return BeautifulSoup(
+            markup, "lxml", parse_only=parse_only, from_encoding=from_encoding
+        )
+    except FeatureNotFound:
+        return BeautifulSoup(
+            markup, "html.parser", parse_only=parse_only, from_encoding=from_encoding
+        )
+
+
+class _MainContentStrainer(SoupStrainer):
+    """メインコンテンツ要素に加えて<title>も構築するSoupStrainer"""
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        if name == "title":
+            return True
+        return super().allow_tag_creation(nsprefix, name, attrs)
+
+
+def build_strainer(selector: str) -> Optional[SoupStrainer]:
+    """
+    CSSセレクタからSoupStrainerを作成
+
+    Args:
+        selector: CSSセレクタ
+
+    Returns:
+        Optional[SoupStrainer]: 単純なセレクタの場合はSoupStrainer、
+            それ以外（子孫セレクタ、属性セレクタなど）はNone
+    """
+    match = _SIMPLE_SELECTOR_RE.match(selector.strip())
+    if not match or not any(match.groups()):
+        return None
+
+    attrs = {}
+    if match.group("id"):
+        attrs["id"] = match.group("id")
+    if match.group("class"):
+        attrs["class"] = match.group("class")
+
+    tag_name = match.group("tag")
+    return _MainContentStrainer(tag_name.lower() if tag_name else None, attrs=attrs)
+
+
+@lru_cache(maxsize=128)
+def compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """
+    CSSセレクタをコンパイル
+
+    複数ファイルで同じセレクタを使用するため、コンパイル結果をキャッシュします。
+
+    Args:
+        selector: CSSセレクタ
+
+    Returns:
+        soupsieve.SoupSieve: コンパイル済みのセレクタ
+    """
+    return soupsieve.compile(selector)
+
+
+def remove_unwanted_elements(element: Tag) -> None:
+    """
+    不要な要素（UNWANTED_TAGS）を除去
+
+    SoupStrainerによる照合を避け、集合の所属判定で1回の走査でまとめて取得します。
+
+    Args:
+        element: 対象の要素（インプレースで変更）
+    """
+    unwanted = [
+        descendant
+        for descendant in element.descendants
+        if isinstance(descendant, Tag) and descendant.name in UNWANTED_TAGS
+    ]
+    for descendant in unwanted:
+        descendant.decompose()
@@ -2,19 +2,23 @@
 Markdownifyを使用したMarkdownコンバーター
 """
 
+import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
-from bs4 import BeautifulSoup
+from typing import Dict, Any, Iterable, List, Optional, Type
+
+from bs4 import BeautifulSoup, Tag
 from loguru import logger
 
 try:
-    from markdownify import markdownify as md
+    from markdownify import MarkdownConverter
 except ImportError:
     logger.warning(
         "markdownify is not installed. Please install it with: pip install markdownify"
     )
-    md = None
+    MarkdownConverter = None
 
 from ...core.ports.build_contracts import MarkdownConverterProtocol
 from ...core.domain.build_domain import (
@@ -24,9 +28,35 @@ from ...core.domain.build_domain import (
     ConvertError,
     ContentNotFoundError,
 )
+from . import fast_markdown
+from .html_soup import (
+    build_strainer,
+    compile_selector,
+    create_soup,
+    detect_encoding,
+    extract_title,
+    remove_unwanted_elements,
+)
+from ..storage.json_result_cache import create_result_cache
 from .markdownify_config import DEFAULT_MARKDOWNIFY_CONFIG, validate_config
 
 
+# 変換結果キャッシュの形式バージョン（変換処理を変更した場合は更新する）
+_CACHE_VERSION = "1"
+
+# 3行以上連続する空行
+_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*\n")
+
+# 目次のアンカーに使用できない文字
+_ANCHOR_TRANS = str.maketrans(" ", "-", "()")
+_ANCHOR_STRIP_RE = re.compile(r"[^\w\-]+")
+
+
+def _anchor_for(title: str) -> str:
+    """見出しからGitHub Markdown形式のアンカーを生成"""
+    return _ANCHOR_STRIP_RE.sub("", title.lower().translate(_ANCHOR_TRANS))
+
+
 class MarkdownifyConverter(MarkdownConverterProtocol):
     """
     Markdownifyを使用したMarkdownコンバーター
@@ -34,16 +64,27 @@ class MarkdownifyConverter(MarkdownConverterProtocol):
     HTMLファイルからメインコンテンツを抽出し、Markdownに変換します。
     """
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        cache_dir: Optional[Path] = None,
+    ):
         """
         Args:
             config: Markdownify設定（Noneの場合はデフォルト設定を使用）
+            cache_dir: 変換結果のキャッシュディレクトリ（Noneの場合はキャッシュしない）
         """
-        if md is None:
+        if MarkdownConverter is None:
             raise ImportError("markdownify is required but not installed")
 
         self.config = config or DEFAULT_MARKDOWNIFY_CONFIG.copy()
         validate_config(self.config)
+        self._markdownify = MarkdownConverter(**self.config)
+        # デフォルト設定の場合のみ軽量レンダラーを使用（出力はMarkdownifyと同一）
+        self._use_fast_markdown = self.config == DEFAULT_MARKDOWNIFY_CONFIG
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._cache = create_result_cache(self._cache_dir, "markdown")
+        self._config_key = json.dumps(self.config, sort_keys=True).encode("utf-8")
         logger.debug(f"MarkdownifyConverter initialized with config: {self.config}")
 
     def convert(self, request: MarkdownConvertRequest) -> ConvertResult:
@@ -63,17 +104,39 @@ class MarkdownifyConverter(MarkdownConverterProtocol):
 
         try:
             # HTMLファイルの読み込み
-            html_content = self._read_html_file(request.file_path)
-
-            # BeautifulSoupでパース
-            soup = BeautifulSoup(html_content, "html.parser")
+            raw = self._read_html_bytes(request.file_path)
+
+            # キャッシュにあればパースと変換を省略
+            cache_key = self._cache_key(raw, request)
+            if cache_key is not None:
+                cached = self._load_cached_result(cache_key, request)
+                if cached is not None:
+                    return cached
+
+            # UTF-8の場合はデコード済みの文字列を作らず、バイト列のままlxmlに渡す
+            encoding = self._detect_encoding(raw, request.file_path)
+            markup = raw if encoding == "utf-8" else raw.decode(encoding)
+
+            # 先頭部分の<title>から取得できればパース結果からの検索を省略
+            title = extract_title(markup)
+
+            # BeautifulSoupでパース（単純なセレクタの場合は該当部分のみ）
+            soup = create_soup(
+                markup,
+                parse_only=build_strainer(request.main_selector),
+                from_encoding="utf-8" if markup is raw else None,
+            )
 
-            # タイトルの抽出
-            title = self._extract_title(soup)
+            # 変換中のメモリ使用量を抑えるため、パース後は元のHTMLを保持しない
+            del raw, markup
 
             # メインコンテンツの抽出
             main_content = self._extract_main_content(soup, request.main_selector)
 
+            # タイトルの抽出（見出しレベルの調整前に行う）
+            if title is None:
+                title = self._extract_title(soup, main_content)
+
             # 不要な要素を除去
             self._remove_unwanted_elements(main_content)
 
@@ -109,6 +172,9 @@ class MarkdownifyConverter(MarkdownConverterProtocol):
                 warnings=warnings,
             )
 
+            if cache_key is not None:
+                self._cache.store(cache_key, result)
+
             logger.info(f"Markdown conversion completed. Text length: {text_length}")
             return result
 
@@ -121,6 +187,47 @@ class MarkdownifyConverter(MarkdownConverterProtocol):
             logger.error(error_msg)
             raise ConvertError(error_msg)
 
+    def convert_many(
+        self,
+        requests: Iterable[MarkdownConvertRequest],
+        max_workers: Optional[int] = None,
+    ) -> List[ConvertResult]:
+        """
+        複数のHTMLファイルをプロセスプールで並列にMarkdownへ変換
+
+        パースと変換はCPUバウンドでGILの影響を受けるため、
+        スレッドではなくプロセスで並列化します。
+
+        Args:
+            requests: Markdown変換要求のリスト
+            max_workers: ワーカープロセス数（Noneの場合はCPUコア数）
+
+        Returns:
+            List[ConvertResult]: 要求と同じ順序の変換結果
+
+        Raises:
+            ConvertError: いずれかのファイルの変換に失敗した場合
+        """
+        requests = list(requests)
+        workers = min(max_workers or os.cpu_count() or 1, len(requests))
+
+        # 1ファイルのみ、または並列数1の場合はプロセス起動のコストを避ける
+        if workers <= 1:
+            return [self.convert(request) for request in requests]
+
+        logger.info(
+            f"Starting parallel Markdown conversion for {len(requests)} files "
+            f"with {workers} workers"
+        )
+
+        chunksize = max(1, min(8, len(requests) // workers))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(type(self), self.config, self._cache_dir),
+        ) as executor:
+            return list(executor.map(_convert_in_worker, requests, chunksize=chunksize))
+
     def _read_html_file(self, file_path: Path) -> str:
         """
         HTMLファイルを読み込み
@@ -131,32 +238,56 @@ class MarkdownifyConverter(MarkdownConverterProtocol):
         Returns:
             str: HTMLコンテンツ
 
+        Raises:
+            FileNotFoundError: ファイルが存在しない場合
+        """
+        raw = self._read_html_bytes(file_path)
+        return raw.decode(self._detect_encoding(raw, file_path))
+
+    def _read_html_bytes(self, file_path: Path) -> bytes:
+        """
+        HTMLファイルをバイト列として読み込み
+
+        Args:
+            file_path: HTMLファイルのパス
+
+        Returns:
+            bytes: HTMLのバイト列
+
         Raises:
             FileNotFoundError: ファイルが存在しない場合
         """
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
-        except UnicodeDecodeError:
-            # UTF-8で読めない場合は他のエンコーディングを試す
-            encodings = ["cp932", "shift_jis", "euc-jp", "iso-8859-1"]
-            for encoding in encodings:
-                try:
-                    with open(file_path, "r", encoding=encoding) as f:
-                        return f.read()
-                except UnicodeDecodeError:
-                    continue
+        return file_path.read_bytes()
+
+    def _detect_encoding(self, raw: bytes, file_path: Path) -> str:
+        """
+        HTMLのバイト列をデコードできるエンコーディングを判定
+
+        Args:
+            raw: HTMLのバイト列
+            file_path: HTMLファイルのパス（エラーメッセージ用）
+
+        Returns:
+            str: エンコーディング名
+
+        Raises:
+            ConvertError: デコードできない場合
+        """
+        encoding = detect_encoding(raw)
+        if encoding is None:
             raise ConvertError(f"Unable to decode file: {file_path}")
+        return encoding
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, soup: BeautifulSoup, main_content: Tag) -> str:
         """
         HTMLからタイトルを抽出
 
         Args:
             soup: BeautifulSoupオブジェクト
+            main_content: メインコンテンツの要素（<h1>の検索範囲）
 
         Returns:
             str: タイトル（見つからない場合は空文字）
@@ -166,16 +297,14 @@ class MarkdownifyConverter(MarkdownConverterProtocol):
         if title_tag and title_tag.string:
             return title_tag.string.strip()
 
-        # <h1>タグから取得
-        h1_tag = soup.find("h1")
+        # メインコンテンツ内の<h1>タグから取得
+        h1_tag = main_content.find("h1")
         if h1_tag:
             return h1_tag.get_text(strip=True)
 
         return ""
 
-    def _extract_main_content(
-        self, soup: BeautifulSoup, selector: str
-    ) -> BeautifulSoup:
+    def _extract_main_content(self, soup: BeautifulSoup, selector: str) -> Tag:
         """
         メインコンテンツを抽出
 
@@ -184,22 +313,18 @@ class MarkdownifyConverter(MarkdownConverterProtocol):
             selector: CSSセレクタ
 
         Returns:
-            BeautifulSoup: メインコンテンツのBeautifulSoupオブジェクト
+            Tag: メインコンテンツの要素
 
         Raises:
             ContentNotFoundError: セレクタでコンテンツが見つからない場合
         """
-        elements = soup.select(selector)
-        if not elements:
+        # 最初にマッチした要素のみ必要なため、すべてのマッチは収集しない
+        element = compile_selector(selector).select_one(soup)
+        if element is None:
             raise ContentNotFoundError(f"Content not found with selector: {selector}")
 
-        # 最初にマッチした要素を使用
-        main_element = elements[0]
-
-        # 新しいBeautifulSoupオブジェクトを作成
-        main_soup = BeautifulSoup(str(main_element), "html.parser")
-
-        return main_soup
+        # 再パースせずにそのまま使用
+        return element
 
     def _remove_unwanted_elements(self, soup: BeautifulSoup) -> None:
         """
@@ -208,21 +333,7 @@ class MarkdownifyConverter(MarkdownConverterProtocol):
         Args:
             soup: BeautifulSoupオブジェクト（インプレースで変更）
         """
-        # 除去対象のタグリスト
-        unwanted_tags = [
-            "script",
-            "style",
-            "nav",
-            "header",
-            "footer",
-            "aside",
-            "meta",
-            "link",
-        ]
-
-        for tag_name in unwanted_tags:
-            for element in soup.find_all(tag_name):
-                element.decompose()
+        remove_unwanted_elements(soup)
 
     def _adjust_heading_levels(self, soup: BeautifulSoup, offset: int) -> BeautifulSoup:
         """
@@ -238,38 +349,35 @@ class MarkdownifyConverter(MarkdownConverterProtocol):
         if offset <= 0:
             return soup
 
-        # 見出しタグを取得（h1からh6まで）
-        heading_tags = ["h1", "h2", "h3", "h4", "h5", "h6"]
-
-        for tag_name in heading_tags:
-            headings = soup.find_all(tag_name)
-            for heading in headings:
-                current_level = int(tag_name[1])  # h1 -> 1, h2 -> 2, ...
-                new_level = min(current_level + offset, 6)  # 最大h6まで
-
-                # 新しいタグ名を作成
-                new_tag_name = f"h{new_level}"
-                heading.name = new_tag_name
+        # h1からh6までを1回の走査でまとめて取得し、その場でリネーム
+        for heading in soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]):
+            # h1 -> 1, h2 -> 2, ... にオフセットを加算（最大h6まで）
+            heading.name = f"h{min(int(heading.name[1]) + offset, 6)}"
 
         return soup
 
-    def _convert_to_markdown(self, soup: BeautifulSoup) -> str:
+    def _convert_to_markdown(self, element: Tag) -> str:
         """
-        BeautifulSoupオブジェクトをMarkdownに変換
+        パース済みの要素をMarkdownに変換
+
+        HTML文字列へのシリアライズと再パースを避けるため、
+        要素をそのままMarkdownifyに渡します。
+        デフォルト設定では軽量レンダラーを優先し、対応していない要素を含む場合のみ
+        Markdownifyで変換します。
 
         Args:
-            soup: BeautifulSoupオブジェクト
+            element: メインコンテンツの要素
 
         Returns:
             str: Markdown文字列
         """
-        html_string = str(soup)
-
-        # Markdownifyで変換
-        markdown = md(html_string, **self.config)
+        markdown = fast_markdown.render(element) if self._use_fast_markdown else None
+        if markdown is None:
+            # Markdownifyで変換
+            markdown = self._markdownify.convert_soup(element)
 
         # 余分な改行を削除
-        markdown = re.sub(r"\n\s*\n\s*\n", "\n\n", markdown)
+        markdown = _BLANK_LINES_RE.sub("\n\n", markdown)
 
         # 前後の空白を削除
         markdown = markdown.strip()
@@ -288,9 +396,7 @@ class MarkdownifyConverter(MarkdownConverterProtocol):
         """
         # 見出しを抽出
         headings = []
-        lines = markdown.split("\n")
-
-        for line in lines:
+        for line in markdown.splitlines():
             if line.startswith("#"):
                 level = len(line) - len(line.lstrip("#"))
                 title = line.lstrip("# ").strip()
@@ -300,20 +406,63 @@ class MarkdownifyConverter(MarkdownConverterProtocol):
         if not headings:
             return markdown
 
-        # 目次を生成
+        # 目次を生成（アンカーリンクはGitHub Markdown形式）
         toc_lines = ["## 目次", ""]
-        for level, title in headings:
-            indent = "  " * (level - 1)
-            # アンカーリンクを生成（GitHub Markdown形式）
-            anchor = title.lower().replace(" ", "-").replace("(", "").replace(")", "")
-            anchor = re.sub(r"[^\w\-_]", "", anchor)
-            toc_lines.append(f"{indent}- [{title}](#{anchor})")
-
+        toc_lines.extend(
+            f"{'  ' * (level - 1)}- [{title}](#{_anchor_for(title)})"
+            for level, title in headings
+        )
         toc_lines.extend(["", "---", ""])
 
         # 目次を元のコンテンツの前に追加
         return "\n".join(toc_lines) + "\n" + markdown
 
+    def _cache_key(self, raw: bytes, request: MarkdownConvertRequest) -> Optional[str]:
+        """
+        変換結果のキャッシュキーを取得
+
+        キーはHTMLの内容・設定・変換オプションのハッシュから生成します。
+
+        Args:
+            raw: HTMLのバイト列
+            request: Markdown変換要求
+
+        Returns:
+            Optional[str]: キャッシュキー（キャッシュ無効の場合はNone）
+        """
+        if self._cache is None:
+            return None
+
+        return self._cache.make_key(
+            _CACHE_VERSION,
+            self._config_key,
+            request.main_selector,
+            str(request.heading_offset),
+            str(request.include_toc),
+            raw,
+        )
+
+    def _load_cached_result(
+        self, cache_key: str, request: MarkdownConvertRequest
+    ) -> Optional[ConvertResult]:
+        """
+        キャッシュから変換結果を読み込み
+
+        Args:
+            cache_key: キャッシュキー
+            request: Markdown変換要求
+
+        Returns:
+            Optional[ConvertResult]: 変換結果（キャッシュがない場合はNone）
+        """
+        cached = self._cache.load(cache_key, ConvertResult)
+        if cached is None:
+            return None
+
+        logger.info(f"Markdown conversion cache hit for: {request.file_path}")
+        # 同じ内容の別ファイルでもキャッシュを共有するため、元ファイルは要求から設定
+        return cached.model_copy(update={"original_file": request.file_path})
+
     def _get_default_config(self) -> Dict[str, Any]:
         """
         デフォルト設定を取得
@@ -322,3 +471,22 @@ class MarkdownifyConverter(MarkdownConverterProtocol):
             Dict[str, Any]: デフォルト設定
         """
         return DEFAULT_MARKDOWNIFY_CONFIG.copy()
+
+
+# ワーカープロセスごとに1つだけ生成するコンバーター
+_worker_converter: Optional[MarkdownifyConverter] = None
+
+
+def _init_worker(
+    converter_class: Type[MarkdownifyConverter],
+    config: Dict[str, Any],
+    cache_dir: Optional[Path],
+) -> None:
+    """ワーカープロセスの初期化（コンバーターを1度だけ生成）"""
+    global _worker_converter
+    _worker_converter = converter_class(config, cache_dir=cache_dir)
+
+
+def _convert_in_worker(request: MarkdownConvertRequest) -> ConvertResult:
+    """ワーカープロセスで1ファイルを変換"""
+    return _worker_converter.convert(request)
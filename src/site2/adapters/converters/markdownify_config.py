@@ -1,5 +1,10 @@
 """
 Markdownifyの設定
+
+デフォルト設定ではテキストの折り返し（wrap）を無効にしている。
+折り返しはテキストノードごとにtextwrapを実行するため大きな記事で処理時間の
+大半を占め、生成したMarkdownはレンダラー側で折り返されるため不要である。
+折り返しが必要な場合は詳細版設定を使用するか、"wrap"を明示的に指定する。
 """
 
 from typing import Dict, Any
@@ -46,9 +51,8 @@ DEFAULT_MARKDOWNIFY_CONFIG: Dict[str, Any] = {
     "default_title": True,
     # エスケープ文字の処理
     "escape_misc": False,
-    # テキストの折り返し
-    "wrap": True,
-    "wrap_width": 80,
+    # テキストの折り返し（レンダラー側で折り返すため無効）
+    "wrap": False,
     # Markdownの拡張機能
     "bullets": "-",  # リストのマーカー
     "emphasis_mark": "*",  # 強調のマーカー
@@ -124,6 +128,7 @@ COMPREHENSIVE_MARKDOWNIFY_CONFIG: Dict[str, Any] = {
         "address",
         "time",
     ],
+    "wrap": True,
     "wrap_width": 100,
 }
 
@@ -3,10 +3,14 @@ Playwrightを使用したPDFコンバーター
 """
 
 import io
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Iterator, Mapping, Optional, List, Union
+from playwright.sync_api import Browser, Page, Playwright, sync_playwright
+from bs4 import BeautifulSoup, Tag
 from loguru import logger
 
 try:
@@ -29,8 +33,93 @@ from ...core.domain.build_domain import (
     ConvertError,
     ContentNotFoundError,
 )
+from .html_soup import (
+    build_strainer,
+    compile_selector,
+    create_soup,
+    detect_encoding,
+    extract_title,
+    remove_unwanted_elements,
+)
 from .playwright_config import DEFAULT_PLAYWRIGHT_PDF_CONFIG, validate_pdf_config
 
+# PDF結合時にメモリ上で書き出す最大サイズ（結合前の合計がこれを超える場合はディスクに書き出す）
+_MERGE_SPOOL_MAX_BYTES = 64 * 1024 * 1024
+
+# ワーカー数を指定しない場合の上限（ワーカーごとにChromiumを起動するためメモリを多く使う）
+_DEFAULT_MAX_WORKERS = 4
+
+# PDF変換用HTMLドキュメントの固定部分（<title>の前、<title>から<body>まで、</body>以降）
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="ja">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>"""
+
+_HTML_STYLE_AND_BODY_OPEN = """</title>
+    <style>
+        body {
+            font-family: "Hiragino Sans", "Yu Gothic", "Meiryo", sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+        }
+        h1, h2, h3, h4, h5, h6 {
+            color: #2c3e50;
+            margin-top: 2em;
+            margin-bottom: 1em;
+        }
+        p {
+            margin-bottom: 1em;
+        }
+        ul, ol {
+            margin-bottom: 1em;
+            padding-left: 2em;
+        }
+        code {
+            background-color: #f4f4f4;
+            padding: 2px 4px;
+            border-radius: 3px;
+            font-family: "Courier New", monospace;
+        }
+        pre {
+            background-color: #f4f4f4;
+            padding: 10px;
+            border-radius: 5px;
+            overflow-x: auto;
+        }
+        table {
+            border-collapse: collapse;
+            width: 100%;
+            margin-bottom: 1em;
+        }
+        th, td {
+            border: 1px solid #ddd;
+            padding: 8px;
+            text-align: left;
+        }
+        th {
+            background-color: #f2f2f2;
+        }
+        @media print {
+            body {
+                max-width: none;
+                margin: 0;
+                padding: 0;
+            }
+        }
+    </style>
+</head>
+<body>
+"""
+
+_HTML_FOOT = """
+</body>
+</html>"""
+
 
 class PlaywrightPDFConverter(PDFConverterProtocol):
     """
@@ -46,8 +135,46 @@ class PlaywrightPDFConverter(PDFConverterProtocol):
         """
         self.config = config or DEFAULT_PLAYWRIGHT_PDF_CONFIG.copy()
         validate_pdf_config(self.config)
+
+        # ドキュメントごとに設定を参照しないよう、変換に使う値を事前に確定しておく
+        self._pdf_options = self._build_pdf_options(self.config)
+        self._headless = self.config.get("headless", True)
+        self._viewport = self.config.get("viewport")
+        self._wait_for_load_state = self.config.get("wait_for_load_state")
+        self._wait_for_timeout = self.config.get("wait_for_timeout")
+
         logger.debug(f"PlaywrightPDFConverter initialized with config: {self.config}")
 
+    @staticmethod
+    def _build_pdf_options(config: Dict[str, Any]) -> Mapping[str, Any]:
+        """
+        設定からpage.pdf()に渡すオプションを作成
+
+        Args:
+            config: Playwright設定
+
+        Returns:
+            Mapping[str, Any]: 変更できないPDF生成オプション
+        """
+        pdf_options = {
+            "format": config.get("format", "A4"),
+            "print_background": config.get("print_background", True),
+            "display_header_footer": config.get("display_header_footer", False),
+            "prefer_css_page_size": config.get("prefer_css_page_size", True),
+            "landscape": config.get("landscape", False),
+        }
+
+        # マージンの設定
+        if "margin" in config:
+            pdf_options["margin"] = config["margin"]
+
+        # ヘッダー・フッターの設定
+        if config.get("display_header_footer"):
+            pdf_options["header_template"] = config.get("header_template", "")
+            pdf_options["footer_template"] = config.get("footer_template", "")
+
+        return MappingProxyType(pdf_options)
+
     def convert(self, request: PDFConvertRequest) -> ConvertResult:
         """
         HTMLをPDFに変換
@@ -58,6 +185,24 @@ class PlaywrightPDFConverter(PDFConverterProtocol):
         Returns:
             ConvertResult: 変換結果
 
+        Raises:
+            ConvertError: 変換処理に失敗した場合
+        """
+        return self._convert_request(request)
+
+    def _convert_request(
+        self, request: PDFConvertRequest, page: Optional[Page] = None
+    ) -> ConvertResult:
+        """
+        1ファイルをPDFに変換
+
+        Args:
+            request: PDF変換要求
+            page: 再利用するページ（Noneの場合は変換ごとにブラウザを起動）
+
+        Returns:
+            ConvertResult: 変換結果
+
         Raises:
             ConvertError: 変換処理に失敗した場合
         """
@@ -67,11 +212,17 @@ class PlaywrightPDFConverter(PDFConverterProtocol):
             # HTMLファイルの読み込み
             html_content = self._read_html_file(request.file_path)
 
-            # BeautifulSoupでパース
-            soup = BeautifulSoup(html_content, "html.parser")
+            # 先頭部分の<title>から取得できればパース結果からの検索を省略
+            title = extract_title(html_content)
+
+            # BeautifulSoupでパース（単純なセレクタの場合は該当部分のみ）
+            soup = create_soup(
+                html_content, parse_only=build_strainer(request.main_selector)
+            )
 
             # タイトルの抽出
-            title = self._extract_title(soup)
+            if title is None:
+                title = self._extract_title(soup)
 
             # メインコンテンツの抽出
             main_content = self._extract_main_content(soup, request.main_selector)
@@ -88,7 +239,7 @@ class PlaywrightPDFConverter(PDFConverterProtocol):
             temp_html = self._create_temp_html(main_content, title)
 
             # PlaywrightでPDFに変換
-            pdf_bytes = self._convert_to_pdf_with_playwright(temp_html)
+            pdf_bytes = self._convert_to_pdf_with_playwright(temp_html, page)
 
             # テキスト長の計算
             text_length = len(main_content.get_text(strip=True))
@@ -124,7 +275,10 @@ class PlaywrightPDFConverter(PDFConverterProtocol):
             raise ConvertError(error_msg)
 
     def convert_multiple(
-        self, requests: List[PDFConvertRequest], merge: bool = True
+        self,
+        requests: List[PDFConvertRequest],
+        merge: bool = True,
+        max_workers: Optional[int] = None,
     ) -> Union[ConvertResult, List[ConvertResult]]:
         """
         複数のHTMLファイルをPDFに変換
@@ -132,6 +286,7 @@ class PlaywrightPDFConverter(PDFConverterProtocol):
         Args:
             requests: PDF変換要求のリスト
             merge: Trueの場合は結合されたPDFを返す、Falseの場合は個別PDFのリストを返す
+            max_workers: 並列に変換するワーカー数（Noneの場合はCPUコア数と4の小さい方）
 
         Returns:
             Union[ConvertResult, List[ConvertResult]]: 変換結果
@@ -144,11 +299,7 @@ class PlaywrightPDFConverter(PDFConverterProtocol):
         )
 
         try:
-            # 各ファイルを個別に変換
-            individual_results = []
-            for request in requests:
-                result = self.convert(request)
-                individual_results.append(result)
+            individual_results = self._convert_all(requests, max_workers)
 
             if not merge:
                 return individual_results
@@ -159,24 +310,22 @@ class PlaywrightPDFConverter(PDFConverterProtocol):
                     "PDF merging requires pypdf or PyPDF2 to be installed"
                 )
 
-            merged_pdf_bytes = self._merge_pdfs(
-                [result.content for result in individual_results]
-            )
-
-            # 結合結果の作成
-            total_text_length = sum(
-                result.extracted_text_length for result in individual_results
-            )
+            # 結合結果のメタデータを1回の走査でまとめて集計
+            total_text_length = 0
             all_warnings = []
+            titles = []
             for result in individual_results:
+                total_text_length += result.extracted_text_length
                 all_warnings.extend(result.warnings)
+                if result.title != "Untitled":
+                    titles.append(result.title)
+
+            # 個別のPDFは結合に追加した順に解放する
+            merged_pdf_bytes = self._merge_pdfs(
+                self._release_contents(individual_results)
+            )
 
             # タイトルを結合
-            titles = [
-                result.title
-                for result in individual_results
-                if result.title != "Untitled"
-            ]
             merged_title = " + ".join(titles) if titles else "Merged Document"
 
             merged_result = ConvertResult(
@@ -185,7 +334,7 @@ class PlaywrightPDFConverter(PDFConverterProtocol):
                 format=OutputFormat.PDF,
                 title=merged_title,
                 extracted_text_length=total_text_length,
-                warnings=list(set(all_warnings)),  # 重複を除去
+                warnings=list(dict.fromkeys(all_warnings)),  # 順序を保って重複を除去
             )
 
             logger.info(
@@ -198,6 +347,70 @@ class PlaywrightPDFConverter(PDFConverterProtocol):
             logger.error(error_msg)
             raise ConvertError(error_msg)
 
+    def _convert_all(
+        self, requests: List[PDFConvertRequest], max_workers: Optional[int]
+    ) -> List[ConvertResult]:
+        """
+        複数ファイルをワーカースレッドで並列にPDFへ変換
+
+        レンダリングはChromiumのプロセス内で行われるため、スレッドで並列化できます。
+        Playwrightの同期APIはスレッド間で共有できないため、
+        ワーカーごとにブラウザを1つ起動し、割り当てられたファイルを順に変換します。
+
+        Args:
+            requests: PDF変換要求のリスト
+            max_workers: ワーカー数（Noneの場合はCPUコア数と4の小さい方）
+
+        Returns:
+            List[ConvertResult]: 要求と同じ順序の変換結果
+        """
+        if not requests:
+            return []
+
+        if max_workers is None:
+            max_workers = min(_DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+        workers = min(max_workers, len(requests))
+        if workers <= 1:
+            return self._convert_batch(requests)
+
+        logger.info(f"Rendering {len(requests)} PDFs with {workers} workers")
+
+        # 負荷が偏らないようにファイルを交互に割り当てる
+        batches = [requests[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            batch_results = list(executor.map(self._convert_batch, batches))
+
+        results: List[Optional[ConvertResult]] = [None] * len(requests)
+        for i, batch_result in enumerate(batch_results):
+            results[i::workers] = batch_result
+        return results
+
+    def _convert_batch(self, requests: List[PDFConvertRequest]) -> List[ConvertResult]:
+        """
+        ブラウザとページを1度だけ作成し、同じページで各ファイルをPDFに変換
+
+        Args:
+            requests: PDF変換要求のリスト
+
+        Returns:
+            List[ConvertResult]: 要求と同じ順序の変換結果
+        """
+        with sync_playwright() as p:
+            browser = self._launch_browser(p)
+            try:
+                page = self._new_page(browser)
+                try:
+                    results = []
+                    for request in requests:
+                        results.append(self._convert_request(request, page))
+                        # 次のファイルの前に前のドキュメントのリソースを解放する
+                        page.goto("about:blank")
+                    return results
+                finally:
+                    page.close()
+            finally:
+                browser.close()
+
     def _read_html_file(self, file_path: Path) -> str:
         """
         HTMLファイルを読み込み
@@ -214,19 +427,14 @@ class PlaywrightPDFConverter(PDFConverterProtocol):
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
-        except UnicodeDecodeError:
-            # UTF-8で読めない場合は他のエンコーディングを試す
-            encodings = ["cp932", "shift_jis", "euc-jp", "iso-8859-1"]
-            for encoding in encodings:
-                try:
-                    with open(file_path, "r", encoding=encoding) as f:
-                        return f.read()
-                except UnicodeDecodeError:
-                    continue
+        # 一度だけバイト列として読み込み、判定したエンコーディングでデコードする
+        with open(file_path, "rb") as f:
+            raw = f.read()
+
+        encoding = detect_encoding(raw)
+        if encoding is None:
             raise ConvertError(f"Unable to decode file: {file_path}")
+        return raw.decode(encoding)
 
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """
@@ -250,9 +458,7 @@ class PlaywrightPDFConverter(PDFConverterProtocol):
 
         return ""
 
-    def _extract_main_content(
-        self, soup: BeautifulSoup, selector: str
-    ) -> BeautifulSoup:
+    def _extract_main_content(self, soup: BeautifulSoup, selector: str) -> Tag:
         """
         メインコンテンツを抽出
 
@@ -261,244 +467,213 @@ class PlaywrightPDFConverter(PDFConverterProtocol):
             selector: CSSセレクタ
 
         Returns:
-            BeautifulSoup: メインコンテンツのBeautifulSoupオブジェクト
+            Tag: メインコンテンツの要素
 
         Raises:
             ContentNotFoundError: セレクタでコンテンツが見つからない場合
         """
-        elements = soup.select(selector)
-        if not elements:
+        # 最初にマッチした要素のみ必要なため、すべてのマッチは収集しない
+        element = compile_selector(selector).select_one(soup)
+        if element is None:
             raise ContentNotFoundError(f"Content not found with selector: {selector}")
 
-        # 最初にマッチした要素を使用
-        main_element = elements[0]
+        # 再パースせずにそのまま使用
+        return element
 
-        # 新しいBeautifulSoupオブジェクトを作成
-        main_soup = BeautifulSoup(str(main_element), "html.parser")
-
-        return main_soup
-
-    def _remove_unwanted_elements(self, soup: BeautifulSoup) -> None:
+    def _remove_unwanted_elements(self, soup: Tag) -> None:
         """
         不要な要素を除去
 
         Args:
-            soup: BeautifulSoupオブジェクト（インプレースで変更）
-        """
-        # 除去対象のタグリスト
-        unwanted_tags = [
-            "script",
-            "style",
-            "nav",
-            "header",
-            "footer",
-            "aside",
-            "meta",
-            "link",
-        ]
-
-        for tag_name in unwanted_tags:
-            for element in soup.find_all(tag_name):
-                element.decompose()
-
-    def _adjust_heading_levels(self, soup: BeautifulSoup, offset: int) -> BeautifulSoup:
+            soup: メインコンテンツの要素（インプレースで変更）
+        """
+        remove_unwanted_elements(soup)
+
+    def _adjust_heading_levels(self, soup: Tag, offset: int) -> Tag:
         """
         見出しレベルを調整
 
         Args:
-            soup: BeautifulSoupオブジェクト
+            soup: メインコンテンツの要素
             offset: 見出しレベルのオフセット
 
         Returns:
-            BeautifulSoup: 見出しレベルが調整されたBeautifulSoupオブジェクト
+            Tag: 見出しレベルが調整された要素
         """
         if offset <= 0:
             return soup
 
-        # 見出しタグを取得（h1からh6まで）
-        heading_tags = ["h1", "h2", "h3", "h4", "h5", "h6"]
-
-        for tag_name in heading_tags:
-            headings = soup.find_all(tag_name)
-            for heading in headings:
-                current_level = int(tag_name[1])  # h1 -> 1, h2 -> 2, ...
-                new_level = min(current_level + offset, 6)  # 最大h6まで
-
-                # 新しいタグ名を作成
-                new_tag_name = f"h{new_level}"
-                heading.name = new_tag_name
+        # 見出しタグを1回の走査で取得し、各見出しを1度だけ変更する
+        for heading in soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]):
+            heading.name = f"h{min(int(heading.name[1]) + offset, 6)}"  # 最大h6まで
 
         return soup
 
-    def _create_temp_html(self, content_soup: BeautifulSoup, title: str) -> str:
+    def _create_temp_html(self, content_soup: Tag, title: str) -> str:
         """
         一時的なHTMLドキュメントを作成
 
         Args:
-            content_soup: メインコンテンツのBeautifulSoup
+            content_soup: メインコンテンツの要素
             title: ドキュメントタイトル
 
         Returns:
             str: 完全なHTMLドキュメント
         """
-        html_template = f"""<!DOCTYPE html>
-<html lang="ja">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        body {{
-            font-family: "Hiragino Sans", "Yu Gothic", "Meiryo", sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        h1, h2, h3, h4, h5, h6 {{
-            color: #2c3e50;
-            margin-top: 2em;
-            margin-bottom: 1em;
-        }}
-        p {{
-            margin-bottom: 1em;
-        }}
-        ul, ol {{
-            margin-bottom: 1em;
-            padding-left: 2em;
-        }}
-        code {{
-            background-color: #f4f4f4;
-            padding: 2px 4px;
-            border-radius: 3px;
-            font-family: "Courier New", monospace;
-        }}
-        pre {{
-            background-color: #f4f4f4;
-            padding: 10px;
-            border-radius: 5px;
-            overflow-x: auto;
-        }}
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin-bottom: 1em;
-        }}
-        th, td {{
-            border: 1px solid #ddd;
-            padding: 8px;
-            text-align: left;
-        }}
-        th {{
-            background-color: #f2f2f2;
-        }}
-        @media print {{
-            body {{
-                max-width: none;
-                margin: 0;
-                padding: 0;
-            }}
-        }}
-    </style>
-</head>
-<body>
-{str(content_soup)}
-</body>
-</html>"""
-
-        return html_template
+        # 固定部分はモジュール定数として保持し、タイトルと本文のみを連結する
+        return "".join(
+            (
+                _HTML_HEAD,
+                title,
+                _HTML_STYLE_AND_BODY_OPEN,
+                str(content_soup),
+                _HTML_FOOT,
+            )
+        )
 
-    def _convert_to_pdf_with_playwright(self, html_content: str) -> bytes:
+    def _convert_to_pdf_with_playwright(
+        self, html_content: str, page: Optional[Page] = None
+    ) -> bytes:
         """
         PlaywrightでHTMLをPDFに変換
 
         Args:
             html_content: HTMLコンテンツ
+            page: 再利用するページ（Noneの場合はブラウザを起動して終了する）
 
         Returns:
             bytes: PDFバイナリデータ
         """
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.config.get("headless", True))
+        if page is not None:
+            return self._render_page_to_pdf(page, html_content)
 
+        with sync_playwright() as p:
+            browser = self._launch_browser(p)
             try:
-                page = browser.new_page()
-
-                # ビューポートの設定
-                if "viewport" in self.config:
-                    page.set_viewport_size(**self.config["viewport"])
-
-                # HTMLコンテンツを設定
-                page.set_content(html_content)
-
-                # 待機設定
-                if "wait_for_load_state" in self.config:
-                    page.wait_for_load_state(self.config["wait_for_load_state"])
-
-                if "wait_for_timeout" in self.config:
-                    page.wait_for_timeout(self.config["wait_for_timeout"])
-
-                # PDF生成オプションを準備
-                pdf_options = {
-                    "format": self.config.get("format", "A4"),
-                    "print_background": self.config.get("print_background", True),
-                    "display_header_footer": self.config.get(
-                        "display_header_footer", False
-                    ),
-                    "prefer_css_page_size": self.config.get(
-                        "prefer_css_page_size", True
-                    ),
-                    "landscape": self.config.get("landscape", False),
-                }
-
-                # マージンの設定
-                if "margin" in self.config:
-                    pdf_options["margin"] = self.config["margin"]
-
-                # ヘッダー・フッターの設定
-                if self.config.get("display_header_footer"):
-                    pdf_options["header_template"] = self.config.get(
-                        "header_template", ""
-                    )
-                    pdf_options["footer_template"] = self.config.get(
-                        "footer_template", ""
-                    )
-
-                # PDFを生成
-                pdf_bytes = page.pdf(**pdf_options)
-
-                return pdf_bytes
-
+                page = self._new_page(browser)
+                try:
+                    return self._render_page_to_pdf(page, html_content)
+                finally:
+                    page.close()
             finally:
                 browser.close()
 
-    def _merge_pdfs(self, pdf_bytes_list: List[bytes]) -> bytes:
+    def _launch_browser(self, playwright: Playwright) -> Browser:
         """
-        複数のPDFを結合
+        Chromiumを起動
 
         Args:
-            pdf_bytes_list: PDFバイナリデータのリスト
+            playwright: Playwrightインスタンス
 
         Returns:
-            bytes: 結合されたPDFバイナリデータ
+            Browser: 起動したブラウザ
         """
-        if not pdf_bytes_list:
-            raise ConvertError("No PDFs to merge")
+        return playwright.chromium.launch(headless=self._headless)
+
+    def _new_page(self, browser: Browser) -> Page:
+        """
+        PDF生成用のページを作成
+
+        Args:
+            browser: ブラウザ
 
-        if len(pdf_bytes_list) == 1:
-            return pdf_bytes_list[0]
+        Returns:
+            Page: ビューポートを設定したページ
+        """
+        page = browser.new_page()
 
-        writer = PdfWriter()
+        # ビューポートの設定
+        if self._viewport is not None:
+            page.set_viewport_size(self._viewport)
 
-        for pdf_bytes in pdf_bytes_list:
-            reader = PdfReader(io.BytesIO(pdf_bytes))
-            for page in reader.pages:
-                writer.add_page(page)
+        return page
 
-        # 結合されたPDFをバイトストリームに書き込み
-        output_stream = io.BytesIO()
-        writer.write(output_stream)
-        output_stream.seek(0)
+    def _render_page_to_pdf(self, page: Page, html_content: str) -> bytes:
+        """
+        ページにHTMLを表示してPDFを生成
 
-        return output_stream.read()
+        Args:
+            page: ページ
+            html_content: HTMLコンテンツ
+
+        Returns:
+            bytes: PDFバイナリデータ
+        """
+        # HTMLコンテンツを設定
+        page.set_content(html_content)
+
+        # 待機設定
+        if self._wait_for_load_state is not None:
+            page.wait_for_load_state(self._wait_for_load_state)
+
+        if self._wait_for_timeout is not None:
+            page.wait_for_timeout(self._wait_for_timeout)
+
+        # PDFを生成
+        return page.pdf(**self._pdf_options)
+
+    @staticmethod
+    def _release_contents(results: List[ConvertResult]) -> Iterator[bytes]:
+        """
+        変換結果のPDFを順に取り出し、取り出した変換結果をリストから外す
+
+        Args:
+            results: 変換結果のリスト（取り出した要素はNoneに置き換える）
+
+        Yields:
+            bytes: PDFバイナリデータ
+        """
+        for i in range(len(results)):
+            result, results[i] = results[i], None
+            yield result.content
+
+    def _merge_pdfs(self, pdf_bytes_iter: Iterable[bytes]) -> bytes:
+        """
+        複数のPDFを結合
+
+        PDFは受け取った順にPdfWriterへ追加するため、追加済みのPDFのバイト列は
+        呼び出し側が保持していなければ結合の途中で解放されます。
+
+        Args:
+            pdf_bytes_iter: PDFバイナリデータを順に返すイテラブル
+
+        Returns:
+            bytes: 結合されたPDFバイナリデータ
+        """
+        writer = None
+        first_pdf_bytes = None
+        total_size = 0
+
+        for pdf_bytes in pdf_bytes_iter:
+            total_size += len(pdf_bytes)
+
+            # 1件のみの場合は結合せずにそのまま返すため、2件目が来るまで保留する
+            if writer is None and first_pdf_bytes is None:
+                first_pdf_bytes = pdf_bytes
+                continue
+
+            if writer is None:
+                writer = PdfWriter()
+                writer.append(PdfReader(io.BytesIO(first_pdf_bytes)))
+                first_pdf_bytes = None
+
+            writer.append(PdfReader(io.BytesIO(pdf_bytes)))
+
+        if writer is None:
+            if first_pdf_bytes is None:
+                raise ConvertError("No PDFs to merge")
+            return first_pdf_bytes
+
+        # 結合されたPDFを書き込み
+        if total_size <= _MERGE_SPOOL_MAX_BYTES:
+            # getvalue()は内部バッファをコピーせずにbytesとして返すため、
+            # seek(0)してread()する場合と異なり結合結果の複製が作られない
+            output_stream = io.BytesIO()
+            writer.write(output_stream)
+            return output_stream.getvalue()
+
+        # 大きい場合はディスクに書き出し、最後に1度だけ読み込む
+        with tempfile.TemporaryFile() as output_stream:
+            writer.write(output_stream)
+            output_stream.seek(0)
+            return output_stream.read()
@@ -0,0 +1,403 @@
+"""
+AiohttpCrawlerの実装
+
+aiohttpを使用してプロセス内でWebサイトを並行クローリング
+"""
+
+import asyncio
+import random
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urldefrag, urljoin, urlparse
+
+import aiohttp
+import lxml.html
+from lxml.etree import ParserError
+from loguru import logger
+
+from ...core.domain.fetch_domain import WebsiteURL, WebsiteCache, CrawlDepth, CachedPage
+from ...core.ports.fetch_contracts import WebCrawlerProtocol, NetworkError
+
+# 取得するContent-Type（wgetの --accept html,htm 相当）
+_HTML_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+
+# 最大ダウンロードサイズ（wgetの --quota 50m 相当）
+_QUOTA_BYTES = 50 * 1024 * 1024
+
+# DNSの解決結果をキャッシュする秒数
+_DNS_CACHE_TTL_SECONDS = 300
+
+# 接続確立のタイムアウト秒数（応答待ちはtimeoutで制御）
+_CONNECT_TIMEOUT_SECONDS = 5
+
+# アイドル状態のKeep-Alive接続を保持する秒数（--waitの間に切断されないように）
+_KEEPALIVE_TIMEOUT_SECONDS = 30
+
+
+class _HostThrottle:
+    """1つのホストへの同時リクエスト数とリクエスト間隔を制御"""
+
+    def __init__(self, max_connections: int, delay: float):
+        # ホストごとの同時リクエスト数の上限
+        self.semaphore = asyncio.Semaphore(max_connections)
+        # リクエストの開始を1つずつ順番に待たせる
+        self._lock = asyncio.Lock()
+        self._delay = delay
+        self._next_request_at = 0.0
+
+    async def wait(self) -> None:
+        """前回のリクエスト開始から遅延時間が経過するまで待機（wgetの --wait --random-wait 相当）"""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            wait_seconds = self._next_request_at - loop.time()
+            if wait_seconds > 0:
+                await asyncio.sleep(wait_seconds)
+            self._next_request_at = loop.time() + self._delay * random.uniform(0.5, 1.5)
+
+
+class _CrawlState:
+    """1回のクロールで共有する状態"""
+
+    def __init__(
+        self,
+        root_url: WebsiteURL,
+        output_dir: Path,
+        existing_pages: Dict[str, CachedPage],
+        max_connections_per_host: int,
+        delay: float,
+    ):
+        self.root_url = root_url
+        self.output_dir = output_dir
+        # 既存キャッシュのページ（URL → CachedPage、条件付きリクエスト用）
+        self.existing_pages = existing_pages
+        # 保存済み（または保存中）のリダイレクト後のURL
+        self.claimed: Set[str] = set()
+        self.total_bytes = 0
+        self._max_connections_per_host = max_connections_per_host
+        self._delay = delay
+        self._throttles: Dict[str, _HostThrottle] = {}
+
+    def throttle(self, host: str) -> _HostThrottle:
+        """ホストごとのリクエスト制御を取得"""
+        throttle = self._throttles.get(host)
+        if throttle is None:
+            throttle = _HostThrottle(self._max_connections_per_host, self._delay)
+            self._throttles[host] = throttle
+        return throttle
+
+
+class AiohttpCrawler(WebCrawlerProtocol):
+    """
+    aiohttpを使用したWebクローラーの実装
+
+    wgetの -r -l -np -D -E --quota --wait --random-wait 相当の動作をします。
+    同じホストへのリクエストは同時にmax_connections_per_host件までとし、
+    リクエストの開始間隔はホストごとにdelay秒（0.5〜1.5倍のランダム）空けます。
+    既存キャッシュがある場合は、ETag・Last-Modifiedによる条件付きリクエストで
+    変更のないページを再ダウンロードしません（-N 相当）。
+
+    wgetとの違い:
+        - リンクのローカル用への書き換え（-k）は行いません。
+          保存したHTMLのリンクは元のURLのままです。
+        - --quota は各ページの取得前に確認します。同時に取得中のページの分だけ
+          （最大max_concurrencyページ）上限を超えることがあります。
+    """
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        user_agent: str = None,
+        delay: float = 0.5,
+        max_concurrency: int = 8,
+        max_connections_per_host: int = 2,
+    ):
+        """
+        Args:
+            timeout: 各ページ取得のタイムアウト秒数（デフォルト: 30秒）
+            user_agent: User-Agent文字列（デフォルト: Mozilla/5.0 (compatible; site2/1.0)）
+            delay: 同じホストへのリクエスト間の遅延秒数（デフォルト: 0.5秒）
+            max_concurrency: 全ホスト合計の同時リクエスト数（デフォルト: 8）
+            max_connections_per_host: ホストごとの同時リクエスト数（デフォルト: 2）
+        """
+        self.timeout = timeout
+        self.user_agent = user_agent or "Mozilla/5.0 (compatible; site2/1.0)"
+        self.delay = delay
+        self.max_concurrency = max_concurrency
+        self.max_connections_per_host = max_connections_per_host
+
+    def crawl(
+        self,
+        url: WebsiteURL,
+        depth: CrawlDepth,
+        existing_cache: Optional[WebsiteCache] = None,
+    ) -> List[CachedPage]:
+        """
+        aiohttpを使用してWebサイトをクロール
+
+        Args:
+            url: クロール対象のURL
+            depth: クロール深度
+            existing_cache: 既存のキャッシュ（差分更新用）
+
+        Returns:
+            List[CachedPage]: クロールされたページのリスト
+
+        Raises:
+            NetworkError: 起点のページが取得できない場合
+        """
+        coroutine = self.crawl_async(url, depth, existing_cache)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+
+        # イベントループ内から呼ばれた場合は、asyncio.runが使えないため
+        # 別スレッドの新しいイベントループで実行する
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    async def crawl_async(
+        self,
+        url: WebsiteURL,
+        depth: CrawlDepth,
+        existing_cache: Optional[WebsiteCache] = None,
+    ) -> List[CachedPage]:
+        """
+        Webサイトを幅優先で並行してクロール
+
+        1つのセッションでTCP/TLS接続を再利用しながら、深さごとにページを並行取得します。
+
+        Args:
+            url: クロール対象のURL
+            depth: クロール深度
+            existing_cache: 既存のキャッシュ（差分更新用）
+
+        Returns:
+            List[CachedPage]: クロールされたページのリスト
+
+        Raises:
+            NetworkError: 起点のページが取得できない場合
+        """
+        logger.info(f"Starting aiohttp crawl for {url} with depth {depth.value}")
+
+        output_dir = self._prepare_output_directory(url)
+        start_url = urldefrag(str(url.value)).url
+        existing_pages = {
+            urldefrag(str(page.page_url.value)).url: page
+            for page in (existing_cache.pages if existing_cache else [])
+        }
+        state = _CrawlState(
+            url, output_dir, existing_pages, self.max_connections_per_host, self.delay
+        )
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.max_connections_per_host,
+            ttl_dns_cache=_DNS_CACHE_TTL_SECONDS,
+            keepalive_timeout=_KEEPALIVE_TIMEOUT_SECONDS,
+            ssl=False,  # SSL証明書の検証をスキップ（wgetの --no-check-certificate 相当）
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=self.timeout,
+            sock_connect=min(_CONNECT_TIMEOUT_SECONDS, self.timeout),
+        )
+        headers = {"User-Agent": self.user_agent}
+
+        visited = {start_url}
+        frontier = deque([start_url])
+        cached_pages: List[CachedPage] = []
+
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers=headers
+        ) as session:
+            for level in range(depth.value + 1):
+                if not frontier or state.total_bytes >= _QUOTA_BYTES:
+                    break
+
+                results = await asyncio.gather(
+                    *(
+                        self._fetch_page(
+                            session, semaphore, page_url, state, is_start=level == 0
+                        )
+                        for page_url in frontier
+                    )
+                )
+                if level == 0 and results[0] is None:
+                    raise NetworkError(f"Failed to fetch: {start_url}")
+
+                frontier = deque()
+                for result in results:
+                    if result is None:
+                        continue
+                    cached_page, links = result
+                    cached_pages.append(cached_page)
+                    # リダイレクト後のURLも取得済みとして扱う
+                    visited.add(str(cached_page.page_url.value))
+
+                    if level == depth.value:
+                        continue
+                    for link in links:
+                        if link not in visited and self._in_scope(url, link):
+                            visited.add(link)
+                            frontier.append(link)
+
+        logger.info(f"Crawl completed: {len(cached_pages)} pages fetched")
+        return cached_pages
+
+    def _prepare_output_directory(self, url: WebsiteURL) -> Path:
+        """出力ディレクトリの準備"""
+        # 一時ディレクトリを作成（後でFetchServiceが正式な場所に移動）
+        temp_dir = Path(tempfile.mkdtemp(prefix=f"aiohttp_{url.domain}_"))
+        logger.debug(f"Created temporary directory: {temp_dir}")
+        return temp_dir
+
+    async def _fetch_page(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        page_url: str,
+        state: _CrawlState,
+        is_start: bool = False,
+    ) -> Optional[Tuple[CachedPage, List[str]]]:
+        """
+        1ページを取得して保存し、CachedPageとページ内のリンクを返す
+
+        保存先・ページURL・リンクの基準には、リダイレクト後の最終的なURLを使用します。
+        """
+        existing = state.existing_pages.get(page_url)
+        if existing is not None and not existing.local_path.exists():
+            existing = None
+
+        # ホストの空きを先に待ち、混雑したホストのために全体の枠を占有しない
+        throttle = state.throttle(urlparse(page_url).netloc)
+        async with throttle.semaphore, semaphore:
+            # 上限に達した後は新しいページを取得しない（wgetの --quota 相当）
+            if state.total_bytes >= _QUOTA_BYTES:
+                return None
+
+            # サーバーへの負荷軽減（ホストごとにリクエスト間隔を空ける）
+            await throttle.wait()
+            try:
+                async with session.get(
+                    page_url, headers=self._conditional_headers(existing)
+                ) as response:
+                    final_url = urldefrag(str(response.url)).url
+                    if response.status >= 400:
+                        logger.warning(f"HTTP {response.status}: {page_url}")
+                        return None
+                    if response.status == 304 and existing is not None:
+                        # 変更がないため既存キャッシュの内容を使用（wgetの -N 相当）
+                        body = await asyncio.to_thread(existing.local_path.read_bytes)
+                        etag = existing.etag
+                        last_modified = existing.last_modified
+                    elif response.content_type not in _HTML_CONTENT_TYPES:
+                        return None
+                    else:
+                        body = await response.read()
+                        etag = response.headers.get("ETag")
+                        last_modified = self._parse_http_date(
+                            response.headers.get("Last-Modified")
+                        )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Failed to fetch {page_url}: {e}")
+                return None
+
+            state.total_bytes += len(body)
+
+        # リダイレクト先が対象外のURLや、別のURLから取得済みのページは保存しない
+        if not is_start and not self._in_scope(state.root_url, final_url):
+            return None
+        if final_url in state.claimed:
+            return None
+        state.claimed.add(final_url)
+
+        local_path = self._local_path(state.output_dir, final_url)
+        await asyncio.to_thread(self._save, local_path, body)
+
+        cached_page = CachedPage(
+            page_url=WebsiteURL(value=final_url),
+            local_path=local_path,
+            content_type="text/html",
+            size_bytes=len(body),
+            fetched_at=datetime.now(),
+            last_modified=last_modified,
+            etag=etag,
+        )
+        return cached_page, self._extract_links(body, final_url)
+
+    def _conditional_headers(self, existing: Optional[CachedPage]) -> Dict[str, str]:
+        """既存キャッシュのページから条件付きリクエストのヘッダーを作成"""
+        if existing is None:
+            return {}
+
+        headers = {}
+        if existing.etag:
+            headers["If-None-Match"] = existing.etag
+        modified = existing.last_modified or existing.fetched_at
+        headers["If-Modified-Since"] = format_datetime(
+            modified.astimezone(timezone.utc), usegmt=True
+        )
+        return headers
+
+    def _parse_http_date(self, value: Optional[str]) -> Optional[datetime]:
+        """HTTPの日付ヘッダーを解析（解析できない場合はNone）"""
+        if not value:
+            return None
+        try:
+            return parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _local_path(self, output_dir: Path, page_url: str) -> Path:
+        """URLからwgetと同じレイアウトの保存先パスを作成"""
+        parsed = urlparse(page_url)
+        path = parsed.path or "/"
+        if path.endswith("/"):
+            path += "index.html"
+        # クエリ違いのページが上書きされないよう、wgetと同様にファイル名に含める
+        if parsed.query:
+            path += "?" + parsed.query.replace("/", "%2F")
+        local_path = output_dir / parsed.netloc / path.lstrip("/")
+
+        # wgetの -E 相当
+        if local_path.suffix.lower() not in (".html", ".htm"):
+            local_path = local_path.with_name(local_path.name + ".html")
+        return local_path
+
+    def _save(self, local_path: Path, body: bytes) -> None:
+        """取得したページを保存"""
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        local_path.write_bytes(body)
+
+    def _extract_links(self, body: bytes, base_url: str) -> List[str]:
+        """HTMLから<a>要素のリンクを絶対URLとして抽出"""
+        try:
+            document = lxml.html.document_fromstring(body)
+        except (ParserError, ValueError):
+            return []
+
+        return [
+            urldefrag(urljoin(base_url, link)).url
+            for element, attribute, link, _ in document.iterlinks()
+            if element.tag == "a" and attribute == "href"
+        ]
+
+    def _in_scope(self, root_url: WebsiteURL, candidate: str) -> bool:
+        """クロール対象のURLか判定（wgetの -D <domain> -np 相当）"""
+        root = urlparse(str(root_url.value))
+        parsed = urlparse(candidate)
+        if parsed.scheme not in ("http", "https"):
+            return False
+
+        host = parsed.hostname or ""
+        if host != root_url.domain and not host.endswith(f".{root_url.domain}"):
+            return False
+
+        # 起点のディレクトリより上には辿らない
+        root_prefix = root.path[: root.path.rfind("/") + 1] or "/"
+        return parsed.path.startswith(root_prefix)
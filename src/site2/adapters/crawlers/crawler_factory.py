@@ -8,6 +8,12 @@ from loguru import logger
 from ...core.ports.fetch_contracts import WebCrawlerProtocol
 from .wget_crawler import WgetCrawler
 
+try:
+    from .aiohttp_crawler import AiohttpCrawler
+except ImportError:
+    logger.debug("aiohttp is not installed. The aiohttp crawler is not available.")
+    AiohttpCrawler = None
+
 
 class CrawlerFactory:
     """クローラーのファクトリークラス"""
@@ -18,6 +24,8 @@ class CrawlerFactory:
         # "selenium": SeleniumCrawler,
         # "requests": RequestsCrawler,
     }
+    if AiohttpCrawler is not None:
+        _crawlers["aiohttp"] = AiohttpCrawler
 
     @classmethod
     def create(cls, method: str = "wget", **kwargs) -> WebCrawlerProtocol:
@@ -25,7 +33,7 @@ class CrawlerFactory:
         クローラーを作成
 
         Args:
-            method: クローラーの種類 ("wget", "selenium", "requests")
+            method: クローラーの種類 ("wget", "aiohttp")
             **kwargs: クローラーの初期化引数
 
         Returns:
@@ -4,10 +4,12 @@ WgetCrawlerの実装
 subprocessでwgetを使用してWebサイトをクローリング
 """
 
+import asyncio
+import os
 import subprocess
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional
 import tempfile
 
 from loguru import logger
@@ -15,6 +17,9 @@ from loguru import logger
 from ...core.domain.fetch_domain import WebsiteURL, WebsiteCache, CrawlDepth, CachedPage
 from ...core.ports.fetch_contracts import WebCrawlerProtocol, NetworkError
 
+# 収集対象のHTMLファイルの拡張子
+_HTML_SUFFIXES = frozenset({".html", ".htm"})
+
 
 class WgetCrawler(WebCrawlerProtocol):
     """wgetを使用したWebクローラーの実装"""
@@ -62,13 +67,65 @@ class WgetCrawler(WebCrawlerProtocol):
         try:
             logger.debug(f"Executing: {' '.join(wget_command)}")
             result = subprocess.run(wget_command, capture_output=True, text=True)
+            self._check_wget_result(result.returncode, result.stderr)
 
-            if result.returncode != 0:
-                stderr = result.stderr.strip()
-                logger.error(
-                    f"Wget failed with exit code {result.returncode}: {stderr}"
-                )
-                raise NetworkError(f"Wget failed: {stderr}")
+        except Exception as e:
+            logger.error(f"Failed to execute wget: {e}")
+            raise NetworkError(f"Failed to execute wget: {e}") from e
+
+        # クロールされたファイルを収集
+        cached_pages = self._collect_cached_pages(url, output_dir)
+
+        logger.info(f"Crawl completed: {len(cached_pages)} pages fetched")
+        return cached_pages
+
+    async def crawl_async(
+        self,
+        url: WebsiteURL,
+        depth: CrawlDepth,
+        existing_cache: Optional[WebsiteCache] = None,
+    ) -> List[CachedPage]:
+        """
+        wgetを非同期サブプロセスとして実行してWebサイトをクロール
+
+        wgetの完了を待つ間もイベントループをブロックしないため、
+        複数のサイトを並行してクロールできます。
+
+        Args:
+            url: クロール対象のURL
+            depth: クロール深度
+            existing_cache: 既存のキャッシュ（差分更新用）
+
+        Returns:
+            List[CachedPage]: クロールされたページのリスト
+
+        Raises:
+            NetworkError: ネットワークエラーまたはwget実行エラー
+        """
+        logger.info(f"Starting wget crawl for {url} with depth {depth.value}")
+
+        # 出力ディレクトリの準備
+        output_dir = self._prepare_output_directory(url)
+
+        # wgetコマンドの構築
+        wget_command = self._build_wget_command(url, depth, output_dir, existing_cache)
+
+        # wgetの実行
+        try:
+            logger.debug(f"Executing: {' '.join(wget_command)}")
+            process = await asyncio.create_subprocess_exec(
+                *wget_command,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                _, stderr = await process.communicate()
+            except asyncio.CancelledError:
+                # キャンセルされた場合はwgetを残さずに終了させる
+                process.kill()
+                await process.wait()
+                raise
+            self._check_wget_result(process.returncode, stderr.decode(errors="replace"))
 
         except Exception as e:
             logger.error(f"Failed to execute wget: {e}")
@@ -80,6 +137,41 @@ class WgetCrawler(WebCrawlerProtocol):
         logger.info(f"Crawl completed: {len(cached_pages)} pages fetched")
         return cached_pages
 
+    async def crawl_many(
+        self,
+        urls: List[WebsiteURL],
+        depth: CrawlDepth,
+        max_parallel: int = 4,
+    ) -> List[List[CachedPage]]:
+        """
+        複数のWebサイトを並行してクロール
+
+        Args:
+            urls: クロール対象のURLのリスト
+            depth: クロール深度
+            max_parallel: 同時に実行するwgetの最大数
+
+        Returns:
+            List[List[CachedPage]]: URLごとのクロールされたページのリスト（urlsと同じ順序）
+
+        Raises:
+            NetworkError: いずれかのクロールでネットワークエラーまたはwget実行エラーが発生した場合
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def crawl_with_limit(url: WebsiteURL) -> List[CachedPage]:
+            async with semaphore:
+                return await self.crawl_async(url, depth)
+
+        return list(await asyncio.gather(*(crawl_with_limit(url) for url in urls)))
+
+    def _check_wget_result(self, returncode: int, stderr: str) -> None:
+        """wgetの終了コードを確認し、失敗していればNetworkErrorを送出"""
+        if returncode != 0:
+            stderr = stderr.strip()
+            logger.error(f"Wget failed with exit code {returncode}: {stderr}")
+            raise NetworkError(f"Wget failed: {stderr}")
+
     def _prepare_output_directory(self, url: WebsiteURL) -> Path:
         """出力ディレクトリの準備"""
         # 一時ディレクトリを作成（後でFetchServiceが正式な場所に移動）
@@ -138,15 +230,12 @@ class WgetCrawler(WebCrawlerProtocol):
         """クロールされたファイルを収集してCachedPageリストを作成"""
         cached_pages = []
 
-        # HTMLファイルを検索
-        html_files = list(output_dir.glob("**/*.html")) + list(
-            output_dir.glob("**/*.htm")
-        )
-
-        for file_path in html_files:
+        # ディレクトリを1回だけ走査してHTMLファイルを検索
+        for entry in self._iter_html_files(output_dir):
+            file_path = Path(entry.path)
             try:
                 # ファイルサイズを取得
-                size_bytes = file_path.stat().st_size
+                size_bytes = entry.stat().st_size
 
                 # 相対パスを取得
                 relative_path = file_path.relative_to(output_dir)
@@ -172,6 +261,21 @@ class WgetCrawler(WebCrawlerProtocol):
 
         return cached_pages
 
+    def _iter_html_files(self, directory: Path) -> Iterator[os.DirEntry]:
+        """ディレクトリ配下のHTMLファイルを再帰的に列挙"""
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            # globと同様に、存在しないディレクトリは空として扱う
+            return
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._iter_html_files(Path(entry.path))
+                elif os.path.splitext(entry.name)[1] in _HTML_SUFFIXES:
+                    yield entry
+
     def _construct_page_url(self, base_url: WebsiteURL, relative_path: Path) -> str:
         """相対パスからページURLを構築"""
         # wgetが作成するディレクトリ構造から実際のURLを再構築
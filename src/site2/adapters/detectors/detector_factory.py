@@ -3,7 +3,8 @@
 設定に基づいて適切な検出器を作成する
 """
 
-from typing import Dict, Type
+from functools import lru_cache
+from typing import Dict, Tuple, Type
 from loguru import logger
 
 from ...core.ports.detect_contracts import MainContentDetectorProtocol
@@ -26,7 +27,7 @@ class DetectorFactory:
 
     @classmethod
     def create(
-        self,
+        cls,
         method: str,
         html_analyzer: HTMLAnalyzerProtocol,
         options: dict = None,
@@ -45,17 +46,60 @@ class DetectorFactory:
         Raises:
             ValueError: 不正な検出手法が指定された場合
         """
-        if method not in self._detectors:
-            available_methods = ", ".join(self._detectors.keys())
+        if method not in cls._detectors:
+            available_methods = ", ".join(cls._detectors.keys())
             raise ValueError(
                 f"Unknown detection method: {method}. Available: {available_methods}"
             )
 
-        detector_class = self._detectors[method]
+        detector_class = cls._detectors[method]
         logger.info(f"Creating {method} detector")
 
         return detector_class(html_analyzer=html_analyzer, options=options or {})
 
+    @classmethod
+    def get_or_create(
+        cls,
+        method: str,
+        html_analyzer: HTMLAnalyzerProtocol,
+        options: dict = None,
+    ) -> MainContentDetectorProtocol:
+        """
+        検出器を取得（同じ引数で作成済みの検出器があれば再利用）
+
+        ドキュメントごとに検出器を取得する場合に、作成と設定の読み込みを1度で済ませます。
+        オプションにハッシュできない値が含まれる場合は毎回作成します。
+
+        Args:
+            method: 検出手法 ("heuristic", "ai_gemini", "hybrid")
+            html_analyzer: HTMLアナライザー
+            options: 検出オプション
+
+        Returns:
+            MainContentDetectorProtocol: 検出器インスタンス
+
+        Raises:
+            ValueError: 不正な検出手法が指定された場合
+        """
+        options_key = tuple(sorted((options or {}).items()))
+        try:
+            hash(options_key)
+        except TypeError:
+            return cls.create(method, html_analyzer, options)
+
+        return cls._create_cached(method, html_analyzer, options_key)
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _create_cached(
+        cls,
+        method: str,
+        html_analyzer: HTMLAnalyzerProtocol,
+        options_key: Tuple[tuple, ...],
+    ) -> MainContentDetectorProtocol:
+        """引数ごとに作成した検出器をキャッシュ"""
+        return cls.create(method, html_analyzer, dict(options_key))
+
     @classmethod
     def get_available_methods(cls) -> list[str]:
         """利用可能な検出手法を取得"""
@@ -2,7 +2,8 @@
 ヒューリスティックベースのメインコンテンツ検出器
 """
 
-from typing import List
+from typing import Dict, List, Tuple
+import soupsieve
 from bs4 import BeautifulSoup, Tag
 from loguru import logger
 
@@ -14,6 +15,13 @@ from ...core.ports.detect_contracts import (
 from ...core.domain.detect_domain import SelectorCandidate
 from ...core.ports.parser_contracts import HTMLAnalyzerProtocol
 
+# 候補要素ごとに数えるタグ
+HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+COUNTED_TAGS = ("p",) + HEADING_TAGS
+
+# IDまたはクラスを持つdiv要素
+_DIV_WITH_ATTRS = soupsieve.compile("div[id], div[class]")
+
 
 class HeuristicMainContentDetector(MainContentDetectorProtocol):
     """
@@ -42,6 +50,21 @@ class HeuristicMainContentDetector(MainContentDetectorProtocol):
         "#entry": 70,
     }
 
+    # SEMANTIC_SELECTORSを基本スコアの高い順に並べ、コンパイル済みのセレクタを添えたもの
+    # （同点は定義順）
+    _SEMANTIC_SELECTORS_BY_SCORE = tuple(
+        (selector, soupsieve.compile(selector), base_score)
+        for selector, base_score in sorted(
+            SEMANTIC_SELECTORS.items(), key=lambda item: -item[1]
+        )
+    )
+
+    # この条件を満たす候補が見つかった時点で残りのセマンティックセレクタを評価しない
+    # 評価しなかったセレクタは候補に含まれないため、候補の一覧と同点の順序が変わり、
+    # 他に候補がなければ信頼度は候補が1つの場合の式（最高スコア×0.8）で計算される
+    STRONG_MATCH_SCORE = 0.95
+    STRONG_MATCH_MIN_PARAGRAPHS = 3
+
     # 除外すべきセレクタ（これらの要素は避ける）
     EXCLUSION_SELECTORS = [
         "nav",
@@ -72,6 +95,16 @@ class HeuristicMainContentDetector(MainContentDetectorProtocol):
         ".sidebar-content",
     ]
 
+    # 除外セレクタを種類ごとの集合に分解したもの（候補ごとの判定を集合の検索で行う）
+    # タグ名のセレクタはクラス名・IDとしても除外対象とする
+    EXCLUDED_TAGS = frozenset(s for s in EXCLUSION_SELECTORS if s[0] not in ".#")
+    EXCLUDED_CLASSES = EXCLUDED_TAGS | {
+        s[1:] for s in EXCLUSION_SELECTORS if s.startswith(".")
+    }
+    EXCLUDED_IDS = EXCLUDED_TAGS | {
+        s[1:] for s in EXCLUSION_SELECTORS if s.startswith("#")
+    }
+
     def __init__(self, html_analyzer: HTMLAnalyzerProtocol, options: dict = None):
         """
         Args:
@@ -88,6 +121,11 @@ class HeuristicMainContentDetector(MainContentDetectorProtocol):
         self.min_text_density = self.options.get("min_text_density", 0.05)
         self.min_paragraph_count = self.options.get("min_paragraph_count", 2)
 
+        # 要素ごとの計算結果のキャッシュ（id(element) -> (element, 値)）
+        # 要素を保持しておくことで、キャッシュ中にidが再利用されないようにする
+        self._density_cache: Dict[int, Tuple[Tag, float]] = {}
+        self._count_cache: Dict[int, Tuple[Tag, Dict[str, int]]] = {}
+
     def detect_main_content(self, soup: BeautifulSoup) -> MainContentDetectionResult:
         """
         メインコンテンツを検出
@@ -101,6 +139,7 @@ class HeuristicMainContentDetector(MainContentDetectorProtocol):
         Raises:
             HeuristicDetectionError: 検出処理に失敗した場合
         """
+        self._clear_caches()
         try:
             logger.debug("Starting heuristic main content detection")
 
@@ -133,7 +172,8 @@ class HeuristicMainContentDetector(MainContentDetectorProtocol):
             primary_selector = top_candidates[0].selector if top_candidates else ""
 
             logger.debug(
-                f"Heuristic detection completed. Found {len(top_candidates)} candidates"
+                "Heuristic detection completed. Found {} candidates",
+                len(top_candidates),
             )
 
             return MainContentDetectionResult(
@@ -145,15 +185,28 @@ class HeuristicMainContentDetector(MainContentDetectorProtocol):
         except Exception as e:
             logger.error(f"Heuristic detection failed: {str(e)}")
             raise HeuristicDetectionError(f"Heuristic detection failed: {str(e)}")
+        finally:
+            # 検出対象のツリーを保持し続けないようにする
+            self._clear_caches()
+
+    def _clear_caches(self) -> None:
+        """要素ごとの計算結果のキャッシュをクリア"""
+        self._density_cache.clear()
+        self._count_cache.clear()
 
     def _detect_semantic_selectors(
         self, soup: BeautifulSoup
     ) -> List[SelectorCandidate]:
-        """セマンティックセレクタによる検出"""
+        """
+        セマンティックセレクタによる検出
+
+        基本スコアの高い順に評価し、強い候補（STRONG_MATCH_SCORE以上かつ
+        段落数がSTRONG_MATCH_MIN_PARAGRAPHSより多い）が見つかった時点で打ち切ります。
+        """
         candidates = []
 
-        for selector, base_score in self.SEMANTIC_SELECTORS.items():
-            elements = soup.select(selector)
+        for selector, compiled, base_score in self._SEMANTIC_SELECTORS_BY_SCORE:
+            elements = compiled.select(soup)
 
             if elements:
                 # 要素の内容を評価
@@ -162,13 +215,10 @@ class HeuristicMainContentDetector(MainContentDetectorProtocol):
                 # テキスト密度を計算
                 text_density = self._calculate_text_density(element)
 
-                # 段落数を計算
-                paragraph_count = len(element.find_all("p"))
-
-                # 見出し数を計算
-                heading_count = len(
-                    element.find_all(["h1", "h2", "h3", "h4", "h5", "h6"])
-                )
+                # 段落数・見出し数を計算
+                tag_counts = self._count_tags(element)
+                paragraph_count = tag_counts["p"]
+                heading_count = sum(tag_counts[name] for name in HEADING_TAGS)
 
                 # スコアを調整
                 adjusted_score = base_score / 100.0  # 0-1の範囲に正規化
@@ -205,25 +255,44 @@ class HeuristicMainContentDetector(MainContentDetectorProtocol):
                     )
                 )
 
+                # 十分に強い候補が見つかれば、より低いスコアのセレクタは評価しない
+                if (
+                    adjusted_score >= self.STRONG_MATCH_SCORE
+                    and paragraph_count > self.STRONG_MATCH_MIN_PARAGRAPHS
+                    and not (self.enable_exclusion and self._is_excluded(element))
+                ):
+                    logger.debug(
+                        "Strong semantic match '{}', skipping the rest", selector
+                    )
+                    break
+
         return candidates
 
     def _detect_content_features(self, soup: BeautifulSoup) -> List[SelectorCandidate]:
         """コンテンツ特徴による検出"""
         candidates = []
+        seen_selectors = set()
 
-        # すべてのdiv要素を評価
-        divs = soup.find_all("div")
+        # IDまたはクラスを持つdiv要素のみを評価
+        divs = _DIV_WITH_ATTRS.select(soup)
 
         for div in divs:
-            # IDまたはクラスがある要素のみを評価
+            # 空のIDやクラスは除外
             if not (div.get("id") or div.get("class")):
                 continue
 
             # セレクタを構築
             selector = self._build_selector(div)
 
-            # 既に評価済みのセレクタはスキップ
-            if any(c.selector == selector for c in candidates):
+            # 既に候補となったセレクタはスキップ
+            if selector in seen_selectors:
+                continue
+
+            # 段落数を計算
+            paragraph_count = self._count_tags(div)["p"]
+
+            # 最小段落数チェック
+            if paragraph_count < self.min_paragraph_count:
                 continue
 
             # テキスト密度を計算
@@ -233,13 +302,6 @@ class HeuristicMainContentDetector(MainContentDetectorProtocol):
             if text_density < self.min_text_density:
                 continue
 
-            # 段落数を計算
-            paragraph_count = len(div.find_all("p"))
-
-            # 最小段落数チェック
-            if paragraph_count < self.min_paragraph_count:
-                continue
-
             # スコアを計算
             score = text_density * 0.5 + min(paragraph_count / 10, 0.3)
 
@@ -258,6 +320,7 @@ class HeuristicMainContentDetector(MainContentDetectorProtocol):
                     },
                 )
             )
+            seen_selectors.add(selector)
 
         return candidates
 
@@ -268,53 +331,45 @@ class HeuristicMainContentDetector(MainContentDetectorProtocol):
         filtered_candidates = []
 
         for candidate in candidates:
-            # 除外セレクタチェック
-            should_exclude = False
             element = candidate.metadata.get("element")
 
-            for exclusion_selector in self.EXCLUSION_SELECTORS:
-                # 要素が除外セレクタにマッチするかチェック
-                if element and element.name:
-                    # 要素名チェック
-                    if exclusion_selector == element.name:
-                        should_exclude = True
-                        break
-
-                    # クラス・IDチェック
-                    if element.get("class"):
-                        classes = " ".join(element.get("class", []))
-                        if exclusion_selector.replace(".", "") in classes:
-                            should_exclude = True
-                            break
-
-                    if element.get("id"):
-                        element_id = element.get("id")
-                        if exclusion_selector.replace("#", "") == element_id:
-                            should_exclude = True
-                            break
-
-            if not should_exclude:
-                filtered_candidates.append(candidate)
+            if element and element.name and self._is_excluded(element):
+                continue
+
+            filtered_candidates.append(candidate)
 
         return filtered_candidates
 
+    def _is_excluded(self, element: Tag) -> bool:
+        """要素が除外セレクタ（タグ名・クラス名・ID）にマッチするか判定"""
+        if element.name in self.EXCLUDED_TAGS:
+            return True
+        if element.get("id") in self.EXCLUDED_IDS:
+            return True
+        return not self.EXCLUDED_CLASSES.isdisjoint(element.get("class") or ())
+
     def _calculate_text_density(self, element: Tag) -> float:
         """テキスト密度を計算（テキスト/HTML比）"""
         if not element:
             return 0.0
 
-        # テキスト長
-        text = element.get_text(strip=True)
-        text_length = len(text)
+        cached = self._density_cache.get(id(element))
+        if cached is not None:
+            return cached[1]
 
-        # HTML長
-        html = str(element)
-        html_length = len(html)
+        density = self.html_analyzer.calculate_text_density(element)
+        self._density_cache[id(element)] = (element, density)
+        return density
 
-        if html_length == 0:
-            return 0.0
+    def _count_tags(self, element: Tag) -> Dict[str, int]:
+        """要素内の段落数・見出し数を1回の走査で計算"""
+        cached = self._count_cache.get(id(element))
+        if cached is not None:
+            return cached[1]
 
-        return text_length / html_length
+        counts = self.html_analyzer.count_children(element, COUNTED_TAGS)
+        self._count_cache[id(element)] = (element, counts)
+        return counts
 
     def _build_selector(self, element: Tag) -> str:
         """要素からセレクタを構築"""
@@ -2,14 +2,22 @@
 Parser implementations using BeautifulSoup
 """
 
+import copy
+import io
+import os
 import re
 import time
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, Comment, FeatureNotFound, SoupStrainer, Tag
+from bs4.element import AttributeValueWithCharsetSubstitution
+from bs4.formatter import Formatter
 from loguru import logger
 
 from ...core.ports.parser_contracts import (
     AnalysisError,
+    EncodingDetectorProtocol,
     HTMLAnalyzerProtocol,
     HTMLMetadata,
     HTMLParserProtocol,
@@ -24,15 +32,131 @@ from ...core.ports.parser_contracts import (
     TextExtractionRequest,
     TextExtractionResult,
 )
-from .chardet_detector import ChardetDetector
+
+try:
+    import lxml  # noqa: F401
+
+    # lxml is several times faster than the pure-Python html.parser
+    DEFAULT_PARSER = "lxml"
+except ImportError:
+    DEFAULT_PARSER = "html.parser"
+
+# Number of leading bytes handed to the encoding detector
+_DETECTION_BYTES = 10240
+
+# Strainers only test top-level tags, so "html" is deliberately left out:
+# accepting it would build the whole document again.
+CONTENT_STRAINER = SoupStrainer(
+    [
+        "main",
+        "article",
+        "div",
+        "section",
+        "p",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "a",
+        "img",
+        "table",
+        "ul",
+        "ol",
+        "title",
+        "meta",
+    ]
+)
+METADATA_STRAINER = SoupStrainer(["title", "meta"])
+
+
+class _AnyOfStrainer(SoupStrainer):
+    """A SoupStrainer that keeps a top-level tag if any of its strainers accepts it."""
+
+    def __init__(self, *strainers: SoupStrainer):
+        super().__init__()
+        self.strainers = strainers
+
+    @property
+    def includes_everything(self) -> bool:
+        return False
+
+    @property
+    def excludes_everything(self) -> bool:
+        return False
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return any(
+            strainer.allow_tag_creation(nsprefix, name, attrs)
+            for strainer in self.strainers
+        )
+
+    def allow_string_creation(self, string: str) -> bool:
+        # Strings outside the kept subtrees are never needed
+        return False
+
+
+# Covers every selector tried by DetectService.detect_nav
+# ("nav", "ul.nav", ".navigation", "#navigation").
+NAVIGATION_STRAINER = _AnyOfStrainer(
+    SoupStrainer(["nav", "header", "aside", "ul", "ol"]),
+    # Tag creation sees the raw class attribute, so match it as a token
+    SoupStrainer(class_=re.compile(r"(?:^|\s)navigation(?:\s|$)")),
+    SoupStrainer(id="navigation"),
+)
+
+STRAINER_PRESETS = {
+    "content": CONTENT_STRAINER,
+    "metadata": METADATA_STRAINER,
+    "navigation": NAVIGATION_STRAINER,
+}
+
+
+def _resolve_strainer(strain: Any) -> Optional[SoupStrainer]:
+    """Resolves a preset name to its SoupStrainer; other values are returned as is."""
+    if isinstance(strain, str):
+        if strain not in STRAINER_PRESETS:
+            available = ", ".join(STRAINER_PRESETS)
+            raise ValueError(
+                f"Unknown strainer preset: {strain}. Available: {available}"
+            )
+        return STRAINER_PRESETS[strain]
+    return strain
+
+
+def _make_soup(
+    html: str,
+    parser: str = DEFAULT_PARSER,
+    parse_only: Optional[SoupStrainer] = None,
+) -> BeautifulSoup:
+    """Builds a BeautifulSoup tree, falling back to html.parser if the parser is unavailable."""
+    try:
+        return BeautifulSoup(html, parser, parse_only=parse_only)
+    except FeatureNotFound:
+        logger.warning(f"Parser {parser!r} is not available, using html.parser")
+        return BeautifulSoup(html, "html.parser", parse_only=parse_only)
 
 
 class BeautifulSoupParser(HTMLParserProtocol):
     """HTML parsing service using BeautifulSoup."""
 
-    def __init__(self, parser: str = "html.parser"):
-        self.parser = parser
-        self.encoding_detector = ChardetDetector()
+    def __init__(
+        self,
+        parser: Optional[str] = None,
+        encoding_detector: Optional[EncodingDetectorProtocol] = None,
+        cache_size: int = 32,
+    ):
+        self.parser = parser or DEFAULT_PARSER
+        # LRU cache of decoded file contents: (path, mtime_ns, size, encoding) -> (html, encoding)
+        self.cache_size = cache_size
+        self._content_cache: OrderedDict = OrderedDict()
+        if encoding_detector is None:
+            # Imported here because parser_factory imports this module
+            from .parser_factory import ParserFactory
+
+            encoding_detector = ParserFactory.get_or_create("encoding_detector", "auto")
+        self.encoding_detector = encoding_detector
 
     def parse(self, request: ParseRequest) -> ParseResult:
         """Parses an HTML file."""
@@ -40,15 +164,10 @@ class BeautifulSoupParser(HTMLParserProtocol):
         warnings = []
 
         try:
-            encoding = request.encoding
-            if not encoding:
-                encoding = self.encoding_detector.detect_encoding(request.file_path)
-                logger.info(f"Detected encoding: {encoding} for {request.file_path}")
-
-            with open(request.file_path, "r", encoding=encoding, errors="ignore") as f:
-                html_content = f.read()
-
-            soup = self.parse_string(html_content)
+            html_content, encoding = self._read_file(request)
+            soup = self.parse_string(
+                html_content, parse_only=_resolve_strainer(request.strain)
+            )
             parse_time = time.time() - start_time
 
             return ParseResult(
@@ -63,12 +182,53 @@ class BeautifulSoupParser(HTMLParserProtocol):
             logger.error(f"Failed to parse {request.file_path}: {str(e)}")
             raise ParseError(f"Failed to parse HTML: {str(e)}") from e
 
-    def parse_string(self, html: str) -> BeautifulSoup:
-        """Parses an HTML string."""
+    def _read_file(self, request: ParseRequest) -> Tuple[str, str]:
+        """Reads and decodes a file, reusing the contents while the file is unchanged."""
+        cache_key = None
+        if self.cache_size > 0:
+            stat = os.stat(request.file_path)
+            cache_key = (
+                str(request.file_path),
+                stat.st_mtime_ns,
+                stat.st_size,
+                request.encoding,
+            )
+            cached = self._content_cache.get(cache_key)
+            if cached is not None:
+                self._content_cache.move_to_end(cache_key)
+                return cached
+
+        # Read once in binary mode and detect the encoding from the same buffer
+        with open(request.file_path, "rb") as f:
+            raw = f.read()
+
+        encoding = request.encoding
+        if not encoding:
+            encoding = self.encoding_detector.detect_encoding_from_bytes(
+                raw[:_DETECTION_BYTES]
+            )
+            logger.info("Detected encoding: {} for {}", encoding, request.file_path)
+
+        # Undecodable bytes become U+FFFD instead of being dropped silently
+        html_content = raw.decode(encoding, errors="replace")
+        if "\r" in html_content:
+            # Keep the universal-newline translation text mode used to do
+            html_content = html_content.replace("\r\n", "\n").replace("\r", "\n")
+
+        if cache_key is not None:
+            self._content_cache[cache_key] = (html_content, encoding)
+            if len(self._content_cache) > self.cache_size:
+                self._content_cache.popitem(last=False)
+        return html_content, encoding
+
+    def parse_string(
+        self, html: str, parse_only: Optional[SoupStrainer] = None
+    ) -> BeautifulSoup:
+        """Parses an HTML string, optionally keeping only the tags matched by parse_only."""
         if not html:
             raise ValueError("HTML string cannot be empty")
         try:
-            return BeautifulSoup(html, self.parser)
+            return _make_soup(html, self.parser, parse_only)
         except Exception as e:
             raise ParseError(f"Failed to parse HTML string: {str(e)}") from e
 
@@ -84,10 +244,16 @@ class BeautifulSoupParser(HTMLParserProtocol):
             for tag in element.find_all(style=True):
                 del tag["style"]
 
-        text = element.get_text(separator="\\n", strip=True)
+        # stripped_strings already skips empty strings and strips the others
         if request.clean_whitespace:
-            lines = [line.strip() for line in text.split("\\n")]
-            text = "\\n".join(filter(None, lines))
+            lines = (
+                line.strip()
+                for string in element.stripped_strings
+                for line in string.split("\n")
+            )
+            text = "\n".join(line for line in lines if line)
+        else:
+            text = "\n".join(element.stripped_strings)
 
         return TextExtractionResult(
             original_element=element,
@@ -130,27 +296,73 @@ class BeautifulSoupParser(HTMLParserProtocol):
             raise SelectorError(f"Selector search failed: {str(e)}") from e
 
 
+def _tag_markup_length(tag: Tag) -> int:
+    """Returns the length of a tag's start and end markup as str() would render it."""
+    # <name attr="value" ...>
+    length = len(tag.name) + 2
+    for key, value in tag.attrs.items():
+        length += len(key) + 1
+        if value is None:
+            continue
+        if isinstance(value, list):
+            value = " ".join(value)
+        length += len(value) + 3
+    if tag.is_empty_element:
+        # <br/>
+        return length + 1
+    # </name>
+    return length + len(tag.name) + 3
+
+
+def _measure(element: Tag) -> Tuple[int, int]:
+    """
+    Measures len(element.get_text(strip=True)) and len(str(element)) in one walk.
+
+    Neither the text nor the markup is built. Entity escaping is ignored, so the
+    markup length can be slightly shorter than the real markup for text
+    containing "&", "<" or ">".
+    """
+    text_types = element.interesting_string_types
+    if isinstance(text_types, type):
+        text_types = (text_types,)
+
+    text_length = 0
+    html_length = _tag_markup_length(element)
+    for descendant in element.descendants:
+        if isinstance(descendant, Tag):
+            html_length += _tag_markup_length(descendant)
+            continue
+        html_length += len(descendant.PREFIX) + len(descendant) + len(descendant.SUFFIX)
+        # Same selection as get_text(): exact string types only, stripped
+        if type(descendant) in text_types:
+            text_length += len(descendant.strip())
+    return text_length, html_length
+
+
 class BeautifulSoupAnalyzer(HTMLAnalyzerProtocol):
     """HTML structure and metadata analysis service."""
 
     def analyze_structure(self, soup: BeautifulSoup) -> HTMLStructureAnalysis:
         """Analyzes the structure of a BeautifulSoup object."""
         try:
+            # Count every tag in a single walk instead of one search per tag name
+            counts = Counter(
+                element.name for element in soup.descendants if isinstance(element, Tag)
+            )
             return HTMLStructureAnalysis(
-                has_main=bool(soup.find("main")),
-                has_article=bool(soup.find("article")),
-                has_nav=bool(soup.find("nav")),
-                has_header=bool(soup.find("header")),
-                has_footer=bool(soup.find("footer")),
+                has_main=counts["main"] > 0,
+                has_article=counts["article"] > 0,
+                has_nav=counts["nav"] > 0,
+                has_header=counts["header"] > 0,
+                has_footer=counts["footer"] > 0,
                 heading_count={
-                    f"h{level}": len(soup.find_all(f"h{level}"))
-                    for level in range(1, 7)
+                    f"h{level}": counts[f"h{level}"] for level in range(1, 7)
                 },
-                paragraph_count=len(soup.find_all("p")),
-                link_count=len(soup.find_all("a")),
-                image_count=len(soup.find_all("img")),
-                table_count=len(soup.find_all("table")),
-                list_count=len(soup.find_all(["ul", "ol"])),
+                paragraph_count=counts["p"],
+                link_count=counts["a"],
+                image_count=counts["img"],
+                table_count=counts["table"],
+                list_count=counts["ul"] + counts["ol"],
             )
         except Exception as e:
             raise AnalysisError(f"Structure analysis failed: {str(e)}") from e
@@ -160,16 +372,16 @@ class BeautifulSoupAnalyzer(HTMLAnalyzerProtocol):
         title_tag = soup.find("title")
         title = title_tag.string.strip() if title_tag else None
 
-        meta_tags = {
-            meta.get("name", "").lower(): meta.get("content", "")
-            for meta in soup.find_all("meta")
-            if meta.get("name")
-        }
-        og_tags = {
-            meta.get("property", ""): meta.get("content", "")
-            for meta in soup.find_all("meta")
-            if meta.get("property", "").startswith("og:")
-        }
+        meta_tags = {}
+        og_tags = {}
+        for meta in soup.find_all("meta"):
+            attrs = meta.attrs
+            name = attrs.get("name")
+            if name:
+                meta_tags[name.lower()] = attrs.get("content", "")
+            prop = attrs.get("property", "")
+            if prop.startswith("og:"):
+                og_tags[prop] = attrs.get("content", "")
         html_tag = soup.find("html")
         language = html_tag.get("lang") if html_tag else None
 
@@ -187,9 +399,78 @@ class BeautifulSoupAnalyzer(HTMLAnalyzerProtocol):
         """Calculates the text-to-HTML ratio of an element."""
         if not isinstance(element, Tag):
             return 0.0
-        text = element.get_text(strip=True)
-        html_length = len(str(element))
-        return len(text) / html_length if html_length > 0 else 0.0
+        text_length, html_length = _measure(element)
+        return text_length / html_length if html_length > 0 else 0.0
+
+    def count_children(self, element: Tag, names: Iterable[str]) -> Dict[str, int]:
+        """Counts descendant tags with the given names in a single walk."""
+        counts = dict.fromkeys(names, 0)
+        if not isinstance(element, Tag):
+            return counts
+        for descendant in element.descendants:
+            if isinstance(descendant, Tag) and descendant.name in counts:
+                counts[descendant.name] += 1
+        return counts
+
+
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
+# Tags removed (with their subtrees) before handing HTML to an LLM
+_LLM_REMOVED_TAGS = ["script", "style", "noscript", "iframe", "header", "footer", "nav"]
+
+
+def _is_comment(text: Any) -> bool:
+    """Matches HTML comment nodes."""
+    return isinstance(text, Comment)
+
+
+def _start_tag(tag: Tag, formatter: Formatter) -> str:
+    """Renders a start tag the way str() does."""
+    attrs = []
+    for key, value in formatter.attributes(tag):
+        if value is None:
+            attrs.append(key)
+            continue
+        if isinstance(value, (list, tuple)):
+            value = " ".join(value)
+        elif isinstance(value, AttributeValueWithCharsetSubstitution):
+            value = value.substitute_encoding("utf-8")
+        text = formatter.attribute_value(str(value))
+        attrs.append(f"{key}={formatter.quoted_attribute_value(text)}")
+    attribute_string = " " + " ".join(attrs) if attrs else ""
+    if tag.is_empty_element:
+        close = formatter.void_element_close_prefix or ""
+        return f"<{tag.name}{attribute_string}{close}>"
+    return f"<{tag.name}{attribute_string}>"
+
+
+def _write_markup(root: Tag, buffer: io.StringIO, limit: int) -> bool:
+    """
+    Writes the markup of root's contents to buffer, stopping once it exceeds limit.
+
+    Blank lines inside text nodes are collapsed while writing so that the limit
+    applies to the final output. Returns True if the output was cut short.
+    """
+    formatter = root.formatter_for_name("minimal")
+    open_tags: List[Tag] = []
+    for node in root.descendants:
+        # Close the tags that ended before this node
+        while open_tags and node.parent is not open_tags[-1]:
+            buffer.write(f"</{open_tags.pop().name}>")
+
+        if isinstance(node, Tag):
+            buffer.write(_start_tag(node, formatter))
+            if not node.is_empty_element:
+                open_tags.append(node)
+        else:
+            buffer.write(_BLANK_LINES_RE.sub("\n", node.output_ready(formatter)))
+
+        if buffer.tell() > limit:
+            return True
+
+    while open_tags:
+        buffer.write(f"</{open_tags.pop().name}>")
+    return buffer.tell() > limit
 
 
 class LLMPreprocessor(HTMLPreprocessorProtocol):
@@ -197,30 +478,37 @@ class LLMPreprocessor(HTMLPreprocessorProtocol):
 
     def preprocess_for_llm(self, soup: BeautifulSoup, max_length: int = 50000) -> str:
         """Preprocesses HTML for Large Language Model consumption."""
-        soup_copy = BeautifulSoup(str(soup), "html.parser")
-
-        for tag in soup_copy.find_all(
-            ["script", "style", "noscript", "iframe", "header", "footer", "nav"]
-        ):
-            tag.decompose()
-
-        for comment in soup_copy.find_all(
-            string=lambda text: isinstance(text, str) and "<!--" in text
-        ):
-            comment.extract()
-
-        for tag in soup_copy.find_all():
-            attrs_to_keep = {
-                "id": tag.attrs.get("id"),
-                "class": " ".join(tag.attrs.get("class", [])),
-                "href": tag.attrs.get("href") if tag.name == "a" else None,
-            }
-            tag.attrs = {k: v for k, v in attrs_to_keep.items() if v is not None}
-
-        html_str = str(soup_copy.prettify())
-        html_str = re.sub(r"\\n\\s*\\n", "\\n", html_str)
-
-        if len(html_str) > max_length:
-            html_str = html_str[:max_length] + "\\n<!-- truncated -->"
+        # Copying the tree is much cheaper than serialising and reparsing it
+        soup_copy = copy.copy(soup)
+
+        # Detach only the outermost matches; nested ones leave with their ancestor.
+        # The copy is discarded afterwards, so extract() is enough (no decompose()).
+        removed = set()
+        for tag in soup_copy.find_all(_LLM_REMOVED_TAGS):
+            if not any(id(parent) in removed for parent in tag.parents):
+                removed.add(id(tag))
+                tag.extract()
+
+        # Drop comments and simplify attributes in a single walk
+        for node in list(soup_copy.descendants):
+            if isinstance(node, Tag):
+                attrs = node.attrs
+                new_attrs = {}
+                if attrs.get("id") is not None:
+                    new_attrs["id"] = attrs["id"]
+                new_attrs["class"] = " ".join(attrs.get("class", []))
+                if node.name == "a" and attrs.get("href") is not None:
+                    new_attrs["href"] = attrs["href"]
+                node.attrs = new_attrs
+            elif _is_comment(node):
+                node.extract()
+
+        # Serialise only up to max_length instead of rendering the whole page
+        buffer = io.StringIO()
+        truncated = _write_markup(soup_copy, buffer, max_length)
+        html_str = _BLANK_LINES_RE.sub("\n", buffer.getvalue()[:max_length])
+
+        if truncated:
+            html_str += "\n<!-- truncated -->"
 
         return html_str
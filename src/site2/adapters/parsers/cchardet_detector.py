@@ -0,0 +1,19 @@
+"""
+Encoding detector implementation using cchardet
+"""
+
+from typing import Any, Dict
+
+import cchardet
+
+from .chardet_detector import ChardetDetector
+
+
+class CChardetDetector(ChardetDetector):
+    """Encoding detection service using cchardet (uchardet C++ binding)."""
+
+    name = "cchardet"
+
+    def _detect(self, data: bytes) -> Dict[str, Any]:
+        """Runs cchardet, which returns the same result dict as chardet."""
+        return cchardet.detect(data)
@@ -3,16 +3,20 @@ Encoding detector implementation using chardet
 """
 
 from pathlib import Path
+from typing import Any, Dict
 
 import chardet
 from loguru import logger
 
 from ...core.ports.parser_contracts import DetectionError, EncodingDetectorProtocol
+from .encoding_sniffer import sniff_encoding
 
 
 class ChardetDetector(EncodingDetectorProtocol):
     """Encoding detection service using chardet."""
 
+    name = "chardet"
+
     ENCODING_ALIASES = {
         "ascii": "utf-8",
         "iso-8859-1": "latin-1",
@@ -43,17 +47,23 @@ class ChardetDetector(EncodingDetectorProtocol):
             # Return default encoding for empty data
             return "utf-8"
 
+        # The data may be only the head of a file, so a cut-off last character is allowed
+        sniffed = sniff_encoding(data, partial=True)
+        if sniffed:
+            logger.debug("Detected encoding from BOM, UTF-8 or charset: {}", sniffed)
+            return self.ENCODING_ALIASES.get(sniffed.lower(), sniffed).lower()
+
         try:
-            result = chardet.detect(data)
+            result = self._detect(data)
 
             if not result or not result.get("encoding"):
-                logger.warning("chardet failed to detect encoding, using utf-8")
+                logger.warning(f"{self.name} failed to detect encoding, using utf-8")
                 return "utf-8"
 
             encoding = result["encoding"]
             confidence = result.get("confidence", 0)
 
-            logger.debug(f"Detected encoding: {encoding} (confidence: {confidence})")
+            logger.debug("Detected encoding: {} (confidence: {})", encoding, confidence)
 
             # Normalize aliases
             normalized = self.ENCODING_ALIASES.get(encoding.lower(), encoding)
@@ -67,3 +77,7 @@ class ChardetDetector(EncodingDetectorProtocol):
 
         except Exception as e:
             raise DetectionError(f"Encoding detection failed: {str(e)}") from e
+
+    def _detect(self, data: bytes) -> Dict[str, Any]:
+        """Runs the detection backend and returns a chardet-style result dict."""
+        return chardet.detect(data)
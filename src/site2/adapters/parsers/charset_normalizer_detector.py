@@ -0,0 +1,19 @@
+"""
+Encoding detector implementation using charset_normalizer
+"""
+
+from typing import Any, Dict
+
+import charset_normalizer
+
+from .chardet_detector import ChardetDetector
+
+
+class CharsetNormalizerDetector(ChardetDetector):
+    """Encoding detection service using charset_normalizer."""
+
+    name = "charset_normalizer"
+
+    def _detect(self, data: bytes) -> Dict[str, Any]:
+        """Runs charset_normalizer through its chardet-compatible API."""
+        return charset_normalizer.detect(data)
@@ -0,0 +1,91 @@
+"""
+Encoding sniffing shared by the parsers and the converters
+
+Resolves the encodings that can be determined from the bytes alone (BOM,
+UTF-8 validity and charset declarations) so that `detect` and `build` decode
+the same file the same way. Statistical detection is left to the callers.
+"""
+
+import codecs
+import re
+from typing import Optional
+
+from loguru import logger
+
+# UTF-32 BOMs start with the UTF-16 ones, so they have to be checked first
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# <meta charset="...">, <meta http-equiv content="...; charset=..."> and <?xml encoding="..."?>
+_DECLARED_CHARSET_RE = re.compile(
+    rb"""<meta[^>]+charset\s*=\s*["']?\s*([\w.:-]+)"""
+    rb"""|<\?xml[^>]+encoding\s*=\s*["']([\w.:-]+)""",
+    re.IGNORECASE,
+)
+
+# Only the head of the document is searched for a declaration
+_SNIFF_BYTES = 4096
+
+
+def sniff_encoding(data: bytes, partial: bool = False) -> Optional[str]:
+    """
+    Determines the encoding of HTML bytes without statistical detection.
+
+    The checks run in this order:
+
+    1. a BOM
+    2. valid non-ASCII UTF-8 (a mislabelled declaration does not win over it)
+    3. a charset declaration in the first 4KB that the data decodes with
+    4. ASCII-only data, which is reported as UTF-8
+
+    Args:
+        data: The HTML bytes
+        partial: True if the data is only the head of a document, in which case
+            a character cut off at the end is not treated as a decoding error
+
+    Returns:
+        Optional[str]: The encoding name, or None if statistical detection is needed
+    """
+    for bom, encoding in _BOMS:
+        if data.startswith(bom):
+            return encoding
+
+    is_ascii = data.isascii()
+    if not is_ascii and _can_decode(data, "utf-8", partial):
+        return "utf-8"
+
+    declared = _declared_encoding(data)
+    if declared and _can_decode(data, declared, partial):
+        return declared
+
+    return "utf-8" if is_ascii else None
+
+
+def _declared_encoding(data: bytes) -> Optional[str]:
+    """Returns the encoding given by a charset declaration, if it is a known codec."""
+    match = _DECLARED_CHARSET_RE.search(data, 0, _SNIFF_BYTES)
+    if not match:
+        return None
+
+    encoding = (match.group(1) or match.group(2)).decode("ascii")
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        logger.debug(f"Ignoring unknown declared charset: {encoding}")
+        return None
+    return encoding
+
+
+def _can_decode(data: bytes, encoding: str, partial: bool) -> bool:
+    """Checks whether the data decodes with the encoding."""
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(data, final=not partial)
+    except UnicodeError:
+        # UTF-16/32 without a BOM raises UnicodeError, not UnicodeDecodeError
+        return False
+    return True
@@ -2,7 +2,7 @@
 パーサー関連のファクトリークラス
 """
 
-from typing import Dict, Type
+from typing import Any, Dict, Type
 from loguru import logger
 
 from ...core.ports.parser_contracts import (
@@ -11,13 +11,31 @@ from ...core.ports.parser_contracts import (
     HTMLPreprocessorProtocol,
     EncodingDetectorProtocol,
 )
-from .beautifulsoup_parser import (
+from .beautifulsoup_parser import (  # noqa: F401
+    CONTENT_STRAINER,
+    METADATA_STRAINER,
+    NAVIGATION_STRAINER,
     BeautifulSoupParser,
     BeautifulSoupAnalyzer,
     LLMPreprocessor,
 )
 from .chardet_detector import ChardetDetector
 
+try:
+    from .cchardet_detector import CChardetDetector
+except ImportError:
+    logger.debug("cchardet is not installed. The cchardet detector is not available.")
+    CChardetDetector = None
+
+try:
+    from .charset_normalizer_detector import CharsetNormalizerDetector
+except ImportError:
+    logger.debug(
+        "charset_normalizer is not installed. "
+        "The charset_normalizer detector is not available."
+    )
+    CharsetNormalizerDetector = None
+
 
 class ParserFactory:
     """パーサー関連のファクトリークラス"""
@@ -44,10 +62,17 @@ class ParserFactory:
 
     _detectors: Dict[str, Type[EncodingDetectorProtocol]] = {
         "chardet": ChardetDetector,
-        # 将来的な拡張
-        # "cchardet": CChardetDetector,
-        # "charset_normalizer": CharsetNormalizerDetector,
     }
+    if CChardetDetector is not None:
+        _detectors["cchardet"] = CChardetDetector
+    if CharsetNormalizerDetector is not None:
+        _detectors["charset_normalizer"] = CharsetNormalizerDetector
+
+    # get_or_createで作成したインスタンス（(種類, 手法, 初期化引数) -> インスタンス）
+    _instances: Dict[tuple, Any] = {}
+
+    # "auto" 指定時に試す検出器の優先順位（高速なCバックエンドを優先）
+    _detector_preference = ("cchardet", "charset_normalizer", "chardet")
 
     @classmethod
     def create_parser(
@@ -73,7 +98,7 @@ class ParserFactory:
             )
 
         parser_class = cls._parsers[method]
-        logger.info(f"Creating {method} parser")
+        logger.debug(f"Creating {method} parser")
 
         return parser_class(**kwargs)
 
@@ -101,7 +126,7 @@ class ParserFactory:
             )
 
         analyzer_class = cls._analyzers[method]
-        logger.info(f"Creating {method} analyzer")
+        logger.debug(f"Creating {method} analyzer")
 
         return analyzer_class(**kwargs)
 
@@ -129,7 +154,7 @@ class ParserFactory:
             )
 
         preprocessor_class = cls._preprocessors[method]
-        logger.info(f"Creating {method} preprocessor")
+        logger.debug(f"Creating {method} preprocessor")
 
         return preprocessor_class(**kwargs)
 
@@ -141,7 +166,8 @@ class ParserFactory:
         エンコーディング検出器を作成
 
         Args:
-            method: 検出器の種類 ("chardet", "cchardet", "charset_normalizer")
+            method: 検出器の種類 ("chardet", "cchardet", "charset_normalizer")。
+                "auto" の場合は利用可能な中で最も高速な検出器を選択
             **kwargs: 検出器の初期化引数
 
         Returns:
@@ -150,6 +176,9 @@ class ParserFactory:
         Raises:
             ValueError: 不正な検出器種類が指定された場合
         """
+        if method == "auto":
+            method = next(m for m in cls._detector_preference if m in cls._detectors)
+
         if method not in cls._detectors:
             available_methods = ", ".join(cls._detectors.keys())
             raise ValueError(
@@ -157,10 +186,52 @@ class ParserFactory:
             )
 
         detector_class = cls._detectors[method]
-        logger.info(f"Creating {method} encoding detector")
+        logger.debug(f"Creating {method} encoding detector")
 
         return detector_class(**kwargs)
 
+    @classmethod
+    def get_or_create(cls, kind: str, method: str, **kwargs) -> Any:
+        """
+        パーサー関連のインスタンスを取得（同じ引数で作成済みのインスタンスがあれば再利用）
+
+        ドキュメントごとにインスタンスを取得する場合に、作成を1度で済ませます。
+        初期化引数にハッシュできない値が含まれる場合は毎回作成します。
+
+        Args:
+            kind: インスタンスの種類 ("parser", "analyzer", "preprocessor", "encoding_detector")
+            method: 種類ごとの手法 (create_parserなどのmethodと同じ)
+            **kwargs: 初期化引数
+
+        Returns:
+            Any: インスタンス
+
+        Raises:
+            ValueError: 不正な種類または手法が指定された場合
+        """
+        creators = {
+            "parser": cls.create_parser,
+            "analyzer": cls.create_analyzer,
+            "preprocessor": cls.create_preprocessor,
+            "encoding_detector": cls.create_encoding_detector,
+        }
+        if kind not in creators:
+            available_kinds = ", ".join(creators.keys())
+            raise ValueError(f"Unknown kind: {kind}. Available: {available_kinds}")
+
+        try:
+            key = (kind, method, frozenset(kwargs.items()))
+            hash(key)
+        except TypeError:
+            return creators[kind](method, **kwargs)
+
+        instance = cls._instances.get(key)
+
+        if instance is None:
+            instance = creators[kind](method, **kwargs)
+            cls._instances[key] = instance
+        return instance
+
     @classmethod
     def get_available_parsers(cls) -> list[str]:
         """利用可能なパーサー種類を取得"""
@@ -1,7 +1,8 @@
 """
-Storagedn
+Storagedn
 """
 
 from .file_repository import FileRepository
+from .json_result_cache import JsonResultCache
 
-__all__ = ["FileRepository"]
+__all__ = ["FileRepository", "JsonResultCache"]
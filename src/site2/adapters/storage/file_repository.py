@@ -5,25 +5,97 @@ FileRepositoryの実装
 """
 
 import json
+import mmap
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from loguru import logger
 
+try:
+    # orjsonはbytesやmemoryviewを直接解析でき、標準のjsonより高速
+    # （orjson.JSONDecodeErrorはjson.JSONDecodeErrorのサブクラス）
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # ijsonはJSONを先頭から逐次解析するため、root_urlを見つけた時点で読み込みを止められる
+    import ijson
+except ImportError:
+    ijson = None
+
 from ...core.domain.fetch_domain import WebsiteURL, WebsiteCache, CachedPage
 from ...core.ports.fetch_contracts import WebsiteCacheRepositoryProtocol
 
+# デフォルトのキャッシュディレクトリ（インスタンスごとにホームディレクトリを解決しない）
+_DEFAULT_CACHE_DIR = Path.home() / ".cache" / "site2"
+
+# キャッシュ一覧の集約インデックス（FetchServiceがキャッシュ保存時に更新）
+_INDEX_FILE = "index.json"
+
+# ルートURLだけを保存したファイル（FetchServiceがcache.jsonと一緒に作成）
+_ROOT_URL_FILE = "root_url.txt"
+
+# root_url.txtがない場合にcache.jsonの先頭から読む最大バイト数
+_ROOT_URL_SNIFF_BYTES = 4096
+
+# cache.jsonの先頭にあるroot_urlの値（JSON文字列）
+_ROOT_URL_RE = re.compile(r'"root_url"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+# これ以上のキャッシュディレクトリがある場合は並列に読み込む
+_PARALLEL_LOAD_MIN_DIRS = 4
+
+# これより大きいcache.jsonはメモリマップして読み込む（小さいファイルはread()の方が速い）
+_MMAP_THRESHOLD_BYTES = 64 * 1024
+
+
+def _load_json_file(path: Path) -> Any:
+    """
+    JSONファイルを読み込む
+
+    orjsonが利用でき、ファイルが大きい場合はメモリマップしたバッファを
+    そのまま解析し、ファイル内容をbytesにコピーしません。
+    """
+    with open(path, "rb") as f:
+        if orjson is None:
+            return json.loads(f.read())
+
+        if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    # mmapを閉じる前にバッファの参照を解放する
+                    view.release()
+
+        return orjson.loads(f.read())
+
 
 class FileRepository(WebsiteCacheRepositoryProtocol):
     """ファイルシステムベースのキャッシュリポジトリ（読み取り専用）"""
 
-    def __init__(self, cache_dir: Path = None):
+    def __init__(self, cache_dir: Path = None, cache_size: int = 512):
         """
         Args:
             cache_dir: キャッシュディレクトリ（デフォルト: ~/.cache/site2）
+            cache_size: 読み込み済みWebsiteCacheを保持する最大数（0で無効）
         """
-        self.cache_dir = cache_dir or (Path.home() / ".cache" / "site2")
+        self.cache_dir = cache_dir or _DEFAULT_CACHE_DIR
+        # 読み込み済みのLRUキャッシュ: cache_dir -> ((mtime_ns, size), WebsiteCache)
+        # find_allはスレッドから読み込むため、ロックで保護する
+        self.cache_size = cache_size
+        self._website_cache: OrderedDict = OrderedDict()
+        self._website_cache_lock = threading.Lock()
+        # ルートURL → キャッシュディレクトリの索引（cache_dirのmtimeが変わったら再構築）
+        self._url_index: Dict[str, Path] = {}
+        self._url_index_mtime_ns: Optional[int] = None
 
     def find_by_url(self, url: WebsiteURL) -> Optional[WebsiteCache]:
         """
@@ -35,26 +107,19 @@ class FileRepository(WebsiteCacheRepositoryProtocol):
         Returns:
             Optional[WebsiteCache]: 見つかった場合はWebsiteCache、なければNone
         """
-        logger.debug(f"Searching cache for URL: {url}")
-
-        if not self.cache_dir.exists():
-            logger.debug(f"Cache directory does not exist: {self.cache_dir}")
-            return None
-
-        # すべてのキャッシュディレクトリを検索
-        for cache_dir in self.cache_dir.iterdir():
-            if not cache_dir.is_dir():
-                continue
+        logger.debug("Searching cache for URL: {}", url)
 
-            if cache_dir.name.startswith("."):
-                continue
+        url_str = str(url.value)
+        cache_dir = self._get_url_index().get(url_str)
 
+        # 索引で見つかったディレクトリだけcache.jsonをすべて読み込む
+        if cache_dir is not None:
             cache = self._load_cache_from_directory(cache_dir)
-            if cache and str(cache.root_url.value) == str(url.value):
-                logger.info(f"Found cache for {url} in {cache_dir}")
+            if cache and str(cache.root_url.value) == url_str:
+                logger.info("Found cache for {} in {}", url, cache_dir)
                 return cache
 
-        logger.debug(f"No cache found for URL: {url}")
+        logger.debug("No cache found for URL: {}", url)
         return None
 
     def find_all(self) -> List[WebsiteCache]:
@@ -66,26 +131,200 @@ class FileRepository(WebsiteCacheRepositoryProtocol):
         """
         logger.debug("Loading all caches")
 
-        if not self.cache_dir.exists():
-            logger.debug(f"Cache directory does not exist: {self.cache_dir}")
-            return []
+        cache_dirs = list(self._iter_cache_directories())
 
-        caches = []
+        # すべてのキャッシュディレクトリを読み込み（ディレクトリごとに独立しているため並列化）
+        if len(cache_dirs) < _PARALLEL_LOAD_MIN_DIRS:
+            loaded = [self._load_cache_from_directory(d) for d in cache_dirs]
+        else:
+            max_workers = min(32, (os.cpu_count() or 1) * 4, len(cache_dirs))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                loaded = list(executor.map(self._load_cache_from_directory, cache_dirs))
 
-        # すべてのキャッシュディレクトリを読み込み
-        for cache_dir in self.cache_dir.iterdir():
-            if not cache_dir.is_dir():
-                continue
+        caches = [cache for cache in loaded if cache]
 
-            if cache_dir.name.startswith("."):
-                continue
+        logger.info("Found {} cached websites", len(caches))
+        return caches
 
-            cache = self._load_cache_from_directory(cache_dir)
-            if cache:
-                caches.append(cache)
+    def list_summaries(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        集約インデックス（index.json）からキャッシュ一覧の要約を取得
 
-        logger.info(f"Found {len(caches)} cached websites")
-        return caches
+        各キャッシュのcache.jsonは読み込みません。インデックスに記録された
+        ディレクトリと実際のキャッシュディレクトリが一致しない場合は古いとみなします。
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: 要約のリスト、インデックスがない・古い場合はNone
+        """
+        try:
+            index = _load_json_file(self.cache_dir / _INDEX_FILE)
+            rows = index["caches"]
+            indexed_dirs = {row["directory"] for row in rows}
+        except FileNotFoundError:
+            logger.debug("Cache index not found in {}", self.cache_dir)
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Invalid cache index in {self.cache_dir}: {e}")
+            return None
+
+        cache_dirs = {
+            cache_dir.name
+            for cache_dir in self._iter_cache_directories()
+            if (cache_dir / "cache.json").exists()
+        }
+        if indexed_dirs != cache_dirs:
+            logger.debug("Cache index is out of date")
+            return None
+
+        return [
+            {key: value for key, value in row.items() if key != "directory"}
+            for row in rows
+        ]
+
+    def _get_url_index(self) -> Dict[str, Path]:
+        """
+        ルートURLからキャッシュディレクトリへの索引を取得
+
+        キャッシュディレクトリの追加・削除でcache_dirのmtimeが変わるため、
+        mtimeが同じ間は前回の索引を再利用します。
+        """
+        try:
+            mtime_ns = self.cache_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            logger.debug("Cache directory does not exist: {}", self.cache_dir)
+            return {}
+
+        if mtime_ns != self._url_index_mtime_ns:
+            index = {}
+            complete = True
+            for cache_dir in self._iter_cache_directories():
+                root_url = self._read_root_url(cache_dir)
+                if root_url is None:
+                    # 作成途中のキャッシュの可能性があるため、次回も再走査する
+                    complete = False
+                    continue
+                index.setdefault(root_url, cache_dir)
+            self._url_index = index
+            self._url_index_mtime_ns = mtime_ns if complete else None
+
+        return self._url_index
+
+    def _read_root_url(self, cache_dir: Path) -> Optional[str]:
+        """
+        cache.jsonをすべて解析せずにキャッシュのルートURLを読み込む
+
+        Args:
+            cache_dir: キャッシュディレクトリ
+
+        Returns:
+            Optional[str]: ルートURL、読み込めない場合はNone
+        """
+        try:
+            return (cache_dir / _ROOT_URL_FILE).read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to read {_ROOT_URL_FILE} in {cache_dir}: {e}")
+
+        # root_url.txtがない古いキャッシュはcache.jsonから必要な部分だけを読む
+        try:
+            root_url = self._peek_root_url(cache_dir / "cache.json")
+        except OSError:
+            return None
+        if root_url is not None:
+            return root_url
+
+        # 部分的に読めない場合はcache.json全体を読み込む
+        cache = self._load_cache_from_directory(cache_dir)
+        return str(cache.root_url.value) if cache else None
+
+    def _peek_root_url(self, metadata_file: Path) -> Optional[str]:
+        """
+        cache.jsonのpagesを解析せずにroot_urlだけを読み込む
+
+        先頭の数KBから探し、見つからない場合はijsonがあれば逐次解析します。
+
+        Args:
+            metadata_file: cache.jsonのパス
+
+        Returns:
+            Optional[str]: root_url、部分的な読み込みで見つからない場合はNone
+
+        Raises:
+            OSError: ファイルが読み込めない場合
+        """
+        with open(metadata_file, "rb") as f:
+            head = f.read(_ROOT_URL_SNIFF_BYTES)
+            match = _ROOT_URL_RE.search(head.decode("utf-8", errors="ignore"))
+            if match:
+                try:
+                    return json.loads(match.group(1))
+                except ValueError:
+                    pass
+
+            if ijson is None:
+                return None
+
+            f.seek(0)
+            try:
+                root_url = next(ijson.items(f, "root_url"), None)
+            except ijson.JSONError:
+                return None
+            return root_url if isinstance(root_url, str) else None
+
+    def _iter_cache_directories(self) -> Iterator[Path]:
+        """
+        キャッシュディレクトリを列挙（隠しディレクトリとファイルは除外）
+
+        os.scandirのエントリが持つ種別情報を使うため、エントリごとのstatは不要です。
+        """
+        try:
+            entries = os.scandir(self.cache_dir)
+        except (FileNotFoundError, NotADirectoryError):
+            logger.debug("Cache directory does not exist: {}", self.cache_dir)
+            return
+
+        with entries:
+            for entry in entries:
+                if entry.name[:1] == ".":
+                    continue
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                yield Path(entry.path)
+
+    def _build_cached_pages(
+        self, cache_dir: Path, pages_data: List[Dict[str, Any]]
+    ) -> List[CachedPage]:
+        """
+        cache.jsonのページ情報からCachedPageを作成（読み込めないページは警告してスキップ）
+
+        ページ数が多いキャッシュでも速く読み込めるよう、ループ内で使う
+        クラスや関数はローカル変数に束縛しています。
+        """
+        make_url = WebsiteURL
+        make_page = CachedPage
+        parse_datetime = datetime.fromisoformat
+        join_path = cache_dir.joinpath
+
+        pages = []
+        append = pages.append
+        for page_data in pages_data:
+            try:
+                get = page_data.get
+                append(
+                    make_page(
+                        page_url=make_url(value=page_data["url"]),
+                        local_path=join_path(page_data["local_path"]),
+                        content_type=get("content_type", "text/html"),
+                        size_bytes=get("size_bytes", 0),
+                        fetched_at=parse_datetime(page_data["fetched_at"]),
+                    )
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to load page {page_data.get('url', 'unknown')}: {e}"
+                )
+        return pages
 
     def _load_cache_from_directory(self, cache_dir: Path) -> Optional[WebsiteCache]:
         """
@@ -99,14 +338,20 @@ class FileRepository(WebsiteCacheRepositoryProtocol):
         """
         metadata_file = cache_dir / "cache.json"
 
-        if not metadata_file.exists():
-            logger.warning(f"cache.json not found in {cache_dir}")
-            return None
-
         try:
+            # cache.jsonが前回から変わっていなければ解析済みのキャッシュを返す
+            cache_key = None
+            if self.cache_size > 0:
+                stat = metadata_file.stat()
+                cache_key = (stat.st_mtime_ns, stat.st_size)
+                with self._website_cache_lock:
+                    cached = self._website_cache.get(cache_dir)
+                    if cached is not None and cached[0] == cache_key:
+                        self._website_cache.move_to_end(cache_dir)
+                        return cached[1]
+
             # メタデータを読み込み
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                metadata = json.load(f)
+            metadata = _load_json_file(metadata_file)
 
             # 必須フィールドの確認
             if "root_url" not in metadata or "pages" not in metadata:
@@ -119,28 +364,7 @@ class FileRepository(WebsiteCacheRepositoryProtocol):
             root_url = WebsiteURL(value=metadata["root_url"])
 
             # CachedPageリストの作成
-            pages = []
-            for page_data in metadata["pages"]:
-                try:
-                    page_url = WebsiteURL(value=page_data["url"])
-                    local_path = cache_dir / page_data["local_path"]
-
-                    # CachedPageを作成
-                    cached_page = CachedPage(
-                        page_url=page_url,
-                        local_path=local_path,
-                        content_type=page_data.get("content_type", "text/html"),
-                        size_bytes=page_data.get("size_bytes", 0),
-                        fetched_at=datetime.fromisoformat(page_data["fetched_at"]),
-                    )
-
-                    pages.append(cached_page)
-
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to load page {page_data.get('url', 'unknown')}: {e}"
-                    )
-                    continue
+            pages = self._build_cached_pages(cache_dir, metadata["pages"])
 
             # WebsiteCacheの作成
             cache = WebsiteCache(
@@ -150,8 +374,18 @@ class FileRepository(WebsiteCacheRepositoryProtocol):
                 created_at=datetime.fromisoformat(metadata["created_at"]),
             )
 
+            if cache_key is not None:
+                with self._website_cache_lock:
+                    self._website_cache[cache_dir] = (cache_key, cache)
+                    self._website_cache.move_to_end(cache_dir)
+                    if len(self._website_cache) > self.cache_size:
+                        self._website_cache.popitem(last=False)
+
             return cache
 
+        except FileNotFoundError:
+            logger.warning(f"cache.json not found in {cache_dir}")
+            return None
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in {metadata_file}: {e}")
             return None
@@ -0,0 +1,122 @@
+"""
+処理結果をJSONファイルとして保存するキャッシュ
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Type, Union
+
+from loguru import logger
+from pydantic import BaseModel
+
+from ...core.ports.detect_contracts import ModelT
+
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    _hasher = None
+
+
+class JsonResultCache:
+    """
+    処理結果（pydanticモデル）をキーごとのJSONファイルに保存するキャッシュ
+
+    書き込みは一時ファイルからの置き換えでアトミックに行うため、
+    複数のプロセスから同じディレクトリを使用できます。
+    """
+
+    def __init__(self, cache_dir: Path, label: str = "result"):
+        """
+        Args:
+            cache_dir: キャッシュディレクトリ
+            label: ログに表示するキャッシュの名前
+        """
+        self.cache_dir = Path(cache_dir)
+        self.label = label
+
+    def make_key(self, *parts: Union[str, bytes]) -> str:
+        """
+        キーの構成要素のハッシュからキャッシュキーを生成
+
+        Args:
+            *parts: キーの構成要素（HTMLの内容・設定など）
+
+        Returns:
+            str: キャッシュキー
+        """
+        hasher = _hasher() if _hasher is not None else hashlib.blake2b(digest_size=16)
+        for part in parts:
+            hasher.update(part.encode("utf-8") if isinstance(part, str) else part)
+            hasher.update(b"\0")
+        return hasher.hexdigest()[:32]
+
+    def load(self, key: str, model_class: Type[ModelT]) -> Optional[ModelT]:
+        """
+        キャッシュから処理結果を読み込み
+
+        Args:
+            key: キャッシュキー
+            model_class: 処理結果のモデルクラス
+
+        Returns:
+            Optional[ModelT]: 処理結果（キャッシュがない、または壊れている場合はNone）
+        """
+        cache_path = self._path(key)
+        try:
+            return model_class.model_validate_json(cache_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring broken {self.label} cache {cache_path}: {e}")
+            return None
+
+    def store(self, key: str, result: BaseModel) -> None:
+        """
+        処理結果をキャッシュに書き込み（一時ファイルからの置き換えでアトミックに行う）
+
+        Args:
+            key: キャッシュキー
+            result: 処理結果
+        """
+        cache_path = self._path(key)
+        temp_path: Optional[str] = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=cache_path.parent, delete=False
+            ) as f:
+                temp_path = f.name
+                f.write(result.model_dump_json())
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            # 書き込みや置き換えに失敗した一時ファイルを残さない
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+            logger.warning(f"Failed to write {self.label} cache {cache_path}: {e}")
+
+    def _path(self, key: str) -> Path:
+        """キャッシュキーに対応するファイルのパス"""
+        return self.cache_dir / f"{key}.json"
+
+
+def create_result_cache(
+    cache_dir: Optional[Path], label: str = "result"
+) -> Optional[JsonResultCache]:
+    """
+    キャッシュディレクトリが指定されている場合のみキャッシュを作成
+
+    Args:
+        cache_dir: キャッシュディレクトリ（Noneの場合はキャッシュしない）
+        label: ログに表示するキャッシュの名前
+
+    Returns:
+        Optional[JsonResultCache]: キャッシュ（無効の場合はNone）
+    """
+    if cache_dir is None:
+        return None
+    return JsonResultCache(cache_dir, label)
@@ -24,6 +24,8 @@ class RepositoryFactory:
         """
         リポジトリを作成
 
+        呼び出しごとに新しいインスタンスを作成します。共有はDIコンテナのSingletonで行います。
+
         Args:
             method: リポジトリの種類 ("file", "redis", "database")
             **kwargs: リポジトリの初期化引数
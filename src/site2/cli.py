@@ -3,28 +3,22 @@
 site2 CLI - Convert websites to Markdown/PDF
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional
 from pathlib import Path
 import sys
+from urllib.parse import urlparse
 
 import typer
-from loguru import logger
-from pydantic import HttpUrl
-from rich import print as rprint
-from rich.console import Console
-from rich.table import Table
-
-from .core.containers import Container
-from .core.domain.fetch_domain import CrawlDepth
-from .core.ports.fetch_contracts import (
-    CachePermissionError,
-    FetchError,
-    FetchRequest,
-    InvalidURLError,
-    NetworkError,
-)
 from enum import Enum
 
+# --help や --version の起動を速くするため、rich・pydantic・loguru・DIコンテナは
+# 実際に使うコマンドの中で読み込む
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from .core.containers import Container
+
 # Typerアプリケーションとコンソール
 app = typer.Typer(
     name="site2",
@@ -32,10 +26,55 @@ app = typer.Typer(
     add_completion=False,
     rich_markup_mode="rich",
 )
-console = Console()
 
-# グローバルコンテナ（main()で初期化）
-container: Optional[Container] = None
+
+@lru_cache(maxsize=None)
+def _get_console() -> "Console":
+    """最初の出力時にrichのConsoleを作成"""
+    from rich.console import Console
+
+    return Console()
+
+
+class _ConsoleProxy:
+    """属性アクセスを遅延作成したConsoleに委譲するプロキシ"""
+
+    def __getattr__(self, name: str):
+        return getattr(_get_console(), name)
+
+
+console = _ConsoleProxy()
+
+
+def _is_http_url(uri: str) -> bool:
+    """
+    URLの簡易チェック（明らかに無効なURLはpydanticやDIコンテナを読み込む前に弾く）
+
+    Args:
+        uri: チェックするURI
+
+    Returns:
+        bool: ホスト名を持つhttp(s)のURLで、空白を含まない場合はTrue
+    """
+    if any(c.isspace() for c in uri):
+        return False
+    try:
+        parsed = urlparse(uri)
+        return parsed.scheme.lower() in ("http", "https") and bool(parsed.hostname)
+    except ValueError:
+        return False
+
+
+# グローバルコンテナ（最初に必要になった時点で初期化）
+container: Optional["Container"] = None
+
+
+def _get_container() -> "Container":
+    """グローバルコンテナを取得（未初期化の場合は作成）"""
+    global container
+    if container is None:
+        container = setup_container()
+    return container
 
 
 class OutputFormat(str, Enum):
@@ -51,7 +90,8 @@ def version_callback(value: bool):
         try:
             from . import __version__
 
-            console.print(f"site2 version {__version__}")
+            # 装飾が不要なのでrichを読み込まずに出力する
+            typer.echo(f"site2 version {__version__}")
         except ImportError:
             console.print("[red]Version information not found.[/red]")
         raise typer.Exit()
@@ -87,6 +127,10 @@ def auto(
     """Convert website to single markdown or PDF file and output to specified file."""
     from pathlib import Path
 
+    if not _is_http_url(uri):
+        console.print(f"❌ Error: Invalid URL: {uri}")
+        sys.exit(1)
+
     try:
         # 出力パスの検証
         output_path = Path(output)
@@ -95,11 +139,8 @@ def auto(
         ):
             console.print("Operation cancelled.")
             sys.exit(0)
-        # DIコンテナの初期化
-        from .core.containers import Container
-
-        container = Container()
-        container.config.from_dict({})
+        # DIコンテナの取得（プロセス内で1つのコンテナを共有）
+        container = _get_container()
 
         # 各サービスの取得
         fetch_service = container.fetch_service()
@@ -200,16 +241,9 @@ def auto(
             options={},
         )
 
+        # 6. ファイルへの出力（output_pathを指定しているのでBuildServiceが保存する）
         build_result = build_service.build(build_request)
 
-        # 6. ファイルへの出力
-        if isinstance(build_result.content, str):
-            # Markdownの場合
-            output_path.write_text(build_result.content, encoding="utf-8")
-        else:
-            # PDFの場合
-            output_path.write_bytes(build_result.content)
-
         # 成功メッセージと統計情報の出力
         stats = build_result.statistics
         console.print(f"✅ Generated {build_format.value}: {output_path}")
@@ -223,32 +257,27 @@ def auto(
         sys.exit(1)
 
 
-def _find_index_file(cached_files: list) -> Path:
+def _find_index_file(cached_files: List[Path]) -> Optional[Path]:
     """
     インデックスファイルを検索
 
     Args:
-        cached_files: キャッシュされたファイルのリスト
+        cached_files: キャッシュされたファイルのリスト（FetchResult.cached_files）
 
     Returns:
         Path: インデックスファイルのパス（見つからない場合はNone）
     """
-
-    # index.html を優先的に検索
-    for file_path in cached_files:
-        if isinstance(file_path, str):
-            file_path = Path(file_path)
-        if file_path.name.lower() == "index.html":
-            return file_path
-
-    # index.html が見つからない場合は最初の .html ファイルを使用
+    # index.html を優先し、見つからない場合は最初の .html ファイルを使用する
+    # （1回の走査で両方を判定）
+    first_html = None
     for file_path in cached_files:
-        if isinstance(file_path, str):
-            file_path = Path(file_path)
-        if file_path.suffix.lower() == ".html":
+        name = file_path.name.lower()
+        if name == "index.html":
             return file_path
+        if first_html is None and name.endswith(".html"):
+            first_html = file_path
 
-    return None
+    return first_html
 
 
 @app.command("fetch")
@@ -273,7 +302,22 @@ def fetch_command(
     ),
 ) -> None:
     """Webサイトをフェッチしてキャッシュする"""
-    fetch_service = container.fetch_service()
+    if not _is_http_url(uri):
+        console.print(f"[red]Error: 無効なURL: {uri}[/red]")
+        raise typer.Exit(1)
+
+    from pydantic import HttpUrl
+
+    from .core.domain.fetch_domain import CrawlDepth
+    from .core.ports.fetch_contracts import (
+        CachePermissionError,
+        FetchError,
+        FetchRequest,
+        InvalidURLError,
+        NetworkError,
+    )
+
+    fetch_service = _get_container().fetch_service()
 
     try:
         # URLの検証
@@ -292,22 +336,26 @@ def fetch_command(
             )
             result = fetch_service.fetch(request)
 
-        # 成功メッセージ
-        rprint("\n[bold green]✓[/bold green] Fetch completed successfully!")
-        rprint(f"  [cyan]Cache ID:[/cyan] {result.cache_id}")
-        rprint(f"  [cyan]Root URL:[/cyan] {result.root_url}")
-        rprint(f"  [cyan]Pages Fetched:[/cyan] {result.pages_fetched}")
-        rprint(f"  [cyan]Pages Updated:[/cyan] {result.pages_updated}")
-        rprint(f"  [cyan]Total Size:[/cyan] {result.total_size:,} bytes")
-        rprint(f"  [cyan]Cache Directory:[/cyan] {result.cache_directory}")
+        # 成功メッセージ（マークアップの解析と出力を1回で済ませる）
+        lines = [
+            "\n[bold green]✓[/bold green] Fetch completed successfully!",
+            f"  [cyan]Cache ID:[/cyan] {result.cache_id}",
+            f"  [cyan]Root URL:[/cyan] {result.root_url}",
+            f"  [cyan]Pages Fetched:[/cyan] {result.pages_fetched}",
+            f"  [cyan]Pages Updated:[/cyan] {result.pages_updated}",
+            f"  [cyan]Total Size:[/cyan] {result.total_size:,} bytes",
+            f"  [cyan]Cache Directory:[/cyan] {result.cache_directory}",
+        ]
 
         # 警告があれば表示
         if result.errors:
-            rprint("\n[yellow]⚠ Warnings:[/yellow]")
-            for error in result.errors:
-                rprint(
-                    f"  -{error.get('url', 'Unknown')}: {error.get('message', 'Unknown error')}"
-                )
+            lines.append("\n[yellow]⚠ Warnings:[/yellow]")
+            lines.extend(
+                f"  -{error.get('url', 'Unknown')}: {error.get('message', 'Unknown error')}"
+                for error in result.errors
+            )
+
+        console.print("\n".join(lines), highlight=False)
 
     except InvalidURLError as e:
         console.print(f"[red]Error: 無効なURL - {str(e)}[/red]")
@@ -324,26 +372,31 @@ def fetch_command(
         console.print(f"[red]Error: フェッチエラー - {str(e)}[/red]")
         raise typer.Exit(4)
     except Exception as e:
+        from loguru import logger
+
         logger.exception(f"An unexpected error occurred: {e}")
         console.print(f"[red]Unexpected error: {str(e)}[/red]")
         raise typer.Exit(5)
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def _format_size(size_bytes: int) -> str:
     """バイトサイズを人間が読みやすい形式に変換"""
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    # 1024 = 2**10 なので、ビット長から単位を直接求める
+    index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
 
 
 @app.command("fetch:list")
 def fetch_list_command() -> None:
     """キャッシュ済みサイトの一覧を表示"""
-    fetch_service = container.fetch_service()
+    from rich.table import Table
+
+    fetch_service = _get_container().fetch_service()
 
     try:
         # キャッシュ一覧を取得
@@ -401,6 +454,8 @@ def fetch_list_command() -> None:
         )
 
     except Exception as e:
+        from loguru import logger
+
         logger.exception(f"Failed to list caches: {e}")
         console.print(
             f"[red]Error: キャッシュ一覧の取得に失敗しました - {str(e)}[/red]"
@@ -416,11 +471,8 @@ def detect_main(
     import json
 
     try:
-        # DIコンテナの初期化
-        from .core.containers import Container
-
-        container = Container()
-        container.config.from_dict({})
+        # DIコンテナの取得（プロセス内で1つのコンテナを共有）
+        container = _get_container()
 
         # サービスの取得
         fetch_service = container.fetch_service()
@@ -474,11 +526,8 @@ def detect_nav(
     import json
 
     try:
-        # DIコンテナの初期化
-        from .core.containers import Container
-
-        container = Container()
-        container.config.from_dict({})
+        # DIコンテナの取得（プロセス内で1つのコンテナを共有）
+        container = _get_container()
 
         # サービスの取得
         fetch_service = container.fetch_service()
@@ -528,11 +577,8 @@ def detect_order(
     import json
 
     try:
-        # DIコンテナの初期化
-        from .core.containers import Container
-
-        container = Container()
-        container.config.from_dict({})
+        # DIコンテナの取得（プロセス内で1つのコンテナを共有）
+        container = _get_container()
 
         # サービスの取得
         fetch_service = container.fetch_service()
@@ -585,11 +631,8 @@ def build(
     from pathlib import Path
 
     try:
-        # DIコンテナの初期化
-        from .core.containers import Container
-
-        container = Container()
-        container.config.from_dict({})
+        # DIコンテナの取得（プロセス内で1つのコンテナを共有）
+        container = _get_container()
 
         # サービスの取得
         build_service = container.build_service()
@@ -650,13 +693,11 @@ def build(
         # ビルド実行
         build_result = build_service.build(build_request)
 
-        # 標準出力への出力
-        if isinstance(build_result.content, str):
-            # Markdownの場合
-            sys.stdout.write(build_result.content)
-        else:
-            # PDFの場合
-            sys.stdout.buffer.write(build_result.content)
+        # 標準出力への出力（コンテンツ全体をエンコードしたコピーを作らない）
+        sys.stdout.flush()
+        for chunk in build_result.iter_chunks():
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
 
         # 統計情報の出力（stderr）
         stats = build_result.statistics
@@ -670,26 +711,24 @@ def build(
         sys.exit(1)
 
 
-def setup_container() -> Container:
-    """DIコンテナの設定"""
-    container = Container()
-    return container
+def setup_container() -> "Container":
+    """DIコンテナの設定（create_appでコンテナとログ設定を初期化）"""
+    from .app import create_app
+
+    return create_app(test_mode=False)
 
 
 def main():
     """メインエントリーポイント"""
-    global container
-
     try:
-        # コンテナの初期化
-        container = setup_container()
-
-        # CLIアプリケーションの実行
+        # CLIアプリケーションの実行（コンテナはコマンドの中で必要になった時点で作成）
         app()
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted by user[/yellow]")
         raise typer.Exit(130)
     except Exception as e:
+        from loguru import logger
+
         logger.exception(f"A fatal error occurred: {e}")
         console.print(f"[bold red]Fatal error:[/bold red] {str(e)}")
         raise typer.Exit(1)
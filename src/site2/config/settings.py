@@ -4,6 +4,8 @@
 pydantic-settingsを使用した環境変数対応の設定システム
 """
 
+import os
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -17,17 +19,27 @@ class Settings(BaseSettings):
     cache_duration_hours: int = 24
 
     # クローラー設定
+    # "wget" または "aiohttp"（aiohttpは crawler extra が必要。SITE2_CRAWLER_METHOD で切り替え）
+    crawler_method: str = "wget"
     wget_timeout: int = 30  # 各ページ取得のタイムアウト（秒）
     max_depth: int = 10
     user_agent: str = "site2/1.0"
     crawl_delay: float = 1.0  # 秒
 
+    # パーサー設定（BeautifulSoupのツリービルダー。lxmlが使えない場合はhtml.parser）
+    parser_backend: str = "lxml"
+
+    # 検出設定（順序検出でHTMLを並列に解析するプロセス数）
+    detect_workers: int = os.cpu_count() or 1
+    detect_cache_enabled: bool = False  # 同一内容のHTMLの検出結果を再利用
+
     # 変換設定
     markdown_extensions: List[str] = ["extra", "codehilite", "toc"]
     pdf_options: Dict[str, Any] = {
         "format": "A4",
         "margin": {"top": "1cm", "right": "1cm", "bottom": "1cm", "left": "1cm"},
     }
+    markdown_cache_enabled: bool = False  # 同一内容のHTMLの変換結果を再利用
 
     # ログ設定
     log_level: str = "INFO"
@@ -70,6 +82,18 @@ class Settings(BaseSettings):
             return self.cache_dir / subdirectory
         return self.cache_dir
 
+    def get_markdown_cache_dir(self) -> Optional[Path]:
+        """Markdown変換結果のキャッシュディレクトリを取得（無効の場合はNone）"""
+        if not self.markdown_cache_enabled:
+            return None
+        return self.get_cache_path("markdown")
+
+    def get_detect_cache_dir(self) -> Optional[Path]:
+        """メインコンテンツ検出結果のキャッシュディレクトリを取得（無効の場合はNone）"""
+        if not self.detect_cache_enabled:
+            return None
+        return self.get_cache_path("detect")
+
     def get_log_config(self) -> Dict[str, Any]:
         """ログ設定を取得"""
         return {
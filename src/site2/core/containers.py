@@ -9,6 +9,7 @@ from dependency_injector import containers, providers
 from ..config.settings import Settings
 
 # Factoryクラスをインポート
+from ..adapters.storage.json_result_cache import create_result_cache
 from ..adapters.storage.repository_factory import RepositoryFactory
 from ..adapters.crawlers.crawler_factory import CrawlerFactory
 from ..adapters.parsers.parser_factory import ParserFactory
@@ -34,27 +35,29 @@ class Container(containers.DeclarativeContainer):
         Settings,
     )
 
-    # リポジトリ層
-    website_cache_repository = providers.Factory(
+    # リポジトリ層（ロックでキャッシュを保護しているため共有する）
+    website_cache_repository = providers.Singleton(
         RepositoryFactory.create,
         method="file",
         cache_dir=settings.provided.cache_dir,
     )
 
     # パーサー層 (Adapters)
-    encoding_detector = providers.Factory(
+    # 状態を持たない（またはキャッシュのみを持つ）ため1つのインスタンスを共有する
+    encoding_detector = providers.Singleton(
         ParserFactory.create_encoding_detector,
-        method="chardet",
+        method="auto",
     )
-    html_parser = providers.Factory(
+    html_parser = providers.Singleton(
         ParserFactory.create_parser,
         method="beautifulsoup",
+        parser=settings.provided.parser_backend,
     )
-    html_analyzer = providers.Factory(
+    html_analyzer = providers.Singleton(
         ParserFactory.create_analyzer,
         method="beautifulsoup",
     )
-    llm_preprocessor = providers.Factory(
+    llm_preprocessor = providers.Singleton(
         ParserFactory.create_preprocessor,
         method="llm",
     )
@@ -74,9 +77,10 @@ class Container(containers.DeclarativeContainer):
     )
 
     # インフラストラクチャ層
-    web_crawler = providers.Factory(
+    # 設定のみを保持するためアプリケーション全体で1つのインスタンスを共有
+    web_crawler = providers.Singleton(
         CrawlerFactory.create,
-        method="wget",
+        method=settings.provided.crawler_method,
         timeout=settings.provided.wget_timeout,
         user_agent=settings.provided.user_agent,
         delay=settings.provided.crawl_delay,
@@ -90,17 +94,27 @@ class Container(containers.DeclarativeContainer):
         cache_dir=settings.provided.cache_dir,
     )
 
+    # メインコンテンツ検出結果のキャッシュ（無効の場合はNone）
+    detect_result_cache = providers.Singleton(
+        create_result_cache,
+        cache_dir=settings.provided.get_detect_cache_dir.call(),
+        label="detection",
+    )
+
     detect_service = providers.Factory(
         DetectService,
         html_parser=html_parser,
         html_analyzer=html_analyzer,
         main_content_detector=main_content_detector,
+        max_workers=settings.provided.detect_workers,
+        result_cache=detect_result_cache,
     )
 
     # コンバーター層
     markdown_converter = providers.Factory(
         MarkdownifyConverter,
         config=providers.Dict(DEFAULT_MARKDOWNIFY_CONFIG),
+        cache_dir=settings.provided.get_markdown_cache_dir.call(),
     )
 
     pdf_converter = providers.Factory(
@@ -38,12 +38,12 @@ def setup_logging(
     # 既存のハンドラを削除
     logger.remove()
 
-    # コンソール出力
+    # コンソール出力（色付けは端末に出力する場合のみ）
     logger.add(
         sys.stderr,
         level=level,
         format=format_str,
-        colorize=True,
+        colorize=sys.stderr.isatty(),
         diagnose=debug,
         backtrace=debug,
     )
@@ -2,7 +2,16 @@
 site2 build機能の契約定義（Contract-First Development）
 """
 
-from typing import Protocol, List, Optional, Dict, Any, Union, runtime_checkable
+from typing import (
+    Protocol,
+    Iterator,
+    List,
+    Optional,
+    Dict,
+    Any,
+    Union,
+    runtime_checkable,
+)
 from pathlib import Path
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
@@ -17,6 +26,9 @@ from ..domain.build_domain import (
 )
 from ..domain.detect_domain import OrderedFile, DocumentOrder
 
+# iter_chunksが一度に返す最大の文字数（PDFの場合はバイト数）
+_CHUNK_SIZE = 1 << 20
+
 
 # DTOs (Data Transfer Objects) - 外部とのやり取り用
 class BuildRequest(BaseModel):
@@ -100,6 +112,32 @@ class BuildResult(BaseModel):
             raise ValueError(f"Output directory must exist: {v.parent}")
         return v
 
+    def iter_chunks(
+        self, chunk_size: int = _CHUNK_SIZE
+    ) -> Iterator[Union[bytes, memoryview]]:
+        """
+        生成コンテンツを書き出し用のバイト列に分割して返す
+
+        コンテンツ全体をエンコードしたコピーを作らずに出力できるように、
+        Markdownはchunk_size文字ごとにUTF-8でエンコードしたbytesを、
+        PDFはコピーせずにmemoryviewのスライスを返します。
+
+        Args:
+            chunk_size: 1チャンクあたりの文字数（PDFの場合はバイト数）
+
+        Returns:
+            Iterator[Union[bytes, memoryview]]: コンテンツのチャンク
+                （Markdownはbytes、PDFはmemoryview）
+        """
+        content = self.content
+        if isinstance(content, str):
+            for start in range(0, len(content), chunk_size):
+                yield content[start : start + chunk_size].encode("utf-8")
+        else:
+            view = memoryview(content)
+            for start in range(0, len(view), chunk_size):
+                yield view[start : start + chunk_size]
+
 
 # サービスインターフェース（ポート）
 @runtime_checkable
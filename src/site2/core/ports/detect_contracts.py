@@ -2,7 +2,7 @@
 site2 detect機能の契約定義（Contract-First Development）
 """
 
-from typing import Protocol, List, Optional, TYPE_CHECKING
+from typing import Protocol, List, Optional, Type, TypeVar, Union, TYPE_CHECKING
 from pathlib import Path
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
@@ -14,6 +14,8 @@ from ..domain.detect_domain import SelectorCandidate, NavLink, OrderedFile
 if TYPE_CHECKING:
     from ..domain.detect_domain import Navigation
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 # DTOs (Data Transfer Objects) - 外部とのやり取り用
 class DetectMainRequest(BaseModel):
@@ -219,6 +221,38 @@ class MainContentDetectorProtocol(Protocol):
         ...
 
 
+# キャッシュインターフェース（ポート）
+class ResultCacheProtocol(Protocol):
+    """処理結果（pydanticモデル）のキャッシュの契約"""
+
+    def make_key(self, *parts: Union[str, bytes]) -> str:
+        """
+        キーの構成要素からキャッシュキーを生成
+
+        事後条件:
+        - 同じ構成要素からは同じキーが返される
+        """
+        ...
+
+    def load(self, key: str, model_class: Type[ModelT]) -> Optional[ModelT]:
+        """
+        キャッシュから処理結果を読み込み
+
+        事後条件:
+        - キャッシュがない、または読み込めない場合はNoneを返す
+        """
+        ...
+
+    def store(self, key: str, result: BaseModel) -> None:
+        """
+        処理結果をキャッシュに書き込み
+
+        事後条件:
+        - 書き込みに失敗しても例外を送出しない
+        """
+        ...
+
+
 # サービスインターフェース（ポート）
 class DetectServiceProtocol(Protocol):
     """Detectサービスの契約"""
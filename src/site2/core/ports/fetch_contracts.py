@@ -139,6 +139,19 @@ class WebsiteCacheRepositoryProtocol(Protocol):
         """
         ...
 
+    def list_summaries(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        集約インデックスからキャッシュ一覧の要約を取得
+
+        事前条件:
+        - なし
+
+        事後条件:
+        - インデックスが最新の場合は要約（id, url, page_count, total_size, last_updated）のリストを返す
+        - インデックスが存在しない、または古い場合はNoneを返す
+        """
+        ...
+
 
 # クローラーインターフェース（ポート）
 class WebCrawlerProtocol(Protocol):
@@ -3,7 +3,7 @@ HTML Parser Contracts
 """
 
 from pathlib import Path
-from typing import Any, List, Optional, Protocol
+from typing import Any, Dict, Iterable, List, Optional, Protocol
 
 from pydantic import BaseModel, Field
 
@@ -35,6 +35,8 @@ class DetectionError(ParserError):
 class ParseRequest(BaseModel):
     file_path: Path
     encoding: Optional[str] = None
+    # SoupStrainer object or preset name ("content", "metadata"); None parses everything
+    strain: Any = None
 
 
 class ParseResult(BaseModel):
@@ -97,6 +99,8 @@ class HTMLAnalyzerProtocol(Protocol):
 
     def calculate_text_density(self, element: Any) -> float: ...
 
+    def count_children(self, element: Any, names: Iterable[str]) -> Dict[str, int]: ...
+
 
 class HTMLPreprocessorProtocol(Protocol):
     def preprocess_for_llm(self, soup: Any, max_length: int = 50000) -> str: ...
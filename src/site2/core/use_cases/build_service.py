@@ -31,6 +31,9 @@ from ..domain.build_domain import (
 )
 from ..domain.detect_domain import OrderedFile
 
+# 出力ファイルの書き込みバッファサイズ
+_WRITE_BUFFER_BYTES = 1 << 20
+
 
 class BuildService(BuildServiceProtocol):
     """
@@ -119,7 +122,7 @@ class BuildService(BuildServiceProtocol):
 
         for ordered_file in ordered_files:
             try:
-                logger.debug(f"Extracting content from: {ordered_file.file_path}")
+                logger.debug("Extracting content from: {}", ordered_file.file_path)
 
                 # HTMLパーサーを使用してHTMLをパース
                 parse_request = ParseRequest(file_path=ordered_file.file_path)
@@ -261,7 +264,7 @@ class BuildService(BuildServiceProtocol):
             output_path=request.output_path,
             page_count=page_count,
             extracted_files=extracted_contents,
-            warnings=list(set(all_warnings)),  # 重複を除去
+            warnings=list(dict.fromkeys(all_warnings)),  # 順序を保って重複を除去
             statistics={
                 "total_files": len(extracted_contents),
                 "total_text_length": total_text_length,
@@ -357,14 +360,10 @@ class BuildService(BuildServiceProtocol):
             # 出力ディレクトリが存在しない場合は作成
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            if build_result.format == OutputFormat.MARKDOWN:
-                # Markdownの場合はテキストファイルとして保存
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(build_result.content)
-            elif build_result.format == OutputFormat.PDF:
-                # PDFの場合はバイナリファイルとして保存
-                with open(output_path, "wb") as f:
-                    f.write(build_result.content)
+            # Markdown・PDFともにチャンク単位でバイナリとして書き込む
+            with open(output_path, "wb", buffering=_WRITE_BUFFER_BYTES) as f:
+                for chunk in build_result.iter_chunks():
+                    f.write(chunk)
 
             logger.info(f"Build result saved to: {output_path}")
 
@@ -2,6 +2,11 @@
 DetectService - メインコンテンツ・ナビゲーション・順序検出サービス
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import List, Optional
+
 from loguru import logger
 
 from ..ports.detect_contracts import (
@@ -17,6 +22,7 @@ from ..ports.detect_contracts import (
     NavLink,
     OrderedFile,
     DetectError,
+    ResultCacheProtocol,
 )
 from ..ports.parser_contracts import (
     HTMLParserProtocol,
@@ -25,6 +31,59 @@ from ..ports.parser_contracts import (
     SelectorSearchRequest,
 )
 
+# 検出結果のキャッシュ形式のバージョン（検出ロジックを変えた場合は更新する）
+_CACHE_VERSION = "main_v1"
+
+# プロセスプールを使用する最小のファイル数（起動コストを回収できる規模から）
+_PARALLEL_MIN_FILES = 32
+
+# ワーカープロセスに一度に渡すファイル数
+_PARALLEL_CHUNKSIZE = 16
+
+# ワーカープロセスごとのパーサーとアナライザー（_init_order_workerで設定）
+_worker_parser = None
+_worker_analyzer = None
+
+
+def _extract_title(
+    html_parser: HTMLParserProtocol,
+    html_analyzer: HTMLAnalyzerProtocol,
+    file_path: Path,
+) -> str:
+    """
+    HTMLファイルのタイトルを抽出
+
+    Args:
+        html_parser: HTMLパーサー
+        html_analyzer: HTMLアナライザー
+        file_path: HTMLファイルのパス
+
+    Returns:
+        str: タイトル（抽出できない場合はファイル名）
+    """
+    try:
+        # タイトルだけが必要なので<title>/<meta>以外のツリーは構築しない
+        parse_request = ParseRequest(file_path=file_path, strain="metadata")
+        parse_result = html_parser.parse(parse_request)
+        metadata = html_analyzer.extract_metadata(parse_result.soup)
+        return metadata.title or file_path.stem
+    except Exception:
+        return file_path.stem
+
+
+def _init_order_worker(
+    html_parser: HTMLParserProtocol, html_analyzer: HTMLAnalyzerProtocol
+) -> None:
+    """ワーカープロセスの初期化（パーサーをファイルごとに送らずに済ませる）"""
+    global _worker_parser, _worker_analyzer
+    _worker_parser = html_parser
+    _worker_analyzer = html_analyzer
+
+
+def _extract_title_in_worker(file_path: Path) -> str:
+    """ワーカープロセス内でタイトルを抽出"""
+    return _extract_title(_worker_parser, _worker_analyzer, file_path)
+
 
 class DetectService(DetectServiceProtocol):
     """
@@ -37,16 +96,22 @@ class DetectService(DetectServiceProtocol):
         html_parser: HTMLParserProtocol,
         html_analyzer: HTMLAnalyzerProtocol,
         main_content_detector: MainContentDetectorProtocol,
+        max_workers: int = 1,
+        result_cache: Optional[ResultCacheProtocol] = None,
     ):
         """
         Args:
             html_parser: HTMLパーサー
             html_analyzer: HTMLアナライザー
             main_content_detector: メインコンテンツ検出器
+            max_workers: 順序検出でHTMLを解析するプロセス数（1の場合は逐次処理）
+            result_cache: メインコンテンツ検出結果のキャッシュ（Noneの場合はキャッシュしない）
         """
         self.html_parser = html_parser
         self.html_analyzer = html_analyzer
         self.main_detector = main_content_detector
+        self.max_workers = max_workers
+        self._result_cache = result_cache
 
     def detect_main(self, request: DetectMainRequest) -> DetectMainResult:
         """
@@ -64,6 +129,13 @@ class DetectService(DetectServiceProtocol):
         logger.info(f"Starting main content detection for: {request.file_path}")
 
         try:
+            # キャッシュにあればパースと検出を省略
+            cache_key = self._cache_key(request.file_path)
+            if cache_key is not None:
+                cached = self._load_cached_result(cache_key, request)
+                if cached is not None:
+                    return cached
+
             # HTMLファイルをパース
             parse_request = ParseRequest(file_path=request.file_path)
             parse_result = self.html_parser.parse(parse_request)
@@ -104,6 +176,9 @@ class DetectService(DetectServiceProtocol):
                 candidates=candidates,
             )
 
+            if cache_key is not None:
+                self._result_cache.store(cache_key, result)
+
             logger.info(
                 f"Main content detection completed. Confidence: {confidence:.2f}"
             )
@@ -132,7 +207,10 @@ class DetectService(DetectServiceProtocol):
 
         try:
             # HTMLファイルをパース
-            parse_request = ParseRequest(file_path=request.file_path)
+            # ナビゲーション候補のサブツリーのみを構築する
+            parse_request = ParseRequest(
+                file_path=request.file_path, strain="navigation"
+            )
             parse_result = self.html_parser.parse(parse_request)
 
             # ナビゲーション検出（実装予定）
@@ -227,17 +305,11 @@ class DetectService(DetectServiceProtocol):
                 )
 
             # 順序付きファイルを作成（現在はアルファベット順）
-            ordered_files = []
-            for i, file_path in enumerate(sorted(html_files)):
-                # タイトルを抽出
-                try:
-                    parse_request = ParseRequest(file_path=file_path)
-                    parse_result = self.html_parser.parse(parse_request)
-                    metadata = self.html_analyzer.extract_metadata(parse_result.soup)
-                    title = metadata.title or file_path.stem
-                except Exception:
-                    title = file_path.stem
+            html_files.sort()
+            titles = self._extract_titles(html_files)
 
+            ordered_files = []
+            for i, (file_path, title) in enumerate(zip(html_files, titles)):
                 ordered_files.append(
                     OrderedFile(
                         file_path=file_path,
@@ -264,3 +336,84 @@ class DetectService(DetectServiceProtocol):
                 f"Order detection failed for {request.cache_directory}: {str(e)}"
             )
             raise DetectError(f"Order detection failed: {str(e)}")
+
+    def _extract_titles(self, html_files: List[Path]) -> List[str]:
+        """
+        HTMLファイルのタイトルを抽出
+
+        HTMLの解析はCPUバウンドでGILを保持するため、ファイル数が多い場合は
+        スレッドではなくプロセスプールで並列に解析します。
+
+        Args:
+            html_files: HTMLファイルのパスのリスト
+
+        Returns:
+            List[str]: html_filesと同じ順序のタイトルのリスト
+        """
+        workers = min(self.max_workers, len(html_files) // _PARALLEL_CHUNKSIZE)
+        if workers > 1 and len(html_files) >= _PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_order_worker,
+                    initargs=(self.html_parser, self.html_analyzer),
+                ) as executor:
+                    return list(
+                        executor.map(
+                            _extract_title_in_worker,
+                            html_files,
+                            chunksize=_PARALLEL_CHUNKSIZE,
+                        )
+                    )
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Process pool unavailable, parsing sequentially: {e}")
+
+        return [
+            _extract_title(self.html_parser, self.html_analyzer, file_path)
+            for file_path in html_files
+        ]
+
+    def _cache_key(self, file_path: Path) -> Optional[str]:
+        """
+        メインコンテンツ検出結果のキャッシュキーを取得
+
+        キーはHTMLの内容・検出器の種類と設定・パーサーのバックエンドから生成します。
+
+        Args:
+            file_path: HTMLファイルのパス
+
+        Returns:
+            Optional[str]: キャッシュキー（キャッシュ無効の場合はNone）
+        """
+        if self._result_cache is None:
+            return None
+
+        return self._result_cache.make_key(
+            _CACHE_VERSION,
+            type(self.main_detector).__name__,
+            repr(getattr(self.main_detector, "options", None)),
+            # バックエンド（lxml・html.parserなど）によって解析結果が変わるため
+            repr(getattr(self.html_parser, "parser", None)),
+            file_path.read_bytes(),
+        )
+
+    def _load_cached_result(
+        self, cache_key: str, request: DetectMainRequest
+    ) -> Optional[DetectMainResult]:
+        """
+        キャッシュからメインコンテンツ検出結果を読み込み
+
+        Args:
+            cache_key: キャッシュキー
+            request: 検出要求
+
+        Returns:
+            Optional[DetectMainResult]: 検出結果（キャッシュがない場合はNone）
+        """
+        cached = self._result_cache.load(cache_key, DetectMainResult)
+        if cached is None:
+            return None
+
+        logger.info(f"Main content detection cache hit for: {request.file_path}")
+        # 同じ内容の別ファイルでもキャッシュを共有するため、ファイルパスは要求から設定
+        return cached.model_copy(update={"file_path": request.file_path})
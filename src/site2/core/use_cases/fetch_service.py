@@ -6,6 +6,7 @@ Webサイトを取得してキャッシュするサービス
 
 import hashlib
 import json
+import os
 from pathlib import Path
 from datetime import datetime
 
@@ -152,6 +153,7 @@ class FetchService(FetchServiceProtocol):
 
         # キャッシュメタデータの保存
         self._save_cache_metadata(website_cache)
+        self._update_cache_index(website_cache)
 
         # 結果の作成
         total_size = sum(page.size_bytes for page in cached_pages)
@@ -183,19 +185,19 @@ class FetchService(FetchServiceProtocol):
         """
         logger.info("Listing cached websites")
 
-        all_caches = self.repository.find_all()
-
-        cache_list = []
-        for cache in all_caches:
-            total_size = sum(page.size_bytes for page in cache.pages)
-            cache_info = {
-                "id": self._generate_cache_id(cache.root_url),
-                "url": str(cache.root_url.value),
-                "page_count": len(cache.pages),
-                "total_size": total_size,
-                "last_updated": cache.created_at.isoformat(),
-            }
-            cache_list.append(cache_info)
+        # 集約インデックスが最新であれば、各キャッシュを読み込まずに一覧を返す
+        cache_list = self.repository.list_summaries()
+        if cache_list is None:
+            all_caches = self.repository.find_all()
+            rows = [self._summarize_cache(cache) for cache in all_caches]
+            if all_caches:
+                self._save_cache_index(
+                    all_caches[0].cache_directory.parent / "index.json", rows
+                )
+            cache_list = [
+                {key: value for key, value in row.items() if key != "directory"}
+                for row in rows
+            ]
 
         logger.info(f"Found {len(cache_list)} cached websites")
 
@@ -207,6 +209,45 @@ class FetchService(FetchServiceProtocol):
         hash_obj = hashlib.md5(url_str.encode())
         return hash_obj.hexdigest()[:8]
 
+    def _summarize_cache(self, cache: WebsiteCache) -> dict:
+        """集約インデックスに記録するキャッシュの要約を作成"""
+        return {
+            "id": self._generate_cache_id(cache.root_url),
+            "url": str(cache.root_url.value),
+            "page_count": len(cache.pages),
+            "total_size": sum(page.size_bytes for page in cache.pages),
+            "last_updated": cache.created_at.isoformat(),
+            "directory": cache.cache_directory.name,
+        }
+
+    def _update_cache_index(self, cache: WebsiteCache) -> None:
+        """集約インデックスのキャッシュの行を追加・更新"""
+        index_file = cache.cache_directory.parent / "index.json"
+        try:
+            with open(index_file, "r", encoding="utf-8") as f:
+                rows = json.load(f)["caches"]
+        except FileNotFoundError:
+            rows = []
+        except Exception as e:
+            # 読み込めないインデックスは次回の一覧表示で再構築される
+            logger.warning(f"Failed to read cache index {index_file}: {e}")
+            rows = []
+
+        summary = self._summarize_cache(cache)
+        rows = [row for row in rows if row.get("directory") != summary["directory"]]
+        rows.append(summary)
+        self._save_cache_index(index_file, rows)
+
+    def _save_cache_index(self, index_file: Path, rows: list) -> None:
+        """集約インデックスを保存（失敗してもキャッシュ自体は有効なため警告のみ）"""
+        tmp_file = index_file.with_name(f".{index_file.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({"caches": rows}, f, ensure_ascii=False)
+            os.replace(tmp_file, index_file)
+        except Exception as e:
+            logger.warning(f"Failed to save cache index {index_file}: {e}")
+
     def _create_result_from_cache(self, cache: WebsiteCache) -> FetchResult:
         """既存キャッシュからFetchResultを作成"""
         total_size = sum(page.size_bytes for page in cache.pages)
@@ -251,6 +292,11 @@ class FetchService(FetchServiceProtocol):
         try:
             with open(metadata_file, "w", encoding="utf-8") as f:
                 json.dump(metadata, f, indent=2, ensure_ascii=False)
+            # URL検索用にルートURLだけを別ファイルにも保存
+            with open(
+                cache.cache_directory / "root_url.txt", "w", encoding="utf-8"
+            ) as f:
+                f.write(metadata["root_url"])
         except Exception as e:
             logger.error(f"Failed to save cache metadata: {e}")
             raise CachePermissionError(f"Failed to save cache metadata: {e}") from e
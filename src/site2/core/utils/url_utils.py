@@ -8,6 +8,9 @@ from urllib.parse import urljoin, urlparse
 from pathlib import Path
 import hashlib
 
+# スラッグに使用できない文字を"_"に置き換える変換テーブル
+_SLUG_TRANS = str.maketrans({c: "_" for c in "/:?&=#%"})
+
 
 def resolve_relative_url(base_url: str, relative_url: str) -> str:
     """
@@ -61,6 +64,24 @@ def url_to_filename(url: str, max_length: int = 255) -> str:
     return safe_name
 
 
+def url_to_slug(url: str) -> str:
+    """
+    URLをディレクトリ名に適したスラッグに変換
+
+    Args:
+        url: 変換対象のURL
+
+    Returns:
+        スラッグ（ホスト名とパスが空の場合は"root"）
+
+    Examples:
+        >>> url_to_slug("https://example.com/docs/en/")
+        'example.com_docs_en'
+    """
+    parsed = urlparse(url)
+    return f"{parsed.netloc}{parsed.path}".strip("/").translate(_SLUG_TRANS) or "root"
+
+
 def is_same_domain(url1: str, url2: str) -> bool:
     """
     2つのURLが同じドメインかチェック
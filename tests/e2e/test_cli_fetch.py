@@ -1,4 +1,6 @@
 import shutil
+
+import pytest
 from pathlib import Path
 from typer.testing import CliRunner
 from site2 import cli
@@ -93,3 +95,29 @@ class TestCLIExecution:
         """buildコマンドに複数ファイルを指定"""
         result = runner.invoke(cli.app, ["build", "file1.html", "file2.html"])
         assert result.exit_code == 0
+
+
+class TestURLCheck:
+    """URLの簡易チェックのテスト"""
+
+    @pytest.mark.parametrize(
+        "uri, expected",
+        [
+            ("http://x", True),
+            ("https://example.com/docs/?p=2", True),
+            ("http://localhost:8080/", True),
+            ("not-a-url", False),
+            ("http://", False),
+            ("ftp://example.com", False),
+            ("http://exa mple.com", False),
+        ],
+    )
+    def test_is_http_url(self, uri, expected):
+        """ホスト名を持つhttp(s)のURLのみ通すこと"""
+        assert cli._is_http_url(uri) is expected
+
+    def test_auto_rejects_invalid_url(self, tmp_path):
+        """autoコマンドは無効なURLをコンソールに表示して終了すること"""
+        result = runner.invoke(cli.app, ["auto", "not-a-url", str(tmp_path / "out.md")])
+        assert result.exit_code == 1
+        assert "Invalid URL: not-a-url" in result.stdout
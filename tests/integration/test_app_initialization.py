@@ -10,7 +10,7 @@ import os
 from site2.app import create_app
 from site2.core.use_cases.fetch_service import FetchService
 from site2.core.use_cases.detect_service import DetectService
-from site2.adapters.crawlers.wget_crawler import WgetCrawler
+from site2.adapters.crawlers.crawler_factory import CrawlerFactory
 from site2.adapters.storage.file_repository import FileRepository
 
 
@@ -74,7 +74,8 @@ class TestAppInitialization:
         assert hasattr(fetch_service, "fetch")
 
         web_crawler = container.web_crawler()
-        assert isinstance(web_crawler, WgetCrawler)
+        expected_class = CrawlerFactory._crawlers[container.settings().crawler_method]
+        assert isinstance(web_crawler, expected_class)
         assert hasattr(web_crawler, "crawl")
 
         repository = container.website_cache_repository()
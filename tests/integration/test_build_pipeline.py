@@ -134,10 +134,11 @@ class TestBuildPipeline:
         pdf_converter = self.container.pdf_converter()
         html_parser = self.container.html_parser()
 
-        # 全て異なるインスタンスであることを確認（Factoryパターン）
+        # コンバーターは異なるインスタンスであることを確認（Factoryパターン）
         assert build_service._markdown_converter != markdown_converter
         assert build_service._pdf_converter != pdf_converter
-        assert build_service._html_parser != html_parser
+        # パーサーは共有されることを確認（Singletonパターン）
+        assert build_service._html_parser is html_parser
 
     def test_container_configuration_validation(self):
         """DIコンテナの設定検証テスト"""
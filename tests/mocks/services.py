@@ -4,7 +4,7 @@
 パイプライン統合テスト用のモックサービス
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 from datetime import datetime
 
@@ -72,6 +72,9 @@ class MockRepository(WebsiteCacheRepositoryProtocol):
     def find_all(self) -> List[WebsiteCache]:
         return list(self._cache.values())
 
+    def list_summaries(self) -> Optional[List[Dict[str, Any]]]:
+        return None
+
 
 class MockFetchService(FetchServiceProtocol):
     """simple-siteのデータを返すモックサービス"""
@@ -0,0 +1,227 @@
+"""
+AiohttpCrawlerの単体テスト
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from site2.adapters.crawlers import aiohttp_crawler  # noqa: E402
+from site2.adapters.crawlers.aiohttp_crawler import AiohttpCrawler  # noqa: E402
+from site2.adapters.crawlers.crawler_factory import CrawlerFactory  # noqa: E402
+from site2.core.domain.fetch_domain import (  # noqa: E402
+    CachedPage,
+    CrawlDepth,
+    WebsiteCache,
+    WebsiteURL,
+)
+from site2.core.ports.fetch_contracts import NetworkError  # noqa: E402
+
+PAGES = {
+    "/docs/": '<a href="intro">Intro</a><a href="/docs/guide/#top">Guide</a>'
+    '<a href="/blog/">Blog</a><a href="https://other.example.org/">Other</a>',
+    "/docs/intro": '<a href="deep">Deep</a>',
+    "/docs/guide/": "<p>Guide</p>",
+    "/docs/deep": "<p>Deep</p>",
+    "/blog/": "<p>Blog</p>",
+    "/guide/": '<a href="page.html">Page</a>',
+    "/guide/page.html": "<p>Page</p>",
+    "/list/": '<a href="items">Items</a><a href="items?p=2">Items 2</a>',
+    "/list/items": "<p>Page 1</p>",
+}
+
+ETAG = '"v1"'
+
+
+def _create_app() -> web.Application:
+    async def handler(request: web.Request) -> web.Response:
+        if request.path == "/docs/style.css":
+            return web.Response(text="body {}", content_type="text/css")
+        if request.path == "/guide":
+            raise web.HTTPFound("/guide/")
+        if request.path == "/list/items" and request.query.get("p") == "2":
+            return web.Response(text="<p>Page 2</p>", content_type="text/html")
+        if request.path == "/etag/":
+            if request.headers.get("If-None-Match") == ETAG:
+                return web.Response(status=304)
+            return web.Response(
+                text="<p>Fresh</p>", content_type="text/html", headers={"ETag": ETAG}
+            )
+        if request.path not in PAGES:
+            raise web.HTTPNotFound()
+        return web.Response(text=PAGES[request.path], content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{path:.*}", handler)
+    return app
+
+
+class TestAiohttpCrawler:
+    """AiohttpCrawlerのテストクラス"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される"""
+        self.crawler = AiohttpCrawler(delay=0)
+
+    @pytest.mark.asyncio
+    async def test_crawl_async_follows_links_within_scope(self):
+        """起点のディレクトリ配下のリンクを深さの範囲内で辿ること"""
+        async with TestServer(_create_app(), host="localhost") as server:
+            url = WebsiteURL(value=str(server.make_url("/docs/")))
+
+            pages = await self.crawler.crawl_async(url, CrawlDepth(value=1))
+
+        paths = sorted(page.page_url.value.path for page in pages)
+        assert paths == ["/docs/", "/docs/guide/", "/docs/intro"]
+        for page in pages:
+            assert page.local_path.exists()
+            assert page.size_bytes == page.local_path.stat().st_size
+            assert page.content_type == "text/html"
+
+    @pytest.mark.asyncio
+    async def test_crawl_async_saves_with_wget_layout(self):
+        """wgetと同じレイアウトでファイルが保存されること"""
+        async with TestServer(_create_app(), host="localhost") as server:
+            url = WebsiteURL(value=str(server.make_url("/docs/")))
+
+            pages = await self.crawler.crawl_async(url, CrawlDepth(value=1))
+
+        local_paths = {page.page_url.value.path: page.local_path for page in pages}
+        assert local_paths["/docs/"].as_posix().endswith("/docs/index.html")
+        assert local_paths["/docs/intro"].name == "intro.html"
+
+    @pytest.mark.asyncio
+    async def test_crawl_async_start_page_not_found(self):
+        """起点のページが取得できない場合はNetworkErrorになること"""
+        async with TestServer(_create_app(), host="localhost") as server:
+            url = WebsiteURL(value=str(server.make_url("/missing/")))
+
+            with pytest.raises(NetworkError):
+                await self.crawler.crawl_async(url, CrawlDepth(value=1))
+
+    def test_crawler_factory_registers_aiohttp(self):
+        """CrawlerFactoryからaiohttpクローラーを作成できること"""
+        crawler = CrawlerFactory.create("aiohttp", delay=0)
+
+        assert isinstance(crawler, AiohttpCrawler)
+        assert "aiohttp" in CrawlerFactory.get_available_methods()
+
+    @pytest.mark.asyncio
+    async def test_crawl_async_resolves_links_against_redirected_url(self):
+        """リダイレクト後のURLを基準にリンクを解決して保存すること"""
+        async with TestServer(_create_app(), host="localhost") as server:
+            url = WebsiteURL(value=str(server.make_url("/guide")))
+
+            pages = await self.crawler.crawl_async(url, CrawlDepth(value=1))
+
+        local_paths = {page.page_url.value.path: page.local_path for page in pages}
+        assert sorted(local_paths) == ["/guide/", "/guide/page.html"]
+        assert local_paths["/guide/"].as_posix().endswith("/guide/index.html")
+
+    @pytest.mark.asyncio
+    async def test_crawl_async_keeps_query_variants_apart(self):
+        """クエリ違いのページを別のファイルに保存すること"""
+        async with TestServer(_create_app(), host="localhost") as server:
+            url = WebsiteURL(value=str(server.make_url("/list/")))
+
+            pages = await self.crawler.crawl_async(url, CrawlDepth(value=1))
+
+        local_paths = {str(page.page_url.value): page.local_path for page in pages}
+        first = next(p for u, p in local_paths.items() if u.endswith("/list/items"))
+        second = next(p for u, p in local_paths.items() if u.endswith("?p=2"))
+        assert first.name == "items.html"
+        assert second.name == "items?p=2.html"
+        assert first.read_text() == "<p>Page 1</p>"
+        assert second.read_text() == "<p>Page 2</p>"
+
+    @pytest.mark.asyncio
+    async def test_crawl_async_reuses_unmodified_existing_page(self, tmp_path):
+        """ETagが一致するページは既存キャッシュの内容を使用すること"""
+        async with TestServer(_create_app(), host="localhost") as server:
+            url = WebsiteURL(value=str(server.make_url("/etag/")))
+            old_file = tmp_path / "index.html"
+            old_file.write_text("<p>Cached</p>")
+            existing_cache = WebsiteCache(
+                root_url=url,
+                cache_directory=tmp_path,
+                pages=[
+                    CachedPage(
+                        page_url=url,
+                        local_path=old_file,
+                        content_type="text/html",
+                        size_bytes=old_file.stat().st_size,
+                        fetched_at=datetime.now(),
+                        etag=ETAG,
+                    )
+                ],
+            )
+
+            pages = await self.crawler.crawl_async(
+                url, CrawlDepth(value=0), existing_cache
+            )
+
+        assert len(pages) == 1
+        assert pages[0].local_path.read_text() == "<p>Cached</p>"
+        assert pages[0].etag == ETAG
+
+    @pytest.mark.asyncio
+    async def test_crawl_async_stops_at_quota(self, monkeypatch):
+        """上限に達した後は新しいページを取得しないこと"""
+        # 起点のページの取得後も上限に達しないが、次の1ページで上限を超える
+        monkeypatch.setattr(
+            aiohttp_crawler, "_QUOTA_BYTES", len(PAGES["/docs/"].encode()) + 1
+        )
+        crawler = AiohttpCrawler(delay=0, max_concurrency=1)
+        async with TestServer(_create_app(), host="localhost") as server:
+            url = WebsiteURL(value=str(server.make_url("/docs/")))
+
+            pages = await crawler.crawl_async(url, CrawlDepth(value=1))
+
+        assert len(pages) == 2
+        assert pages[0].page_url.value.path == "/docs/"
+
+    @pytest.mark.asyncio
+    async def test_crawl_inside_running_loop(self):
+        """イベントループ内から同期版のcrawlを呼び出せること"""
+        url = WebsiteURL(value="http://127.0.0.1:1/")
+
+        # asyncio.runのRuntimeErrorではなく、接続失敗のNetworkErrorになる
+        with pytest.raises(NetworkError):
+            self.crawler.crawl(url, CrawlDepth(value=0))
+
+    @pytest.mark.asyncio
+    async def test_crawl_async_throttles_requests_per_host(self):
+        """同じホストへのリクエストは同時数を制限し、開始間隔を空けること"""
+        started = []
+        active = 0
+        max_active = 0
+
+        async def handler(request: web.Request) -> web.Response:
+            nonlocal active, max_active
+            started.append(asyncio.get_running_loop().time())
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+            links = "".join(f'<a href="p{i}">p{i}</a>' for i in range(4))
+            return web.Response(text=links, content_type="text/html")
+
+        app = web.Application()
+        app.router.add_get("/{path:.*}", handler)
+        crawler = AiohttpCrawler(delay=0.1, max_concurrency=8)
+        async with TestServer(app, host="localhost") as server:
+            url = WebsiteURL(value=str(server.make_url("/")))
+
+            pages = await crawler.crawl_async(url, CrawlDepth(value=1))
+
+        assert len(pages) == 5
+        assert max_active <= 2
+        # 遅延はdelayの0.5〜1.5倍
+        gaps = [later - earlier for earlier, later in zip(started, started[1:])]
+        assert min(gaps) >= 0.05 - 0.01
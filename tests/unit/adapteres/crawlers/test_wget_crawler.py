@@ -2,9 +2,10 @@
 WgetCrawlerの単体テスト
 """
 
+import asyncio
 import pytest
 import subprocess
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 from pathlib import Path
 from datetime import datetime
 
@@ -29,32 +30,18 @@ class TestWgetCrawler:
         self.cache_dir = Path("/tmp/test_cache/example.com_abc123")
 
     @patch("subprocess.run")
-    @patch("pathlib.Path.glob")
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.mkdir")
-    def test_crawl_success(self, mock_mkdir, mock_exists, mock_glob, mock_run):
+    @patch("tempfile.mkdtemp")
+    def test_crawl_success(self, mock_mkdtemp, mock_run, tmp_path):
         """正常なクロールが成功すること"""
         # Arrange
-        mock_exists.return_value = True
+        mock_mkdtemp.return_value = str(tmp_path)
         mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
-        # globで見つかるファイルをモック
-        mock_html_files = [
-            MagicMock(
-                spec=Path,
-                __str__=lambda self: f"{self.cache_dir}/index.html",
-                relative_to=lambda x: Path("index.html"),
-                stat=lambda: MagicMock(st_size=1024),
-            ),
-            MagicMock(
-                spec=Path,
-                __str__=lambda self: f"{self.cache_dir}/about.html",
-                relative_to=lambda x: Path("about.html"),
-                stat=lambda: MagicMock(st_size=2048),
-            ),
-        ]
-        # .htmlと.htmで異なる結果を返す
-        mock_glob.side_effect = [mock_html_files, []]  # .html files, then no .htm files
+        # wgetが保存したファイル
+        (tmp_path / "index.html").write_bytes(b"x" * 1024)
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "about.htm").write_bytes(b"x" * 2048)
+        (tmp_path / "robots.txt").write_text("User-agent: *")
 
         # Act
         result = self.crawler.crawl(self.test_url, self.test_depth)
@@ -62,8 +49,8 @@ class TestWgetCrawler:
         # Assert
         assert len(result) == 2
         assert all(isinstance(page, CachedPage) for page in result)
-        assert result[0].size_bytes == 1024
-        assert result[1].size_bytes == 2048
+        sizes = {page.local_path.name: page.size_bytes for page in result}
+        assert sizes == {"index.html": 1024, "about.htm": 2048}
 
         # wgetコマンドが正しく呼ばれたことを確認
         mock_run.assert_called_once()
@@ -112,12 +99,11 @@ class TestWgetCrawler:
             self.crawler.crawl(self.test_url, self.test_depth)
 
     @patch("subprocess.run")
-    @patch("pathlib.Path.glob")
-    @patch("pathlib.Path.exists")
-    def test_crawl_with_existing_cache(self, mock_exists, mock_glob, mock_run):
+    @patch("tempfile.mkdtemp")
+    def test_crawl_with_existing_cache(self, mock_mkdtemp, mock_run, tmp_path):
         """既存キャッシュがある場合の差分更新"""
         # Arrange
-        mock_exists.return_value = True
+        mock_mkdtemp.return_value = str(tmp_path)
         mock_run.return_value = MagicMock(returncode=0)
 
         # 既存のキャッシュ
@@ -135,13 +121,7 @@ class TestWgetCrawler:
             created_at=datetime.now(),
         )
 
-        mock_glob.return_value = [
-            MagicMock(
-                spec=Path,
-                relative_to=lambda x: Path("index.html"),
-                stat=lambda: MagicMock(st_size=1024),
-            )
-        ]
+        (tmp_path / "index.html").write_bytes(b"x" * 1024)
 
         # Act
         result = self.crawler.crawl(self.test_url, self.test_depth, existing_cache)
@@ -153,21 +133,18 @@ class TestWgetCrawler:
         assert "-N" in args or "--timestamping" in args
 
     @patch("subprocess.run")
-    @patch("pathlib.Path.glob")
-    def test_crawl_creates_cached_pages_with_read_text(self, mock_glob, mock_run):
+    @patch("tempfile.mkdtemp")
+    def test_crawl_creates_cached_pages_with_read_text(
+        self, mock_mkdtemp, mock_run, tmp_path
+    ):
         """CachedPageにread_text()メソッドが実装されていること"""
         # Arrange
+        mock_mkdtemp.return_value = str(tmp_path)
         mock_run.return_value = MagicMock(returncode=0)
 
         # テスト用のHTMLファイル
         test_html_content = "<html><body>Test Content</body></html>"
-        mock_file = MagicMock(spec=Path)
-        mock_file.relative_to.return_value = Path("test.html")
-        mock_file.stat.return_value = MagicMock(st_size=len(test_html_content))
-        mock_file.read_text.return_value = test_html_content
-
-        # .htmlと.htmで異なる結果を返す
-        mock_glob.side_effect = [[mock_file], []]  # .html files, then no .htm files
+        (tmp_path / "test.html").write_text(test_html_content)
 
         # Act
         result = self.crawler.crawl(self.test_url, self.test_depth)
@@ -259,6 +236,64 @@ class TestWgetCrawler:
                 # 各URLの正しいドメインが設定されていることを確認
                 assert args[domain_index] == test_url.domain
 
+    @pytest.mark.asyncio
+    @patch("asyncio.create_subprocess_exec")
+    async def test_crawl_async(self, mock_exec):
+        """非同期サブプロセスでwgetが実行されること"""
+        # Arrange
+        process = MagicMock(returncode=0)
+        process.communicate = AsyncMock(return_value=(None, b""))
+        mock_exec.return_value = process
+
+        # Act
+        with patch("pathlib.Path.glob", return_value=[]):
+            result = await self.crawler.crawl_async(self.test_url, self.test_depth)
+
+        # Assert
+        assert result == []
+        args = mock_exec.call_args[0]
+        assert args[0] == "wget"
+        assert str(self.test_url.value) in args
+
+    @pytest.mark.asyncio
+    @patch("asyncio.create_subprocess_exec")
+    async def test_crawl_async_network_error(self, mock_exec):
+        """非同期実行でもwgetの失敗がNetworkErrorになること"""
+        # Arrange
+        process = MagicMock(returncode=4)
+        process.communicate = AsyncMock(return_value=(None, b"Network unreachable"))
+        mock_exec.return_value = process
+
+        # Act & Assert
+        with pytest.raises(NetworkError, match="Network unreachable"):
+            await self.crawler.crawl_async(self.test_url, self.test_depth)
+
+    @pytest.mark.asyncio
+    async def test_crawl_many_limits_parallelism(self):
+        """複数のURLを同時実行数の上限内で並行クロールし、順序を保つこと"""
+        # Arrange
+        urls = [WebsiteURL(value=f"https://site{i}.example.com/") for i in range(5)]
+        running = 0
+        max_running = 0
+
+        async def fake_crawl_async(url, depth):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return [url.domain]
+
+        # Act
+        with patch.object(self.crawler, "crawl_async", side_effect=fake_crawl_async):
+            results = await self.crawler.crawl_many(
+                urls, self.test_depth, max_parallel=2
+            )
+
+        # Assert
+        assert results == [[url.domain] for url in urls]
+        assert max_running == 2
+
     def test_parse_content_type(self):
         """Content-Typeの判定が正しく動作すること"""
         # HTMLファイル
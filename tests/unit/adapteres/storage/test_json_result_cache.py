@@ -0,0 +1,80 @@
+"""
+JsonResultCacheの単体テスト
+"""
+
+from pathlib import Path
+
+from site2.adapters.storage.json_result_cache import (
+    JsonResultCache,
+    create_result_cache,
+)
+from site2.core.ports.detect_contracts import DetectMainResult
+
+
+def _result() -> DetectMainResult:
+    return DetectMainResult(
+        file_path=Path("page.html"),
+        selectors=["main"],
+        primary_selector="main",
+        confidence=0.9,
+    )
+
+
+class TestJsonResultCache:
+    """JsonResultCacheのテストクラス"""
+
+    def test_store_and_load(self, tmp_path):
+        """書き込んだ結果を同じキーで読み込めること"""
+        # Arrange
+        cache = JsonResultCache(tmp_path / "cache")
+        key = cache.make_key("v1", b"<html></html>")
+
+        # Act
+        cache.store(key, _result())
+
+        # Assert
+        assert cache.load(key, DetectMainResult) == _result()
+        assert (
+            cache.load(cache.make_key("v2", b"<html></html>"), DetectMainResult) is None
+        )
+
+    def test_make_key_separates_parts(self, tmp_path):
+        """構成要素の区切りが異なる場合は別のキーになること"""
+        cache = JsonResultCache(tmp_path)
+
+        assert cache.make_key("ab", "c") != cache.make_key("a", "bc")
+        assert cache.make_key("a", b"b") == cache.make_key(b"a", "b")
+
+    def test_load_broken_cache(self, tmp_path):
+        """壊れたキャッシュファイルはNoneとして扱うこと"""
+        # Arrange
+        cache = JsonResultCache(tmp_path)
+        key = cache.make_key("broken")
+        (tmp_path / f"{key}.json").write_text("{not json", encoding="utf-8")
+
+        # Act & Assert
+        assert cache.load(key, DetectMainResult) is None
+
+    def test_store_failure_removes_temp_file(self, tmp_path, monkeypatch):
+        """置き換えに失敗した場合に一時ファイルが残らないこと"""
+        # Arrange
+        cache_dir = tmp_path / "cache"
+        cache = JsonResultCache(cache_dir)
+
+        def fail_replace(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(
+            "site2.adapters.storage.json_result_cache.os.replace", fail_replace
+        )
+
+        # Act
+        cache.store(cache.make_key("entry"), _result())
+
+        # Assert
+        assert not [path for path in cache_dir.rglob("*") if path.is_file()]
+
+    def test_create_result_cache_disabled(self, tmp_path):
+        """キャッシュディレクトリがNoneの場合はキャッシュを作成しないこと"""
+        assert create_result_cache(None) is None
+        assert create_result_cache(tmp_path, "detection").label == "detection"
@@ -0,0 +1,39 @@
+"""
+RepositoryFactoryの単体テスト
+"""
+
+import pytest
+
+from site2.adapters.storage.file_repository import FileRepository
+from site2.adapters.storage.repository_factory import RepositoryFactory
+from site2.core.containers import Container
+
+
+class TestRepositoryFactory:
+    """RepositoryFactoryのテストクラス"""
+
+    def test_create_returns_new_repository(self, tmp_path):
+        """呼び出しごとに新しいリポジトリを作成すること（共有はコンテナが行う）"""
+        # Act
+        first = RepositoryFactory.create("file", cache_dir=tmp_path)
+        second = RepositoryFactory.create("file", cache_dir=tmp_path)
+
+        # Assert
+        assert isinstance(first, FileRepository)
+        assert first is not second
+        assert first.cache_dir == tmp_path
+
+    def test_container_shares_repository(self):
+        """コンテナからは同じリポジトリが返されること"""
+        # Arrange
+        container = Container()
+
+        # Act & Assert
+        assert (
+            container.website_cache_repository() is container.website_cache_repository()
+        )
+
+    def test_create_unknown_method(self):
+        """不正なリポジトリ種類でValueErrorになること"""
+        with pytest.raises(ValueError, match="Unknown repository method"):
+            RepositoryFactory.create("unknown")
@@ -0,0 +1,102 @@
+"""
+軽量Markdownレンダラーの単体テスト
+"""
+
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+from markdownify import MarkdownConverter
+
+from site2.adapters.converters import fast_markdown
+from site2.adapters.converters.markdownify_config import DEFAULT_MARKDOWNIFY_CONFIG
+from site2.adapters.converters.markdown_converter import MarkdownifyConverter
+from site2.core.domain.build_domain import MarkdownConvertRequest
+
+FIXTURES_ROOT = Path(__file__).parent.parent.parent.parent / "fixtures"
+FIXTURE_FILES = sorted(FIXTURES_ROOT.glob("html/*.html")) + sorted(
+    FIXTURES_ROOT.glob("websites/**/*.html")
+)
+
+
+class TestFastMarkdown:
+    """fast_markdown.renderの単体テスト"""
+
+    def setup_method(self):
+        """テストセットアップ"""
+        self.markdownify = MarkdownConverter(**DEFAULT_MARKDOWNIFY_CONFIG)
+
+    @pytest.mark.parametrize("parser", ["html.parser", "lxml"])
+    @pytest.mark.parametrize(
+        "html",
+        [
+            """
+            <main>
+                <h1>Title *with* marks_</h1>
+                <p>Paragraph with <strong>bold</strong> and <em> emphasis </em>.
+                   Second line.</p>
+                <ul><li>one</li>
+                    <li>two <a href="https://example.com/">link</a></li></ul>
+                <p>after list</p>
+            </main>
+            """,
+            """
+            <main>
+                <ol start="3"><li>x<ul><li>nested</li></ul></li><li>y</li></ol>
+                <hr>
+                <p>line<br>break</p>
+                <h2>Heading <code>code</code> <br> tail</h2>
+            </main>
+            """,
+            """
+            <main>
+                <div>text <span>span</span> <code>a b</code><!-- comment --> end</div>
+                <a href="u" title='say "hi"'> link </a>loose text
+            </main>
+            """,
+        ],
+    )
+    def test_render_matches_markdownify(self, html, parser):
+        """デフォルト設定のMarkdownifyと同じ出力になることを確認"""
+        element = BeautifulSoup(html, parser).find("main")
+
+        assert fast_markdown.render(element) == self.markdownify.convert_soup(element)
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            "<main><table><tr><td>cell</td></tr></table></main>",
+            "<main><pre><code>print()</code></pre></main>",
+            "<main><p><img src='a.png' alt='a'></p></main>",
+            "<main><p>Use <code>a`b</code> now</p></main>",
+        ],
+    )
+    def test_render_returns_none_for_unsupported_elements(self, html):
+        """対応していない要素を含む場合はNoneを返すことを確認"""
+        element = BeautifulSoup(html, "html.parser").find("main")
+
+        assert fast_markdown.render(element) is None
+
+    @pytest.mark.parametrize("fixture", FIXTURE_FILES, ids=lambda path: path.name)
+    def test_render_matches_installed_markdownify_on_fixtures(self, fixture):
+        """フィクスチャで、インストールされたMarkdownifyと同じ出力になることを確認"""
+        soup = BeautifulSoup(fixture.read_bytes(), "lxml")
+        for element in soup.find_all(["main", "article", "body"]):
+            markdown = fast_markdown.render(element)
+            if markdown is not None:
+                assert markdown == self.markdownify.convert_soup(element)
+
+    def test_converter_output_with_backticks_matches_markdownify(self, tmp_path):
+        """バッククォートを含むコードでも変換結果がMarkdownifyと同じになることを確認"""
+        html = "<html><body><main><p>Use <code>a`b</code> now</p></main></body></html>"
+        html_file = tmp_path / "code.html"
+        html_file.write_text(html)
+
+        result = MarkdownifyConverter().convert(
+            MarkdownConvertRequest(file_path=html_file, main_selector="main")
+        )
+
+        expected = self.markdownify.convert_soup(
+            BeautifulSoup(html, "lxml").find("main")
+        )
+        assert result.content.strip() == expected.strip()
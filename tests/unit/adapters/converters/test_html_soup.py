@@ -0,0 +1,150 @@
+"""
+BeautifulSoup生成処理の単体テスト
+"""
+
+import pytest
+from bs4 import BeautifulSoup, FeatureNotFound
+
+from site2.adapters.converters import html_soup
+from site2.adapters.parsers.chardet_detector import ChardetDetector
+
+
+class TestCreateSoup:
+    """create_soupの単体テスト"""
+
+    def test_create_soup_uses_lxml(self):
+        """lxmlパーサーでパースされることを確認"""
+        soup = html_soup.create_soup("<main><p>Content</p></main>")
+
+        assert soup.builder.NAME == "lxml"
+        assert soup.find("p").get_text() == "Content"
+
+    def test_create_soup_falls_back_to_html_parser(self, monkeypatch):
+        """lxmlが利用できない場合はhtml.parserにフォールバックすることを確認"""
+        used_parsers = []
+
+        def fake_beautifulsoup(markup, features, **kwargs):
+            used_parsers.append(features)
+            if features == "lxml":
+                raise FeatureNotFound("lxml is not available")
+            return BeautifulSoup(markup, features, **kwargs)
+
+        monkeypatch.setattr(html_soup, "BeautifulSoup", fake_beautifulsoup)
+
+        soup = html_soup.create_soup("<main><p>Content</p></main>")
+
+        assert used_parsers == ["lxml", "html.parser"]
+        assert soup.find("p").get_text() == "Content"
+
+    @pytest.mark.parametrize(
+        "selector, expected",
+        [
+            ("main", True),
+            ("#content", True),
+            (".article", True),
+            ("div.article", True),
+            ("main article", False),
+            ("[role='main']", False),
+            ("div > p", False),
+        ],
+    )
+    def test_build_strainer(self, selector, expected):
+        """単純なセレクタのみSoupStrainerに変換されることを確認"""
+        strainer = html_soup.build_strainer(selector)
+
+        assert (strainer is not None) == expected
+
+    def test_build_strainer_keeps_title(self):
+        """SoupStrainerでパースしても<title>が構築されることを確認"""
+        soup = html_soup.create_soup(
+            "<html><head><title>Page</title></head>"
+            "<body><nav>Menu</nav><main><p>Body</p></main></body></html>",
+            parse_only=html_soup.build_strainer("main"),
+        )
+
+        assert soup.find("title").get_text() == "Page"
+        assert soup.find("p").get_text() == "Body"
+        assert soup.find("nav") is None
+
+    def test_compile_selector_is_cached(self):
+        """同じセレクタのコンパイル結果が再利用されることを確認"""
+        compiled = html_soup.compile_selector("main article")
+
+        assert html_soup.compile_selector("main article") is compiled
+        soup = html_soup.create_soup("<main><article>Body</article></main>")
+        assert compiled.select_one(soup).get_text() == "Body"
+
+
+class TestDetectEncoding:
+    """detect_encodingの単体テスト"""
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("<p>日本語</p>".encode("utf-8"), "utf-8"),
+            ("<p>日本語</p>".encode("utf-8-sig"), "utf-8-sig"),
+            ("<p>日本語</p>".encode("utf-16"), "utf-16"),
+            (
+                '<meta charset="euc-jp"><p>日本語</p>'.encode("euc-jp"),
+                "euc-jp",
+            ),
+            (
+                '<?xml version="1.0" encoding="Shift_JIS"?><p>日本語</p>'.encode(
+                    "shift_jis"
+                ),
+                "Shift_JIS",
+            ),
+        ],
+    )
+    def test_detect_encoding(self, raw, expected):
+        """BOM・UTF-8・エンコーディング宣言から判定されることを確認"""
+        assert html_soup.detect_encoding(raw) == expected
+
+    def test_detect_encoding_ignores_wrong_declaration(self):
+        """宣言されたエンコーディングでデコードできない場合は無視することを確認"""
+        raw = '<meta charset="utf-8"><p>日本語です</p>'.encode("cp932")
+
+        encoding = html_soup.detect_encoding(raw)
+
+        assert raw.decode(encoding) == '<meta charset="utf-8"><p>日本語です</p>'
+
+    def test_detect_encoding_matches_parser_detector(self):
+        """宣言と内容が異なるファイルでもパーサーと同じエンコーディングと判定されることを確認"""
+        raw = '<meta charset="Shift_JIS"><p>日本語です</p>'.encode("utf-8")
+
+        assert html_soup.detect_encoding(raw) == "utf-8"
+        assert ChardetDetector().detect_encoding_from_bytes(raw) == "utf-8"
+
+
+class TestRemoveUnwantedElements:
+    """remove_unwanted_elementsの単体テスト"""
+
+    def test_remove_unwanted_elements(self):
+        """不要なタグが入れ子になっていても全て除去されることを確認"""
+        soup = BeautifulSoup(
+            "<main><nav><script>x()</script><a>menu</a></nav>"
+            "<p>Content<style>p {}</style></p><footer>foot</footer></main>",
+            "html.parser",
+        )
+
+        html_soup.remove_unwanted_elements(soup.main)
+
+        assert str(soup.main) == "<main><p>Content</p></main>"
+
+
+class TestExtractTitle:
+    """extract_titleの単体テスト"""
+
+    @pytest.mark.parametrize(
+        "markup, expected",
+        [
+            ("<html><head><title> Page &amp; Co </title></head></html>", "Page & Co"),
+            ('<TITLE lang="ja">\n日本語\n</TITLE>'.encode("utf-8"), "日本語"),
+            ("<html><head><title></title></head><h1>Heading</h1></html>", None),
+            ("<html><head></head><body><h1>Heading</h1></body></html>", None),
+            ("<!-- " + "x" * 9000 + " --><title>Late</title>", None),
+        ],
+    )
+    def test_extract_title(self, markup, expected):
+        """先頭部分の<title>のみを抽出することを確認"""
+        assert html_soup.extract_title(markup) == expected
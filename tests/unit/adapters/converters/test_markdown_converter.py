@@ -6,6 +6,8 @@ import pytest
 import tempfile
 from pathlib import Path
 
+from bs4 import BeautifulSoup
+
 from site2.adapters.converters.markdown_converter import MarkdownifyConverter
 from site2.core.ports.build_contracts import MarkdownConverterProtocol
 from site2.core.domain.build_domain import (
@@ -245,3 +247,162 @@ class TestMarkdownifyConverter:
 
         finally:
             test_file.unlink()
+
+    def test_convert_with_complex_selector(self):
+        """SoupStrainerに変換できないセレクタでも変換できることを確認"""
+        html_content = """
+        <html>
+            <head><title>Complex Selector</title></head>
+            <body>
+                <nav><p>Navigation</p></nav>
+                <main>
+                    <article>
+                        <h1>Article Title</h1>
+                        <p>Article body.</p>
+                    </article>
+                </main>
+            </body>
+        </html>
+        """
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
+            f.write(html_content)
+            test_file = Path(f.name)
+
+        try:
+            request = MarkdownConvertRequest(
+                file_path=test_file, main_selector="main article"
+            )
+
+            result = self.converter.convert(request)
+
+            assert result.title == "Complex Selector"
+            assert "# Article Title" in result.content
+            assert "Navigation" not in result.content
+
+        finally:
+            test_file.unlink()
+
+    def test_adjust_heading_levels_shifts_each_heading_once(self):
+        """見出しレベルが1回だけ調整されることを確認"""
+        soup = BeautifulSoup(
+            "<main><h1>A</h1><h2>B</h2><h5>C</h5><h6>D</h6></main>", "html.parser"
+        )
+
+        self.converter._adjust_heading_levels(soup, 1)
+
+        assert [h.name for h in soup.find_all(True)[1:]] == ["h2", "h3", "h6", "h6"]
+
+    def test_convert_many_preserves_order(self, tmp_path):
+        """並列変換の結果が要求と同じ順序で返されることを確認"""
+        requests = []
+        for i in range(4):
+            test_file = tmp_path / f"page{i}.html"
+            test_file.write_text(
+                f"<html><head><title>Page {i}</title></head>"
+                f"<body><main><h1>Heading {i}</h1><p>Body {i}</p></main></body></html>",
+                encoding="utf-8",
+            )
+            requests.append(
+                MarkdownConvertRequest(
+                    file_path=test_file, main_selector="main", include_toc=False
+                )
+            )
+
+        results = self.converter.convert_many(requests, max_workers=2)
+
+        assert [result.title for result in results] == [f"Page {i}" for i in range(4)]
+        assert all("Body" in result.content for result in results)
+
+    def test_add_table_of_contents_builds_anchors(self):
+        """目次のアンカーがGitHub Markdown形式で生成されることを確認"""
+        markdown = "# Getting Started (v2)\n\ntext\n\n## API: foo_bar\n"
+
+        result = self.converter._add_table_of_contents(markdown)
+
+        assert "- [Getting Started (v2)](#getting-started-v2)" in result
+        assert "  - [API: foo_bar](#api-foo_bar)" in result
+        assert result.endswith(markdown)
+
+    def test_read_html_file_non_utf8(self, tmp_path):
+        """UTF-8以外のエンコーディングのファイルを読み込めることを確認"""
+        html = "<html><body><main><p>日本語のテキストです。</p></main></body></html>"
+        test_file = tmp_path / "sjis.html"
+        test_file.write_bytes(html.encode("shift_jis"))
+
+        assert self.converter._read_html_file(test_file) == html
+
+    def test_convert_title_falls_back_to_main_h1(self, tmp_path):
+        """<title>がない場合はメインコンテンツ内の<h1>をタイトルにすることを確認"""
+        test_file = tmp_path / "no_title.html"
+        test_file.write_text(
+            "<html><body><header><h1>Site Name</h1></header>"
+            "<main><h1>Article Title</h1><p>Body</p></main></body></html>",
+            encoding="utf-8",
+        )
+        request = MarkdownConvertRequest(
+            file_path=test_file, main_selector="main", heading_offset=1
+        )
+
+        result = self.converter.convert(request)
+
+        assert result.title == "Article Title"
+        assert "## Article Title" in result.content
+
+    def test_convert_uses_cache_for_same_content(self, tmp_path, monkeypatch):
+        """同じ内容・オプションの変換はキャッシュから返されることを確認"""
+        converter = MarkdownifyConverter(cache_dir=tmp_path / "cache")
+        html = (
+            "<html><head><title>Cached</title></head>"
+            "<body><main><h1>Heading</h1><p>Body</p></main></body></html>"
+        )
+        first_file = tmp_path / "first.html"
+        second_file = tmp_path / "second.html"
+        first_file.write_text(html, encoding="utf-8")
+        second_file.write_text(html, encoding="utf-8")
+
+        first = converter.convert(
+            MarkdownConvertRequest(file_path=first_file, main_selector="main")
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("conversion should be served from cache")
+
+        monkeypatch.setattr(converter, "_convert_to_markdown", fail)
+        second = converter.convert(
+            MarkdownConvertRequest(file_path=second_file, main_selector="main")
+        )
+
+        assert second.content == first.content
+        assert second.title == "Cached"
+        assert second.original_file == second_file
+
+        # オプションが異なる場合はキャッシュを使用しない
+        with pytest.raises(ConvertError):
+            converter.convert(
+                MarkdownConvertRequest(
+                    file_path=second_file, main_selector="main", heading_offset=1
+                )
+            )
+
+    def test_convert_cache_write_failure_removes_temp_file(self, tmp_path, monkeypatch):
+        """キャッシュの書き込みに失敗しても変換は成功し、一時ファイルが残らないことを確認"""
+        cache_dir = tmp_path / "cache"
+        converter = MarkdownifyConverter(cache_dir=cache_dir)
+        html_file = tmp_path / "page.html"
+        html_file.write_text(
+            "<html><body><main><h1>Heading</h1></main></body></html>", encoding="utf-8"
+        )
+
+        def fail_replace(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(
+            "site2.adapters.storage.json_result_cache.os.replace", fail_replace
+        )
+        result = converter.convert(
+            MarkdownConvertRequest(file_path=html_file, main_selector="main")
+        )
+
+        assert "# Heading" in result.content
+        assert not [path for path in cache_dir.rglob("*") if path.is_file()]
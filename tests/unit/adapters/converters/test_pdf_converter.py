@@ -6,6 +6,8 @@ import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+from bs4 import BeautifulSoup
+
 from src.site2.adapters.converters.pdf_converter import PlaywrightPDFConverter
 from src.site2.core.ports.build_contracts import PDFConverterProtocol
 from src.site2.core.domain.build_domain import (
@@ -164,7 +166,9 @@ class TestPlaywrightPDFConverter:
         # PDF結合モックの設定
         mock_writer_instance = Mock()
         mock_pdf_writer.return_value = mock_writer_instance
-        mock_writer_instance.write = Mock()
+        mock_writer_instance.write = Mock(
+            side_effect=lambda stream: stream.write(b"merged_pdf_content")
+        )
 
         mock_reader_instance = Mock()
         mock_reader_instance.pages = [Mock(), Mock()]  # 2ページ
@@ -190,30 +194,26 @@ class TestPlaywrightPDFConverter:
 
         with patch("builtins.open", side_effect=mock_open_side_effect):
             with patch.object(Path, "exists", return_value=True):
-                with patch("io.BytesIO") as mock_bytesio:
-                    mock_stream = Mock()
-                    mock_stream.read.return_value = b"merged_pdf_content"
-                    mock_bytesio.return_value = mock_stream
-
-                    requests = [
-                        PDFConvertRequest(
-                            file_path=Path("test1.html"),
-                            main_selector="main",
-                            options={},
-                        ),
-                        PDFConvertRequest(
-                            file_path=Path("test2.html"),
-                            main_selector="main",
-                            options={},
-                        ),
-                    ]
+                requests = [
+                    PDFConvertRequest(
+                        file_path=Path("test1.html"),
+                        main_selector="main",
+                        options={},
+                    ),
+                    PDFConvertRequest(
+                        file_path=Path("test2.html"),
+                        main_selector="main",
+                        options={},
+                    ),
+                ]
 
-                    result = self.converter.convert_multiple(requests, merge=True)
+                result = self.converter.convert_multiple(requests, merge=True)
 
-                    assert isinstance(result, ConvertResult)
-                    assert result.content == b"merged_pdf_content"
-                    assert result.format == OutputFormat.PDF
-                    assert "Doc 1 + Doc 2" in result.title
+                assert isinstance(result, ConvertResult)
+                assert result.content == b"merged_pdf_content"
+                assert result.format == OutputFormat.PDF
+                assert "Doc 1 + Doc 2" in result.title
+                assert mock_writer_instance.append.call_count == 2
 
     @patch("src.site2.adapters.converters.pdf_converter.sync_playwright")
     def test_convert_multiple_without_merge(self, mock_playwright):
@@ -243,7 +243,9 @@ class TestPlaywrightPDFConverter:
                     ),
                 ]
 
-                results = self.converter.convert_multiple(requests, merge=False)
+                results = self.converter.convert_multiple(
+                    requests, merge=False, max_workers=1
+                )
 
                 assert isinstance(results, list)
                 assert len(results) == 2
@@ -251,6 +253,134 @@ class TestPlaywrightPDFConverter:
                     assert isinstance(result, ConvertResult)
                     assert result.format == OutputFormat.PDF
 
+                # ブラウザは1度だけ起動される
+                mock_playwright_instance.chromium.launch.assert_called_once()
+                # 同じページを再利用し、ファイルごとにabout:blankで解放する
+                mock_browser.new_page.assert_called_once()
+                assert mock_page.set_content.call_count == 2
+                assert mock_page.goto.call_count == 2
+                mock_page.goto.assert_called_with("about:blank")
+                mock_page.close.assert_called_once()
+                mock_browser.close.assert_called_once()
+
+    @patch("src.site2.adapters.converters.pdf_converter.sync_playwright")
+    def test_convert_multiple_parallel_preserves_order(self, mock_playwright):
+        """並列変換の結果が要求と同じ順序で返されることを確認"""
+        mock_playwright_instance = Mock()
+        mock_playwright_instance.chromium.launch.side_effect = lambda **kwargs: Mock()
+        mock_playwright.return_value.__enter__.return_value = mock_playwright_instance
+
+        def fake_render(browser, html_content):
+            return html_content.encode("utf-8")
+
+        test_html_content = """
+        <html><head><title>Test Doc</title></head>
+        <body><main><h1>Test</h1><p>Content</p></main></body></html>
+        """
+
+        with patch("builtins.open", mock_open_with_content(test_html_content)):
+            with patch.object(Path, "exists", return_value=True):
+                with patch.object(
+                    self.converter, "_render_page_to_pdf", side_effect=fake_render
+                ):
+                    requests = [
+                        PDFConvertRequest(
+                            file_path=Path(f"test{i}.html"),
+                            main_selector="main",
+                            options={"heading_offset": i % 3},
+                        )
+                        for i in range(5)
+                    ]
+
+                    results = self.converter.convert_multiple(
+                        requests, merge=False, max_workers=2
+                    )
+
+        assert [result.original_file for result in results] == [
+            request.file_path for request in requests
+        ]
+        assert b"<h1>Test</h1>" in results[3].content
+        assert b"<h1>Test</h1>" not in results[1].content
+        assert mock_playwright_instance.chromium.launch.call_count == 2
+
+    @patch("src.site2.adapters.converters.pdf_converter.os.cpu_count", return_value=32)
+    def test_convert_all_caps_default_workers(self, mock_cpu_count):
+        """ワーカー数を指定しない場合、CPUコア数が多くてもブラウザ数を抑えることを確認"""
+        requests = [
+            PDFConvertRequest(file_path=Path(f"test{i}.html"), main_selector="main")
+            for i in range(10)
+        ]
+        batches = []
+
+        def convert_batch(batch):
+            batches.append(batch)
+            return [Mock() for _ in batch]
+
+        with patch.object(self.converter, "_convert_batch", side_effect=convert_batch):
+            results = self.converter._convert_all(requests, None)
+
+        assert len(batches) == 4
+        assert len(results) == len(requests)
+
+    @pytest.mark.parametrize("max_bytes", [1024, 0])
+    @patch("src.site2.adapters.converters.pdf_converter.PdfWriter")
+    @patch("src.site2.adapters.converters.pdf_converter.PdfReader")
+    def test_merge_pdfs_in_memory_and_on_disk(
+        self, mock_pdf_reader, mock_pdf_writer, max_bytes
+    ):
+        """結合結果をメモリ上でもディスク経由でも同じ内容で返すことを確認"""
+        mock_pdf_writer.return_value.write.side_effect = lambda stream: stream.write(
+            b"merged_pdf_content"
+        )
+
+        with patch(
+            "src.site2.adapters.converters.pdf_converter._MERGE_SPOOL_MAX_BYTES",
+            max_bytes,
+        ):
+            merged = self.converter._merge_pdfs(iter([b"pdf1", b"pdf2"]))
+
+        assert merged == b"merged_pdf_content"
+        assert mock_pdf_writer.return_value.append.call_count == 2
+
+    @patch("src.site2.adapters.converters.pdf_converter.PdfWriter")
+    def test_merge_pdfs_single_and_empty(self, mock_pdf_writer):
+        """1件の場合は結合せずに返し、0件の場合はエラーになることを確認"""
+        assert self.converter._merge_pdfs(iter([b"only_pdf"])) == b"only_pdf"
+        mock_pdf_writer.assert_not_called()
+
+        with pytest.raises(ConvertError, match="No PDFs to merge"):
+            self.converter._merge_pdfs(iter([]))
+
+    def test_release_contents(self):
+        """取り出した変換結果をリストから外すことを確認"""
+        results = [
+            ConvertResult(
+                original_file=Path(f"test{i}.html"),
+                content=f"pdf{i}".encode(),
+                format=OutputFormat.PDF,
+                title=f"Doc {i}",
+                extracted_text_length=0,
+            )
+            for i in range(2)
+        ]
+
+        contents = self.converter._release_contents(results)
+
+        assert next(contents) == b"pdf0"
+        assert results[0] is None and results[1] is not None
+        assert list(contents) == [b"pdf1"]
+        assert results == [None, None]
+
+    def test_adjust_heading_levels_shifts_each_heading_once(self):
+        """見出しレベルが1回だけ調整されることを確認"""
+        soup = BeautifulSoup(
+            "<main><h1>A</h1><h2>B</h2><h5>C</h5><h6>D</h6></main>", "html.parser"
+        )
+
+        self.converter._adjust_heading_levels(soup.main, 1)
+
+        assert [h.name for h in soup.main.find_all(True)] == ["h2", "h3", "h6", "h6"]
+
     def test_convert_with_custom_config(self):
         """カスタム設定でのPDF変換テスト"""
         custom_config = {
@@ -268,6 +398,34 @@ class TestPlaywrightPDFConverter:
         assert converter.config["format"] == "A3"
         assert converter.config["print_background"] is False
 
+    def test_pdf_options_prepared_once(self):
+        """PDF生成オプションが初期化時に変更できない形で作成されることを確認"""
+        converter = PlaywrightPDFConverter(
+            config={
+                "format": "A3",
+                "display_header_footer": True,
+                "footer_template": "<span class='pageNumber'></span>",
+            }
+        )
+
+        assert dict(converter._pdf_options) == {
+            "format": "A3",
+            "print_background": True,
+            "display_header_footer": True,
+            "prefer_css_page_size": True,
+            "landscape": False,
+            "header_template": "",
+            "footer_template": "<span class='pageNumber'></span>",
+        }
+        with pytest.raises(TypeError):
+            converter._pdf_options["format"] = "A4"
+
+        page = Mock()
+        converter._render_page_to_pdf(page, "<html></html>")
+
+        page.pdf.assert_called_once_with(**converter._pdf_options)
+        page.wait_for_load_state.assert_not_called()
+
     def test_convert_empty_content(self):
         """空のコンテンツのPDF変換テスト"""
         test_html_content = """
@@ -309,4 +467,4 @@ def mock_open_with_content(content: str):
     """指定されたコンテンツでファイルを開くモック"""
     from unittest.mock import mock_open
 
-    return mock_open(read_data=content)
+    return mock_open(read_data=content.encode("utf-8"))
@@ -0,0 +1,65 @@
+"""
+DetectorFactoryの単体テスト
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from site2.adapters.detectors.detector_factory import DetectorFactory
+from site2.adapters.detectors.heuristic_detector import HeuristicMainContentDetector
+
+
+class TestDetectorFactory:
+    """DetectorFactoryの単体テスト"""
+
+    def setup_method(self):
+        """テストセットアップ"""
+        self.mock_html_analyzer = Mock()
+
+    def test_create_returns_new_detector(self):
+        """createは呼び出しごとに検出器を作成することを確認"""
+        first = DetectorFactory.create("heuristic", self.mock_html_analyzer)
+        second = DetectorFactory.create("heuristic", self.mock_html_analyzer)
+
+        assert isinstance(first, HeuristicMainContentDetector)
+        assert first is not second
+
+    def test_create_unknown_method(self):
+        """不正な検出手法でValueErrorになることを確認"""
+        with pytest.raises(ValueError, match="Unknown detection method"):
+            DetectorFactory.create("unknown", self.mock_html_analyzer)
+
+    def test_get_or_create_reuses_detector(self):
+        """同じ引数の場合は作成済みの検出器を再利用することを確認"""
+        first = DetectorFactory.get_or_create(
+            "heuristic",
+            self.mock_html_analyzer,
+            {"min_text_density": 0.1, "min_paragraph_count": 3},
+        )
+        second = DetectorFactory.get_or_create(
+            "heuristic",
+            self.mock_html_analyzer,
+            {"min_paragraph_count": 3, "min_text_density": 0.1},
+        )
+        other = DetectorFactory.get_or_create(
+            "heuristic", self.mock_html_analyzer, {"min_text_density": 0.2}
+        )
+
+        assert first is second
+        assert first.min_text_density == 0.1
+        assert other is not first
+
+    def test_get_or_create_with_unhashable_options(self):
+        """ハッシュできないオプションの場合は毎回作成することを確認"""
+        options = {"selectors": ["main", "article"]}
+
+        first = DetectorFactory.get_or_create(
+            "heuristic", self.mock_html_analyzer, options
+        )
+        second = DetectorFactory.get_or_create(
+            "heuristic", self.mock_html_analyzer, options
+        )
+
+        assert first is not second
+        assert first.options == options
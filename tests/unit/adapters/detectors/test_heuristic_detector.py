@@ -2,10 +2,11 @@
 HeuristicMainContentDetectorの単体テスト
 """
 
-from unittest.mock import Mock
+import soupsieve
 from bs4 import BeautifulSoup
 
 from site2.adapters.detectors.heuristic_detector import HeuristicMainContentDetector
+from site2.adapters.parsers.beautifulsoup_parser import BeautifulSoupAnalyzer
 from site2.core.ports.detect_contracts import (
     MainContentDetectionResult,
 )
@@ -17,8 +18,8 @@ class TestHeuristicMainContentDetector:
 
     def setup_method(self):
         """テストセットアップ"""
-        self.mock_html_analyzer = Mock()
-        self.detector = HeuristicMainContentDetector(self.mock_html_analyzer)
+        self.html_analyzer = BeautifulSoupAnalyzer()
+        self.detector = HeuristicMainContentDetector(self.html_analyzer)
 
     def test_detect_main_content_semantic_selectors(self):
         """セマンティックセレクタによる検出テスト"""
@@ -137,6 +138,50 @@ class TestHeuristicMainContentDetector:
         assert "nav" not in selectors
         assert "footer" not in selectors
 
+    def test_detect_semantic_selectors_stops_at_strong_match(self, mocker):
+        """強い候補が見つかった時点でセマンティックセレクタの評価を打ち切ることを確認"""
+        paragraphs = "".join(f"<p>Paragraph {i} with text.</p>" for i in range(5))
+        html = f"<html><body><main><h1>T</h1>{paragraphs}</main></body></html>"
+        soup = BeautifulSoup(html, "html.parser")
+        select = mocker.spy(soupsieve.SoupSieve, "select")
+
+        candidates = self.detector._detect_semantic_selectors(soup)
+
+        assert [c.selector for c in candidates] == ["main"]
+        assert select.call_count == 1
+
+    def test_detect_main_content_strong_match_result(self):
+        """強い候補で打ち切った場合の候補と信頼度を固定する"""
+        paragraphs = "".join(f"<p>Paragraph {i} with some text.</p>" for i in range(5))
+        html = f"<html><body><main><h1>T</h1><article>{paragraphs}</article></main></body></html>"
+        soup = BeautifulSoup(html, "html.parser")
+
+        result = self.detector.detect_main_content(soup)
+
+        # <article>は評価されないため候補は<main>のみで、信頼度は1候補の式になる
+        assert [c.selector for c in result.candidates] == ["main"]
+        assert result.primary_selector == "main"
+        assert result.confidence == 0.8
+
+    def test_is_excluded(self):
+        """除外判定がタグ名・クラス名・IDの完全一致で行われることを確認"""
+        html = """
+        <aside>Aside</aside>
+        <div id="sidebar">Sidebar</div>
+        <div class="box ads">Ads</div>
+        <div class="nav">Nav</div>
+        <div class="shadow lead">Content</div>
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        aside, sidebar, ads, nav, content = soup.find_all(["aside", "div"])
+
+        assert self.detector._is_excluded(aside)
+        assert self.detector._is_excluded(sidebar)
+        assert self.detector._is_excluded(ads)
+        assert self.detector._is_excluded(nav)
+        # "ad" を部分文字列として含むだけのクラス名は除外しない
+        assert not self.detector._is_excluded(content)
+
     def test_detect_main_content_empty_html(self):
         """空のHTMLの場合のテスト"""
         html_content = "<html><body></body></html>"
@@ -192,6 +237,24 @@ class TestHeuristicMainContentDetector:
         assert 0.0 <= high_density <= 1.0
         assert 0.0 <= low_density <= 1.0
 
+    def test_calculate_text_density_is_memoized(self, mocker):
+        """同じ要素のテキスト密度は検出処理中に1回だけ計算されることを確認"""
+        html = """
+        <div id="content">
+            <p>First paragraph with enough text.</p>
+            <p>Second paragraph with enough text.</p>
+        </div>
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        density = mocker.spy(self.html_analyzer, "calculate_text_density")
+
+        self.detector.detect_main_content(soup)
+
+        # "#content" はセマンティックセレクタとコンテンツ特徴の両方で評価される
+        assert density.call_count == 1
+        assert self.detector._density_cache == {}
+        assert self.detector._count_cache == {}
+
     def test_build_selector(self):
         """セレクタ構築のテスト"""
         # ID付き要素
@@ -319,7 +382,7 @@ class TestHeuristicMainContentDetector:
             "min_text_density": 0.1,
             "min_paragraph_count": 3,
         }
-        detector = HeuristicMainContentDetector(self.mock_html_analyzer, options)
+        detector = HeuristicMainContentDetector(self.html_analyzer, options)
 
         html_content = """
         <html>
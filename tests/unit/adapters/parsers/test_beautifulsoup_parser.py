@@ -1,13 +1,18 @@
+import os
 import pytest
 from pathlib import Path
 from bs4 import BeautifulSoup
 
 from site2.adapters.parsers.beautifulsoup_parser import (
+    CONTENT_STRAINER,
+    NAVIGATION_STRAINER,
     BeautifulSoupParser,
     BeautifulSoupAnalyzer,
     LLMPreprocessor,
+    _measure,
 )
 from site2.core.ports.parser_contracts import (
+    ParseError,
     ParseRequest,
     TextExtractionRequest,
     SelectorSearchRequest,
@@ -44,6 +49,20 @@ def complex_html_path():
 # --- BeautifulSoupParser Tests ---
 
 
+def test_parser_defaults_to_lxml(parser: BeautifulSoupParser):
+    """Test that lxml is used by default when it is installed."""
+    assert parser.parser == "lxml"
+    assert parser.parse_string("<p>Hello</p>").builder.NAME == "lxml"
+
+
+def test_parse_string_falls_back_to_html_parser():
+    """Test fallback to html.parser when the requested parser is unavailable."""
+    soup = BeautifulSoupParser(parser="no-such-parser").parse_string("<p>Hello</p>")
+
+    assert soup.builder.NAME == "html.parser"
+    assert soup.p.get_text() == "Hello"
+
+
 def test_parse_utf8_file(parser: BeautifulSoupParser, utf8_html_path: Path):
     """Test parsing a standard UTF-8 HTML file."""
     request = ParseRequest(file_path=utf8_html_path)
@@ -104,6 +123,23 @@ def test_analyze_structure(
     assert analysis.link_count == 3
 
 
+def test_analyze_structure_matches_find_all(
+    analyzer: BeautifulSoupAnalyzer,
+    parser: BeautifulSoupParser,
+    complex_html_path: Path,
+):
+    """Test that the single-pass counts agree with per-tag searches."""
+    soup = parser.parse(ParseRequest(file_path=complex_html_path)).soup
+    analysis = analyzer.analyze_structure(soup)
+
+    assert analysis.has_footer is bool(soup.find("footer"))
+    assert analysis.paragraph_count == len(soup.find_all("p"))
+    assert analysis.list_count == len(soup.find_all(["ul", "ol"]))
+    assert analysis.heading_count == {
+        f"h{level}": len(soup.find_all(f"h{level}")) for level in range(1, 7)
+    }
+
+
 def test_extract_metadata(
     analyzer: BeautifulSoupAnalyzer, parser: BeautifulSoupParser, utf8_html_path: Path
 ):
@@ -117,6 +153,60 @@ def test_extract_metadata(
     assert metadata.language == "en"
 
 
+def test_parse_with_metadata_strainer(
+    analyzer: BeautifulSoupAnalyzer, parser: BeautifulSoupParser, utf8_html_path: Path
+):
+    """Test that the metadata preset keeps only <title> and <meta> tags."""
+    soup = parser.parse(ParseRequest(file_path=utf8_html_path, strain="metadata")).soup
+    metadata = analyzer.extract_metadata(soup)
+
+    assert {tag.name for tag in soup.find_all(True)} <= {"title", "meta"}
+    assert metadata.title == "UTF-8 Test Page"
+    assert metadata.description == "A test page for site2"
+
+
+def test_parse_string_with_content_strainer(parser: BeautifulSoupParser):
+    """Test that the content strainer skips script and style subtrees."""
+    html = (
+        "<html><head><title>T</title><style>p {}</style></head>"
+        "<body><script>var x;</script><main><p>Body</p></main></body></html>"
+    )
+    soup = parser.parse_string(html, parse_only=CONTENT_STRAINER)
+
+    assert soup.find("main").get_text() == "Body"
+    assert soup.find("title").string == "T"
+    assert soup.find("script") is None
+    assert soup.find("style") is None
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        "<header><div><nav><a href='/a'>A</a></nav></div></header>",
+        "<div><p>Text</p></div><ul class='menu nav'><li><a href='/b'>B</a></li></ul>",
+        "<main><div class='side navigation'><a href='/c'>C</a></div></main>",
+        "<body><section id='navigation'><a href='/d'>D</a></section></body>",
+    ],
+)
+def test_parse_string_with_navigation_strainer(parser: BeautifulSoupParser, html):
+    """Test that the navigation strainer finds the same elements as a full parse."""
+    full = parser.parse_string(html)
+    strained = parser.parse_string(html, parse_only=NAVIGATION_STRAINER)
+
+    for selector in ["nav", "ul.nav", ".navigation", "#navigation"]:
+        expected = full.select_one(selector)
+        actual = strained.select_one(selector)
+        assert str(actual) == str(expected)
+
+
+def test_parse_with_unknown_strainer_preset(
+    parser: BeautifulSoupParser, utf8_html_path: Path
+):
+    """Test that an unknown strainer preset raises ParseError."""
+    with pytest.raises(ParseError, match="Unknown strainer preset"):
+        parser.parse(ParseRequest(file_path=utf8_html_path, strain="unknown"))
+
+
 def test_calculate_text_density(
     analyzer: BeautifulSoupAnalyzer, parser: BeautifulSoupParser, utf8_html_path: Path
 ):
@@ -148,3 +238,136 @@ def test_preprocess_for_llm(
     # Check for simplified attributes
     assert 'id="content"' in processed_html
     assert "style=" not in processed_html
+
+
+def test_preprocess_for_llm_keeps_original_and_drops_comments(
+    preprocessor: LLMPreprocessor,
+):
+    """Test that preprocessing works on a copy and removes HTML comments."""
+    soup = BeautifulSoup(
+        "<body><!-- note --><script>x()</script><p style='a'>Text</p></body>",
+        "html.parser",
+    )
+    original = str(soup)
+
+    processed_html = preprocessor.preprocess_for_llm(soup)
+
+    assert "note" not in processed_html
+    assert "<script>" not in processed_html
+    assert "\n\n" not in processed_html
+    assert str(soup) == original
+
+
+def test_extract_metadata_og_tags(analyzer: BeautifulSoupAnalyzer):
+    """Test that name and og: property meta tags are collected together."""
+    soup = BeautifulSoup(
+        '<head><meta name="Description" content="Desc">'
+        '<meta property="og:title" content="OG Title">'
+        '<meta property="fb:app_id" content="1"></head>',
+        "html.parser",
+    )
+    metadata = analyzer.extract_metadata(soup)
+
+    assert metadata.meta_tags == {"description": "Desc"}
+    assert metadata.og_tags == {"og:title": "OG Title"}
+
+
+def test_count_children(analyzer: BeautifulSoupAnalyzer):
+    """Test that requested descendant tags are counted in one call."""
+    soup = BeautifulSoup(
+        "<div><h2>T</h2><p>a</p><section><p>b</p><h3>U</h3></section></div>",
+        "html.parser",
+    )
+
+    counts = analyzer.count_children(soup.div, ["p", "h2", "h3", "h4"])
+
+    assert counts == {"p": 2, "h2": 1, "h3": 1, "h4": 0}
+
+
+def test_parse_reuses_file_contents_until_modified(tmp_path: Path, mocker):
+    """Test that unchanged files are not read or detected again."""
+    html_path = tmp_path / "page.html"
+    html_path.write_text("<p>first</p>", encoding="utf-8")
+    parser = BeautifulSoupParser()
+    detect = mocker.spy(parser.encoding_detector, "detect_encoding_from_bytes")
+
+    first = parser.parse(ParseRequest(file_path=html_path))
+    second = parser.parse(ParseRequest(file_path=html_path))
+
+    assert detect.call_count == 1
+    assert second.soup is not first.soup
+    assert second.soup.p.string == "first"
+
+    html_path.write_text("<p>second</p>", encoding="utf-8")
+    os.utime(html_path, ns=(0, 10**9))
+    third = parser.parse(ParseRequest(file_path=html_path))
+
+    assert detect.call_count == 2
+    assert third.soup.p.string == "second"
+
+
+@pytest.mark.parametrize("markup_parser", ["html.parser", "lxml"])
+def test_html_length_matches_serialised_markup(
+    complex_html_path: Path, markup_parser: str
+):
+    """Test that the markup length is computed without serialising the tree."""
+    html = complex_html_path.read_text(encoding="utf-8")
+    html += "<div class='a b' hidden><br><!-- note --><img src='x.png'></div>"
+    soup = BeautifulSoup(html, markup_parser)
+
+    for element in soup.find_all(["html", "main", "div"]):
+        assert _measure(element)[1] == len(str(element))
+
+
+def test_parse_decodes_bytes_read_once(tmp_path: Path, mocker):
+    """Test that the file is read once and decoded with the detected encoding."""
+    html_path = tmp_path / "sjis.html"
+    html_path.write_bytes(
+        '<meta charset="shift_jis">\r\n<p>日本語</p>\r\n'.encode("shift_jis")
+    )
+    parser = BeautifulSoupParser()
+    detect_file = mocker.spy(parser.encoding_detector, "detect_encoding")
+
+    result = parser.parse(ParseRequest(file_path=html_path))
+
+    detect_file.assert_not_called()
+    assert result.encoding == "shift_jis"
+    assert result.soup.p.string == "日本語"
+    assert "\r" not in str(result.soup)
+
+
+@pytest.mark.parametrize("markup_parser", ["html.parser", "lxml"])
+def test_measure_text_length_matches_get_text(
+    complex_html_path: Path, markup_parser: str
+):
+    """Test that the text length matches get_text(strip=True)."""
+    html = complex_html_path.read_text(encoding="utf-8")
+    html += "<div> a <script>v()</script><style>p {}</style><!-- c --> b </div>"
+    soup = BeautifulSoup(html, markup_parser)
+
+    for element in soup.find_all(True):
+        assert _measure(element)[0] == len(element.get_text(strip=True))
+
+
+def test_extract_text_joins_lines_with_newlines(parser: BeautifulSoupParser):
+    """Test that text nodes are joined with newlines and blank lines are dropped."""
+    soup = BeautifulSoup(
+        "<div><h1> Title </h1><p>first line\n   second line</p><p>  </p></div>",
+        "html.parser",
+    )
+    result = parser.extract_text(TextExtractionRequest(element=soup.div))
+
+    assert result.extracted_text == "Title\nfirst line\nsecond line"
+    assert result.text_length == len(result.extracted_text)
+
+
+def test_preprocess_for_llm_truncates_while_serialising(preprocessor: LLMPreprocessor):
+    """Test that long documents are cut at max_length with a truncation marker."""
+    paragraphs = "".join(f"<p>Paragraph {i}</p>" for i in range(1000))
+    soup = BeautifulSoup(f"<body><main>{paragraphs}</main></body>", "html.parser")
+
+    processed_html = preprocessor.preprocess_for_llm(soup, max_length=200)
+
+    assert processed_html.endswith("\n<!-- truncated -->")
+    assert len(processed_html) == 200 + len("\n<!-- truncated -->")
+    assert processed_html.startswith('<body class=""><main class="">')
@@ -2,6 +2,7 @@ import pytest
 from pathlib import Path
 import logging
 from site2.adapters.parsers.chardet_detector import ChardetDetector
+from site2.adapters.parsers.parser_factory import ParserFactory
 
 
 @pytest.fixture
@@ -70,5 +71,115 @@ def test_low_confidence_detection(detector: ChardetDetector, caplog, mocker):
     )
 
     with caplog.at_level(logging.WARNING):
-        detector.detect_encoding_from_bytes(b"some bytes")
+        detector.detect_encoding_from_bytes(b"caf\xe9 bytes")
     assert "Low confidence encoding detection" in caplog.text
+
+
+def test_create_auto_detector_prefers_fast_backend(mocker):
+    """Test that "auto" picks the first available detector in preference order."""
+    fast_detector = type("FastDetector", (ChardetDetector,), {})
+    mocker.patch.dict(
+        ParserFactory._detectors,
+        {"chardet": ChardetDetector, "charset_normalizer": fast_detector},
+        clear=True,
+    )
+
+    assert isinstance(ParserFactory.create_encoding_detector("auto"), fast_detector)
+
+
+def test_create_auto_detector_falls_back_to_chardet(mocker):
+    """Test that "auto" falls back to chardet when no C backend is installed."""
+    mocker.patch.dict(
+        ParserFactory._detectors, {"chardet": ChardetDetector}, clear=True
+    )
+
+    detector = ParserFactory.create_encoding_detector("auto")
+
+    assert type(detector) is ChardetDetector
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b"\xef\xbb\xbf<html></html>", "utf-8-sig"),
+        ("<html></html>".encode("utf-16"), "utf-16"),
+        (b'<html><head><meta charset="Shift_JIS"></head></html>', "shift_jis"),
+        (
+            b'<meta http-equiv="Content-Type" content="text/html; charset=ISO-8859-1">',
+            "latin-1",
+        ),
+    ],
+)
+def test_detect_encoding_from_bom_or_charset(
+    detector: ChardetDetector, mocker, data: bytes, expected: str
+):
+    """Test that a BOM or charset declaration skips the chardet call."""
+    detect = mocker.patch("chardet.detect")
+
+    assert detector.detect_encoding_from_bytes(data) == expected
+    detect.assert_not_called()
+
+
+def test_detect_encoding_ignores_unknown_charset(detector: ChardetDetector, mocker):
+    """Test that an unknown declared charset falls through to chardet."""
+    detect = mocker.patch(
+        "chardet.detect", return_value={"encoding": "utf-8", "confidence": 0.99}
+    )
+
+    encoding = detector.detect_encoding_from_bytes(
+        b'<meta charset="bogus-enc">caf\xe9 '
+    )
+
+    assert encoding == "utf-8"
+    detect.assert_called_once()
+
+
+def test_get_or_create_reuses_instance():
+    """Test that get_or_create returns the same instance for the same arguments."""
+    first = ParserFactory.get_or_create("encoding_detector", "chardet")
+    second = ParserFactory.get_or_create("encoding_detector", "chardet")
+
+    assert first is second
+    assert ParserFactory.create_encoding_detector("chardet") is not first
+
+
+def test_get_or_create_with_unhashable_kwarg():
+    """Test that get_or_create creates an uncached instance for unhashable kwargs."""
+
+    class UnhashableDetector(ChardetDetector):
+        __hash__ = None
+
+    encoding_detector = UnhashableDetector()
+
+    first = ParserFactory.get_or_create(
+        "parser", "beautifulsoup", encoding_detector=encoding_detector
+    )
+    second = ParserFactory.get_or_create(
+        "parser", "beautifulsoup", encoding_detector=encoding_detector
+    )
+
+    assert first is not second
+    assert first.encoding_detector is encoding_detector
+
+
+def test_detect_encoding_valid_utf8_skips_chardet(detector: ChardetDetector, mocker):
+    """Test that undeclared non-ASCII UTF-8 data is detected without chardet."""
+    detect = mocker.patch("chardet.detect")
+    # The last character is cut off, as when only the head of a file is read
+    data = "<p>日本語のテキスト</p>".encode("utf-8")[:-6]
+
+    encoding = detector.detect_encoding_from_bytes(data)
+
+    assert encoding == "utf-8"
+    detect.assert_not_called()
+
+
+def test_detect_encoding_prefers_valid_utf8_over_declaration(
+    detector: ChardetDetector, mocker
+):
+    """Test that UTF-8 data mislabelled with another charset is detected as UTF-8."""
+    detect = mocker.patch("chardet.detect")
+    data = '<meta charset="Shift_JIS"><p>日本語</p>'.encode("utf-8")
+
+    assert detector.detect_encoding_from_bytes(data) == "utf-8"
+    detect.assert_not_called()
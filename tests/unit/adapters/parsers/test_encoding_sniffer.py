@@ -0,0 +1,37 @@
+import pytest
+
+from site2.adapters.parsers.encoding_sniffer import sniff_encoding
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b"\xef\xbb\xbf<html></html>", "utf-8-sig"),
+        ("<html></html>".encode("utf-16"), "utf-16"),
+        ("<p>日本語</p>".encode("utf-8"), "utf-8"),
+        ('<meta charset="Shift_JIS"><p>日本語</p>'.encode("utf-8"), "utf-8"),
+        ('<meta charset="Shift_JIS"><p>日本語</p>'.encode("shift_jis"), "Shift_JIS"),
+        (b'<meta charset="iso-8859-1"><p>plain</p>', "iso-8859-1"),
+        (b"<p>plain</p>", "utf-8"),
+        ("<p>日本語</p>".encode("shift_jis"), None),
+        (b'<meta charset="bogus-enc"><p>caf\xe9</p>', None),
+    ],
+)
+def test_sniff_encoding(data: bytes, expected):
+    """Test the precedence of BOM, UTF-8, charset declaration and ASCII."""
+    assert sniff_encoding(data) == expected
+
+
+def test_sniff_encoding_ignores_declaration_that_does_not_decode():
+    """Test that a declared charset is ignored when the data does not decode with it."""
+    data = '<meta charset="utf-16"><p>日本語</p>'.encode("shift_jis")
+
+    assert sniff_encoding(data) is None
+
+
+def test_sniff_encoding_partial_allows_cut_off_character():
+    """Test that a character cut off at the end is allowed only for partial data."""
+    data = "<p>日本語</p>".encode("utf-8")[:-6]
+
+    assert sniff_encoding(data, partial=True) == "utf-8"
+    assert sniff_encoding(data) is None
@@ -22,6 +22,9 @@ class TestSettings:
         assert settings.max_depth == 10
         assert settings.user_agent == "site2/1.0"
         assert settings.crawl_delay == 1.0
+        assert settings.crawler_method == "wget"
+        assert settings.parser_backend == "lxml"
+        assert settings.detect_workers >= 1
         assert settings.log_level == "INFO"
         assert settings.debug is False
         assert settings.test_mode is False
@@ -53,6 +56,7 @@ class TestSettings:
                 "SITE2_LOG_LEVEL": "DEBUG",
                 "SITE2_DEBUG": "true",
                 "SITE2_WGET_TIMEOUT": "60",
+                "SITE2_CRAWLER_METHOD": "aiohttp",
             },
         ):
             settings = Settings()
@@ -60,6 +64,7 @@ class TestSettings:
             assert settings.log_level == "DEBUG"
             assert settings.debug is True
             assert settings.wget_timeout == 60
+            assert settings.crawler_method == "aiohttp"
 
     def test_is_development_property(self):
         """is_development プロパティのテスト"""
@@ -108,6 +113,18 @@ class TestSettings:
         expected_extensions = ["extra", "codehilite", "toc"]
         assert settings.markdown_extensions == expected_extensions
 
+    def test_detect_cache_dir(self):
+        """検出結果のキャッシュが有効な場合のみディレクトリを返すことを確認"""
+        cache_dir = Path("/tmp/site2_test_cache")
+
+        disabled = Settings(cache_dir=cache_dir, test_mode=True)
+        enabled = Settings(
+            cache_dir=cache_dir, test_mode=True, detect_cache_enabled=True
+        )
+
+        assert disabled.get_detect_cache_dir() is None
+        assert enabled.get_detect_cache_dir() == cache_dir / "detect"
+
     def test_pdf_options_default(self):
         """PDF オプションのデフォルト値テスト"""
         settings = Settings()
@@ -0,0 +1,51 @@
+"""
+site2 build機能の契約のテスト
+"""
+
+from pathlib import Path
+
+from site2.core.domain.build_domain import (
+    DocumentMetadata,
+    ExtractedContent,
+    OutputFormat,
+)
+from site2.core.ports.build_contracts import BuildResult
+
+
+def _build_result(content, format: OutputFormat) -> BuildResult:
+    return BuildResult(
+        content=content,
+        format=format,
+        page_count=1,
+        extracted_files=[
+            ExtractedContent(
+                file_path=Path("index.html"),
+                title="T",
+                metadata=DocumentMetadata(title="T"),
+            )
+        ],
+    )
+
+
+class TestBuildResult:
+    """BuildResultのテスト"""
+
+    def test_iter_chunks_markdown(self):
+        """Markdownをチャンクに分割してUTF-8で返すことを確認"""
+        content = "# 見出し\n\n本文" * 10
+        result = _build_result(content, OutputFormat.MARKDOWN)
+
+        chunks = list(result.iter_chunks(chunk_size=7))
+
+        assert len(chunks) > 1
+        assert b"".join(chunks) == content.encode("utf-8")
+
+    def test_iter_chunks_pdf(self):
+        """PDFのバイト列をチャンクに分割して返すことを確認"""
+        content = b"%PDF-1.4\n" + bytes(range(256)) * 4
+        result = _build_result(content, OutputFormat.PDF)
+
+        chunks = list(result.iter_chunks(chunk_size=100))
+
+        assert len(chunks) == 11
+        assert b"".join(chunks) == content
@@ -4,6 +4,9 @@ DIコンテナのテスト
 
 import tempfile
 
+from dependency_injector import providers
+
+from site2.adapters.crawlers.wget_crawler import WgetCrawler
 from site2.core.containers import Container, TestContainer
 from site2.config.settings import Settings
 
@@ -114,6 +117,51 @@ class TestContainerTestClass:
         assert settings.user_agent == "site2/1.0"  # デフォルト値
         assert settings.crawl_delay == 1.0  # デフォルト値
 
+    def test_html_parser_uses_parser_backend(self):
+        """html_parserに設定のパーサーバックエンドが渡されることを確認"""
+        container = Container()
+        container.settings.override(
+            providers.Object(Settings(test_mode=True, parser_backend="html.parser"))
+        )
+
+        parser = container.html_parser()
+
+        assert parser.parser == "html.parser"
+
+    def test_web_crawler_uses_crawler_method(self):
+        """web_crawlerに設定のクローラーが使用されることを確認"""
+        container = Container()
+        container.settings.override(
+            providers.Object(Settings(test_mode=True, crawler_method="wget"))
+        )
+
+        web_crawler = container.web_crawler()
+
+        assert isinstance(web_crawler, WgetCrawler)
+
+    def test_stateless_adapters_are_shared(self):
+        """状態を持たないアダプターが呼び出し間で共有されることを確認"""
+        container = Container()
+        container.settings.override(providers.Object(Settings(test_mode=True)))
+
+        assert container.web_crawler() is container.web_crawler()
+        assert container.html_parser() is container.html_parser()
+        assert container.html_analyzer() is container.html_analyzer()
+        assert (
+            container.website_cache_repository() is container.website_cache_repository()
+        )
+
+    def test_detect_service_uses_detect_workers(self):
+        """detect_serviceに設定のワーカー数が渡されることを確認"""
+        container = Container()
+        container.settings.override(
+            providers.Object(Settings(test_mode=True, detect_workers=3))
+        )
+
+        detect_service = container.detect_service()
+
+        assert detect_service.max_workers == 3
+
     def test_container_reset(self):
         """コンテナのリセットテスト"""
         container = Container()
@@ -9,6 +9,8 @@ from bs4 import BeautifulSoup
 import tempfile
 import os
 
+from site2.adapters.parsers.parser_factory import ParserFactory
+from site2.adapters.storage.json_result_cache import JsonResultCache
 from site2.core.use_cases.detect_service import DetectService
 from site2.core.ports.detect_contracts import (
     DetectMainRequest,
@@ -111,6 +113,68 @@ class TestDetectService:
             # テストファイルを削除
             os.unlink(test_file)
 
+    def test_detect_main_uses_cache(self, tmp_path):
+        """同じ内容のHTMLではキャッシュした検出結果を再利用することを確認"""
+        html = "<html><main>content</main></html>"
+        first_file = tmp_path / "first.html"
+        second_file = tmp_path / "second.html"
+        first_file.write_text(html)
+        second_file.write_text(html)
+
+        self.mock_html_parser.parse.return_value = ParseResult(
+            file_path=first_file,
+            soup=BeautifulSoup(html, "html.parser"),
+            encoding="utf-8",
+            parse_time_seconds=0.1,
+            warnings=[],
+        )
+        self.mock_main_content_detector.detect_main_content.return_value = (
+            MainContentDetectionResult(
+                candidates=[
+                    SelectorCandidate(
+                        selector="main",
+                        score=0.9,
+                        reasoning="セマンティックセレクタ 'main'",
+                        element_count=1,
+                    )
+                ],
+                confidence=0.9,
+                primary_selector="main",
+            )
+        )
+        service = DetectService(
+            html_parser=self.mock_html_parser,
+            html_analyzer=self.mock_html_analyzer,
+            main_content_detector=self.mock_main_content_detector,
+            result_cache=JsonResultCache(tmp_path / "cache", "detection"),
+        )
+
+        first = service.detect_main(DetectMainRequest(file_path=first_file))
+        second = service.detect_main(DetectMainRequest(file_path=second_file))
+
+        assert self.mock_html_parser.parse.call_count == 1
+        assert second.file_path == second_file
+        assert second.primary_selector == first.primary_selector == "main"
+        assert second.candidates == first.candidates
+
+    def test_cache_key_depends_on_parser_backend(self, tmp_path):
+        """パーサーのバックエンドが異なる場合は別のキャッシュキーになることを確認"""
+        html_file = tmp_path / "page.html"
+        html_file.write_text("<html><main>content</main></html>")
+
+        cache_keys = []
+        for backend in ("lxml", "html.parser"):
+            self.mock_html_parser.parser = backend
+            service = DetectService(
+                html_parser=self.mock_html_parser,
+                html_analyzer=self.mock_html_analyzer,
+                main_content_detector=self.mock_main_content_detector,
+                result_cache=JsonResultCache(tmp_path / "cache", "detection"),
+            )
+            cache_keys.append(service._cache_key(html_file))
+
+        assert cache_keys[0] != cache_keys[1]
+
     def test_detect_main_parser_error(self):
         """パーサーエラーのテスト"""
         # テスト用のHTMLファイルを作成
@@ -219,6 +283,8 @@ class TestDetectService:
             assert len(result.selectors) == 1
             assert result.selectors[0] == "nav"
             assert len(result.nav_links) == 3
+            parse_request = self.mock_html_parser.parse.call_args[0][0]
+            assert parse_request.strain == "navigation"
 
             # リンクの検証
             links = result.nav_links
@@ -408,3 +474,32 @@ class TestDetectService:
             # エラーが発生してもファイル名をタイトルとして使用
             assert len(result.ordered_files) == 1
             assert result.ordered_files[0].title == "error"
+
+    def test_detect_order_with_process_pool(self, tmp_path):
+        """プロセスプールで解析しても逐次処理と同じ結果になることを確認"""
+        for i in range(40):
+            (tmp_path / f"page{i:02d}.html").write_text(
+                f"<html><head><title>Page {i}</title></head><body></body></html>"
+            )
+        (tmp_path / "untitled.html").write_text("<html><body></body></html>")
+
+        html_parser = ParserFactory.create_parser("beautifulsoup")
+        html_analyzer = ParserFactory.create_analyzer("beautifulsoup")
+        request = DetectOrderRequest(
+            cache_directory=tmp_path,
+            navigation=Navigation(
+                selector="nav",
+                structure=NavigationStructure(root_selector="nav", links=[]),
+            ),
+        )
+
+        sequential = DetectService(
+            html_parser, html_analyzer, self.mock_main_content_detector
+        ).detect_order(request)
+        parallel = DetectService(
+            html_parser, html_analyzer, self.mock_main_content_detector, max_workers=2
+        ).detect_order(request)
+
+        assert parallel.ordered_files == sequential.ordered_files
+        assert parallel.ordered_files[0].title == "Page 0"
+        assert parallel.ordered_files[-1].title == "untitled"
@@ -2,6 +2,8 @@
 FetchServiceの単体テスト
 """
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 from pathlib import Path
@@ -179,6 +181,25 @@ class TestFetchService:
         assert custom_dir in result.cache_directory
         assert result.cache_directory == expected_cache_dir
 
+    def test_save_cache_metadata_writes_root_url_file(self, tmp_path):
+        """cache.jsonと一緒にroot_url.txtを保存すること"""
+        # Arrange
+        cache = WebsiteCache(
+            root_url=WebsiteURL(value="https://example.com/docs"),
+            cache_directory=tmp_path,
+            pages=[],
+            created_at=datetime.now(),
+        )
+
+        # Act
+        self.service._save_cache_metadata(cache)
+
+        # Assert
+        assert (tmp_path / "cache.json").exists()
+        assert (tmp_path / "root_url.txt").read_text(encoding="utf-8") == str(
+            cache.root_url.value
+        )
+
     def test_fetch_network_error(self):
         """ネットワークエラーが適切に処理されること"""
         # Arrange
@@ -251,6 +272,7 @@ class TestFetchService:
             created_at=datetime.now(),
         )
 
+        self.mock_repository.list_summaries.return_value = None
         self.mock_repository.find_all.return_value = [cache1, cache2]
 
         # Act
@@ -265,6 +287,60 @@ class TestFetchService:
         assert result.caches[1]["page_count"] == 1
         assert result.caches[1]["total_size"] == 2048
 
+    def test_list_caches_from_index(self):
+        """集約インデックスが最新であればキャッシュを読み込まないこと"""
+        # Arrange
+        summaries = [
+            {
+                "id": "abc12345",
+                "url": "https://example.com/",
+                "page_count": 3,
+                "total_size": 4096,
+                "last_updated": "2024-01-01T00:00:00",
+            }
+        ]
+        self.mock_repository.list_summaries.return_value = summaries
+
+        # Act
+        result = self.service.list_caches()
+
+        # Assert
+        assert result.caches == summaries
+        self.mock_repository.find_all.assert_not_called()
+
+    def test_update_cache_index_replaces_row(self, tmp_path):
+        """キャッシュ保存時に集約インデックスの行を追加・更新すること"""
+
+        # Arrange
+        def make_cache(url, name, size):
+            cache_directory = tmp_path / name
+            return WebsiteCache(
+                root_url=WebsiteURL(value=url),
+                cache_directory=cache_directory,
+                pages=[
+                    CachedPage(
+                        page_url=WebsiteURL(value=url),
+                        local_path=cache_directory / "index.html",
+                        content_type="text/html",
+                        size_bytes=size,
+                        fetched_at=datetime.now(),
+                    )
+                ],
+                created_at=datetime.now(),
+            )
+
+        # Act
+        self.service._update_cache_index(make_cache("https://a.com/", "a.com_abc", 1))
+        self.service._update_cache_index(make_cache("https://b.com/", "b.com_def", 2))
+        self.service._update_cache_index(make_cache("https://a.com/", "a.com_abc", 3))
+
+        # Assert
+        index = json.loads((tmp_path / "index.json").read_text(encoding="utf-8"))
+        rows = {row["directory"]: row for row in index["caches"]}
+        assert set(rows) == {"a.com_abc", "b.com_def"}
+        assert rows["a.com_abc"]["total_size"] == 3
+        assert rows["b.com_def"]["url"] == "https://b.com/"
+
     def test_fetch_with_depth_parameter(self):
         """クロール深度が正しく渡されること"""
         # Arrange
@@ -5,6 +5,7 @@ URLユーティリティのテスト
 from site2.core.utils.url_utils import (
     resolve_relative_url,
     url_to_filename,
+    url_to_slug,
     is_same_domain,
     normalize_url,
     extract_domain,
@@ -258,6 +259,24 @@ class TestGetUrlExtension:
         assert ext == ".jpg"
 
 
+class TestUrlToSlug:
+    """url_to_slug のテスト"""
+
+    def test_host_and_path(self):
+        """ホスト名とパスがスラッグに変換されるテスト"""
+        result = url_to_slug("https://pytest-bdd.readthedocs.io/en/stable/")
+        assert result == "pytest-bdd.readthedocs.io_en_stable"
+
+    def test_special_characters(self):
+        """特殊文字が置き換えられるテスト"""
+        result = url_to_slug("http://localhost:8000/a%20b/c=d")
+        assert result == "localhost_8000_a_20b_c_d"
+
+    def test_empty_url(self):
+        """ホスト名とパスが空の場合のテスト"""
+        assert url_to_slug("") == "root"
+
+
 class TestBuildCacheKey:
     """build_cache_key のテスト"""
 